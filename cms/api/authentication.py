@@ -0,0 +1,148 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, \
+    InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, \
+    TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from api.models import User
+from api.routers import use_primary
+from api.services.enrollment import EnrollmentService
+
+
+USER_CLAIMS = ('role', 'email', 'first_name', 'last_name')
+ACCESS_VERSION_CLAIM = 'access_ver'
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for field in USER_CLAIMS:
+            token[field] = getattr(user, field)
+        token[ACCESS_VERSION_CLAIM] = EnrollmentService.access_version(user.pk)
+
+        return token
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        access = AccessToken(data['access'], verify=False)
+        user_id = User._meta.pk.to_python(access[api_settings.USER_ID_CLAIM])
+        claims = User.objects.filter(
+            pk=user_id,
+            is_active=True
+        ).values(*USER_CLAIMS).first()
+
+        if claims is None:
+            raise InvalidToken('User is inactive or does not exist')
+
+        for field, value in claims.items():
+            access[field] = value
+        access[ACCESS_VERSION_CLAIM] = EnrollmentService.access_version(user_id)
+        data['access'] = str(access)
+
+        return data
+
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        try:
+            return super().get_user(validated_token)
+        except AuthenticationFailed as e:
+            if e.get_codes() != 'user_not_found':
+                raise
+
+        with use_primary():
+            return super().get_user(validated_token)
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                'Token contained no recognizable user identification'
+            ) from e
+
+        users = self.user_model.objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        )
+        user = await users.afirst()
+
+        if user is None:
+            with use_primary():
+                user = await users.afirst()
+
+        if user is None:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(
+                'User is inactive', code='user_inactive'
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                "The user's password has been changed.",
+                code='password_changed'
+            )
+
+        return user
+
+
+class ClaimsJWTAuthentication(AsyncJWTAuthentication):
+    @staticmethod
+    def claims(validated_token):
+        try:
+            return (
+                User._meta.pk.to_python(
+                    validated_token[api_settings.USER_ID_CLAIM]
+                ),
+                {field: validated_token[field] for field in USER_CLAIMS},
+                validated_token[ACCESS_VERSION_CLAIM],
+            )
+        except KeyError as e:
+            raise InvalidToken('Token does not carry access claims') from e
+
+    def get_user(self, validated_token):
+        user_id, claims, version = self.claims(validated_token)
+
+        if version != EnrollmentService.access_version(user_id):
+            raise InvalidToken('Token access claims are stale')
+
+        return self.token_user(user_id, claims)
+
+    async def aget_user(self, validated_token):
+        user_id, claims, version = self.claims(validated_token)
+
+        if version != await EnrollmentService.aaccess_version(user_id):
+            raise InvalidToken('Token access claims are stale')
+
+        return self.token_user(user_id, claims)
+
+    @staticmethod
+    def token_user(user_id, claims):
+        user = User(id=user_id, is_active=True, **claims)
+        user._state.adding = False
+        user._state.db = User.objects.db
+
+        return user
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from api.views.metrics import LOOPBACK_IPS
+
+
+@register(deploy=True)
+def metrics_access_check(app_configs, **kwargs):
+    allowed_ips = set(settings.METRICS_ALLOWED_IPS) - LOOPBACK_IPS
+
+    if not settings.METRICS_ENABLED or settings.METRICS_TOKEN or allowed_ips:
+        return []
+
+    return [Warning(
+        '/metrics is enabled but nobody can scrape it.',
+        hint='Set METRICS_TOKEN, or list the scraper in METRICS_ALLOWED_IPS '
+             '(loopback addresses are ignored).',
+        id='api.W001',
+    )]
+
+
+@register
+def replica_cache_check(app_configs, **kwargs):
+    backend = settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]
+
+    if not settings.DATABASE_REPLICAS or \
+            backend not in ('LocMemCache', 'DummyCache'):
+        return []
+
+    return [Warning(
+        f'DB_REPLICAS is set but the cache ({backend}) is not shared between '
+        'processes, so users may not see their own writes.',
+        hint='Point CACHE_BACKEND at a shared cache such as Redis or '
+             'Memcached.',
+        id='api.W002',
+    )]
+
+
+@register
+def async_connection_check(app_configs, **kwargs):
+    if not settings.ASYNC_READ_VIEWS:
+        return []
+
+    return [
+        Warning(
+            f'Database "{alias}" keeps connections open (CONN_MAX_AGE='
+            f'{database["CONN_MAX_AGE"]}) while ASYNC_READ_VIEWS is on. '
+            'Under ASGI every request runs in a new thread, so each one '
+            'leaves a connection behind.',
+            hint='Set DB_POOL=True, or DB_CONN_MAX_AGE=0.',
+            id='api.W003',
+        )
+        for alias, database in settings.DATABASES.items()
+        if database.get('CONN_MAX_AGE', 0) != 0 and
+        'pool' not in database.get('OPTIONS', {})
+    ]
@@ -0,0 +1,131 @@
+import hashlib
+
+from django.db.models import CharField, Count, Max, Sum, Value, \
+    prefetch_related_objects
+from django.db.models.functions import Cast
+from django.utils.cache import get_conditional_response, \
+    patch_cache_control, patch_vary_headers
+from rest_framework.response import Response
+
+
+class NotModified(Exception):
+    pass
+
+
+def version_field(model):
+    if any(f.name == 'updated_at' for f in model._meta.concrete_fields):
+        return 'updated_at'
+
+    return 'pk'
+
+
+def version_query(querysets):
+    queries = [
+        queryset.order_by().prefetch_related(None).annotate(
+            part=Value(index)
+        ).values('part').annotate(
+            rows=Count('pk'),
+            latest=Cast(
+                Max(version_field(queryset.model)), output_field=CharField()
+            ),
+            total=Sum('pk'),
+        ).values_list('part', 'rows', 'latest', 'total')
+        for index, queryset in enumerate(querysets)
+    ]
+
+    return queries[0].union(*queries[1:], all=True)
+
+
+def versions(querysets):
+    return sorted(version_query(querysets))
+
+
+async def aversions(querysets):
+    return sorted([row async for row in version_query(querysets)])
+
+
+def page_scope(queryset, page, paginator):
+    pks = [obj.pk for obj in page]
+
+    return queryset.model.objects.filter(pk__in=pks), (
+        pks, paginator.get_previous_link(), paginator.get_next_link()
+    )
+
+
+def make_etag(request, rows, media_type):
+    key = repr((
+        request.build_absolute_uri(), media_type, request.user.pk, rows
+    ))
+
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def add_validator_headers(response, etag):
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization'])
+
+    return response
+
+
+class ConditionalReadMixin:
+    def version_etag(self, queryset, page_key=None):
+        querysets = self.get_serializer_class().version_querysets(queryset)
+
+        return make_etag(
+            self.request, (page_key, versions(querysets)),
+            self.request.accepted_media_type
+        )
+
+    def conditional_response(self, etag, build):
+        response = get_conditional_response(self.request, etag=etag)
+
+        if response is None:
+            response = build()
+
+        return add_validator_headers(response, etag)
+
+
+class ConditionalRetrieveMixin(ConditionalReadMixin):
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = self.version_etag(
+            type(instance).objects.filter(pk=instance.pk)
+        )
+
+        return self.conditional_response(etag, lambda: Response(
+            self.get_serializer(self.load_object(instance)).data
+        ))
+
+    def load_object(self, instance):
+        return instance
+
+
+class ConditionalListMixin(ConditionalReadMixin):
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+
+        if page is None:
+            return self.conditional_response(
+                self.version_etag(queryset),
+                lambda: Response(self.get_serializer(
+                    self.load_page(list(queryset)), many=True
+                ).data)
+            )
+
+        scope, page_key = page_scope(queryset, page, self.paginator)
+
+        return self.conditional_response(
+            self.version_etag(scope, page_key),
+            lambda: self.get_paginated_response(
+                self.get_serializer(self.load_page(page), many=True).data
+            )
+        )
+
+    def load_page(self, page):
+        prefetch_related_objects(
+            page, *self.get_serializer_class().eager_lookups()
+        )
+
+        return page
@@ -0,0 +1,43 @@
+import threading
+
+from django.views.decorators.csrf import csrf_exempt
+
+_pending = []
+_lock = threading.Lock()
+
+
+def swagger_schema(factory):
+    def decorator(view_method):
+        _pending.append((view_method, factory))
+        return view_method
+
+    return decorator
+
+
+def load_swagger_schemas():
+    from drf_yasg.utils import swagger_auto_schema
+
+    with _lock:
+        while _pending:
+            view_method, factory = _pending.pop()
+            swagger_auto_schema(**factory())(view_method)
+
+
+def schema_view(renderer=None):
+    view = None
+
+    @csrf_exempt
+    def dispatch(request, *args, **kwargs):
+        nonlocal view
+
+        if view is None:
+            from api.schema import CachedSchemaView
+
+            view = (
+                CachedSchemaView.with_ui(renderer) if renderer
+                else CachedSchemaView.without_ui()
+            )
+
+        return view(request, *args, **kwargs)
+
+    return dispatch
@@ -0,0 +1,74 @@
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from statistics import median
+
+IMPORT_TIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)')
+
+IMPORT_SCRIPT = (
+    'import time\n'
+    'started = time.perf_counter()\n'
+    'import {target}\n'
+    'print(time.perf_counter() - started)\n'
+)
+
+
+def import_profile(target, env=None):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         IMPORT_SCRIPT.format(target=target)],
+        capture_output=True, text=True, env=env
+    )
+
+    if result.returncode:
+        raise RuntimeError(
+            f'Importing {target} failed:\n{result.stderr[-2000:]}'
+        )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            modules[match[3]] = (int(match[1]) / 1000, int(match[2]) / 1000)
+
+    return float(result.stdout.split()[-1]) * 1000, modules
+
+
+def benchmark(target='cms.wsgi', runs=5, warm_up=True):
+    env = dict(os.environ, WORKER_WARM_UP=str(warm_up))
+    totals = []
+    samples = defaultdict(list)
+
+    for _ in range(runs):
+        total, modules = import_profile(target, env)
+        totals.append(total)
+        for name, timing in modules.items():
+            samples[name].append(timing)
+
+    modules = [
+        {
+            'module': name,
+            'self_ms': round(median(own for own, _ in timings), 2),
+            'cumulative_ms': round(median(cum for _, cum in timings), 2),
+        }
+        for name, timings in samples.items()
+    ]
+    modules.sort(key=lambda row: row['cumulative_ms'], reverse=True)
+
+    packages = defaultdict(float)
+    for row in modules:
+        packages[row['module'].split('.')[0]] += row['self_ms']
+
+    return {
+        'target': target,
+        'runs': runs,
+        'warm_up': warm_up,
+        'total_ms': round(median(totals), 2),
+        'modules': modules,
+        'packages': dict(sorted(
+            ((name, round(ms, 2)) for name, ms in packages.items()),
+            key=lambda item: item[1], reverse=True
+        )),
+    }
@@ -0,0 +1,349 @@
+import http.client
+import json
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from django.urls import Resolver404, resolve
+
+API_PREFIX = '/api/v1/'
+
+
+class LoadTestError(Exception):
+    pass
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = []
+        self.lock = threading.Lock()
+        self.endpoints = {}
+
+    def endpoint(self, method, path):
+        key = (method, path)
+
+        if key not in self.endpoints:
+            try:
+                name = resolve(urlsplit(path).path).url_name
+            except Resolver404:
+                name = urlsplit(path).path
+            self.endpoints[key] = f'{method} {name}'
+
+        return self.endpoints[key]
+
+    def add(self, method, path, status, latency, queries):
+        name = self.endpoint(method, path)
+
+        with self.lock:
+            self.samples.append((name, status, latency, queries))
+
+
+class Session:
+    def __init__(self, base_url, recorder, rng, timeout=30):
+        url = urlsplit(base_url)
+        connection_class = (
+            http.client.HTTPSConnection if url.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        self.connection = connection_class(url.netloc, timeout=timeout)
+        self.prefix = url.path.rstrip('/')
+        self.recorder = recorder
+        self.rng = rng
+        self.token = None
+        self.state = {}
+
+    def login(self, email, password):
+        status, data = self.request(
+            'POST', 'auth/login/', {'email': email, 'password': password},
+            record=False
+        )
+
+        if status != 200:
+            raise LoadTestError(f'Could not log in as {email}: {status}')
+
+        self.token = data['access']
+
+    def request(self, method, path, data=None, files=None, record=True):
+        path = f'{self.prefix}{API_PREFIX}{path}'
+        headers = {}
+
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+
+        if files:
+            body, headers['Content-Type'] = self.multipart(data, files)
+        elif data is not None:
+            body = json.dumps(data).encode()
+            headers['Content-Type'] = 'application/json'
+        else:
+            body = None
+
+        started = time.perf_counter()
+        try:
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            if record:
+                self.recorder.add(
+                    method, path, 0, time.perf_counter() - started, None
+                )
+            return 0, None
+        latency = time.perf_counter() - started
+
+        if record:
+            queries = response.getheader('X-Query-Count')
+            self.recorder.add(
+                method, path, response.status, latency,
+                int(queries) if queries is not None else None
+            )
+
+        if 'json' not in (response.getheader('Content-Type') or ''):
+            return response.status, content
+
+        return response.status, json.loads(content or b'null')
+
+    def get(self, path):
+        return self.request('GET', path)
+
+    def post(self, path, data=None, files=None):
+        return self.request('POST', path, data, files)
+
+    @staticmethod
+    def multipart(data, files):
+        boundary = uuid.uuid4().hex
+        parts = []
+
+        for name, value in (data or {}).items():
+            parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; '
+                f'name="{name}"\r\n\r\n{value}\r\n'.encode()
+            )
+        for name, (filename, content) in files.items():
+            parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; '
+                f'name="{name}"; filename="{filename}"\r\n'
+                f'Content-Type: application/octet-stream\r\n\r\n'.encode()
+                + content + b'\r\n'
+            )
+        parts.append(f'--{boundary}--\r\n'.encode())
+
+        return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def results(response):
+    status, data = response
+
+    if status != 200 or not isinstance(data, dict):
+        return []
+
+    return data.get('results', [])
+
+
+def student_browsing(session):
+    courses = results(session.get('courses/'))
+    if not courses:
+        return
+
+    course = session.rng.choice(courses)
+    session.get(f'courses/{course["id"]}/')
+    lectures = results(session.get(f'lectures/course/{course["id"]}/'))
+    if not lectures:
+        return
+
+    lecture = session.rng.choice(lectures)
+    session.get(f'lectures/{lecture["id"]}/')
+    session.get(f'assignments/lecture/{lecture["id"]}/')
+
+
+def submission_rush(session):
+    if 'assignments' not in session.state:
+        session.state['assignments'] = [
+            assignment
+            for lecture in results(session.get('lectures/?page_size=200'))
+            for assignment in lecture['assignments']
+        ]
+    if not session.state['assignments']:
+        return
+
+    session.post(
+        'submissions/create/',
+        {'assignment': session.rng.choice(session.state['assignments'])},
+        files={'file': (
+            'submission.pdf',
+            session.rng.randbytes(session.state['file_size'])
+        )}
+    )
+    session.get('submissions/')
+
+
+def teacher_grading(session):
+    submissions = results(session.get('submissions/?page_size=50'))
+
+    if submissions:
+        by_assignment = defaultdict(list)
+        for submission in submissions:
+            by_assignment[submission['assignment']].append(submission['id'])
+
+        assignment = session.rng.choice(sorted(by_assignment))
+        session.post('grades/batch/', {
+            'assignment': assignment,
+            'grades': [
+                {'submission': submission_id,
+                 'score': session.rng.randint(0, 100)}
+                for submission_id in by_assignment[assignment]
+            ]
+        })
+
+    if 'courses' not in session.state:
+        session.state['courses'] = [
+            course['id'] for course in results(session.get('courses/'))
+        ]
+    if session.state['courses']:
+        course_id = session.rng.choice(session.state['courses'])
+        session.get(f'courses/{course_id}/gradebook/')
+
+
+SCENARIOS = {
+    'student_browsing': ('student', student_browsing),
+    'submission_rush': ('student', submission_rush),
+    'teacher_grading': ('teacher', teacher_grading),
+}
+
+
+def percentile(values, share):
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(share * len(ordered)) - 1))
+
+    return ordered[index]
+
+
+def summarize(samples, elapsed):
+    grouped = defaultdict(list)
+    for sample in samples:
+        grouped[sample[0]].append(sample)
+    if samples:
+        grouped['total'] = list(samples)
+
+    report = {}
+    for name, rows in sorted(grouped.items()):
+        latencies = [latency * 1000 for _, _, latency, _ in rows]
+        queries = [count for _, _, _, count in rows if count is not None]
+        report[name] = {
+            'requests': len(rows),
+            'errors': sum(
+                1 for _, status, _, _ in rows if not 200 <= status < 400
+            ),
+            'rps': round(len(rows) / elapsed, 2) if elapsed else None,
+            'p50_ms': round(percentile(latencies, 0.50), 2),
+            'p95_ms': round(percentile(latencies, 0.95), 2),
+            'p99_ms': round(percentile(latencies, 0.99), 2),
+            'queries_per_request': (
+                round(sum(queries) / len(queries), 2) if queries else None
+            ),
+        }
+
+    return report
+
+
+def assign_scenarios(mix, workers, rng):
+    total = sum(mix.values())
+    quotas = {name: workers * weight / total for name, weight in mix.items()}
+    counts = {name: int(quota) for name, quota in quotas.items()}
+    remaining = workers - sum(counts.values())
+
+    for name in sorted(
+        mix, key=lambda name: quotas[name] - counts[name], reverse=True
+    )[:remaining]:
+        counts[name] += 1
+
+    plan = [name for name in sorted(counts) for _ in range(counts[name])]
+    rng.shuffle(plan)
+
+    return plan
+
+
+def run(base_url, accounts, mix, workers=8, duration=30, seed=0,
+        file_size=16 * 1024):
+    recorder = Recorder()
+    rng = random.Random(seed)
+    plan = assign_scenarios(mix, workers, rng)
+    sessions = []
+    used = defaultdict(int)
+
+    for index, name in enumerate(plan):
+        role, scenario = SCENARIOS[name]
+        pool = accounts[role]
+        if not pool:
+            raise LoadTestError(f'No {role} accounts for {name}')
+
+        session = Session(base_url, recorder, random.Random(seed + index))
+        session.state['file_size'] = file_size
+        session.login(*pool[used[role] % len(pool)])
+        used[role] += 1
+        sessions.append((session, scenario))
+
+    deadline = time.monotonic() + duration
+    errors = []
+
+    def work(session, scenario):
+        try:
+            while time.monotonic() < deadline:
+                scenario(session)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=work, args=pair, daemon=True)
+        for pair in sessions
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    if errors:
+        raise LoadTestError(f'Scenario failed: {errors[0]!r}') from errors[0]
+
+    return {
+        'meta': {
+            'base_url': base_url,
+            'workers': workers,
+            'duration_s': round(elapsed, 2),
+            'mix': {name: plan.count(name) for name in sorted(set(plan))},
+            'seed': seed,
+        },
+        'endpoints': summarize(recorder.samples, elapsed),
+    }
+
+
+def compare(base, head):
+    rows = []
+    names = sorted(set(base['endpoints']) | set(head['endpoints']))
+
+    for name in names:
+        old = base['endpoints'].get(name)
+        new = head['endpoints'].get(name)
+        row = {'endpoint': name}
+
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms', 'rps',
+                       'queries_per_request'):
+            before = old and old.get(metric)
+            after = new and new.get(metric)
+            change = None
+            if before and after is not None:
+                change = round((after - before) / before * 100, 1)
+            row[metric] = (before, after, change)
+
+        rows.append(row)
+
+    return rows
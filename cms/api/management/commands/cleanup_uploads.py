@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.services.upload import UploadService
+
+
+class Command(BaseCommand):
+    help = 'Delete upload sessions that have not received a chunk recently'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age',
+            type=int,
+            default=settings.UPLOAD_SESSION_TTL,
+            help='Age in seconds after which an idle session is removed'
+        )
+
+    def handle(self, *args, **options):
+        count = UploadService.cleanup(timedelta(seconds=options['max_age']))
+        self.stdout.write(f'Removed {count} abandoned upload session(s)')
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api.schema import SchemaDocument
+
+
+class Command(BaseCommand):
+    help = 'Generate the OpenAPI schema for the current code version'
+
+    def handle(self, *args, **options):
+        for path in SchemaDocument.write():
+            self.stdout.write(f'Wrote {path}')
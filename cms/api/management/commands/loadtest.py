@@ -0,0 +1,121 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Exists, OuterRef
+
+from api.loadtest import SCENARIOS, LoadTestError, compare, run
+from api.models import Course, Enrollment, User
+
+COLUMNS = ('requests', 'errors', 'rps', 'p50_ms', 'p95_ms', 'p99_ms',
+           'queries_per_request')
+
+
+def parse_mix(value):
+    mix = {}
+
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in SCENARIOS:
+            raise CommandError(
+                f'Unknown scenario {name!r}, choose from {", ".join(SCENARIOS)}'
+            )
+        mix[name] = float(weight or 1)
+
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        'Replay student and teacher scenarios against a running server and '
+        'report latency percentiles, throughput and queries per request'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--duration', type=float, default=30)
+        parser.add_argument('--workers', type=int, default=8)
+        parser.add_argument(
+            '--mix',
+            default='student_browsing=5,submission_rush=3,teacher_grading=2',
+            help='Comma separated scenario=weight pairs'
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Seed that seed_scale used to create the accounts'
+        )
+        parser.add_argument('--password', default='password')
+        parser.add_argument('--file-size', type=int, default=16 * 1024)
+        parser.add_argument('--output', help='Write the report as JSON')
+        parser.add_argument(
+            '--compare', nargs=2, metavar=('BASE', 'HEAD'),
+            help='Compare two saved reports instead of running'
+        )
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            return self.compare(*options['compare'])
+
+        try:
+            report = run(
+                options['base_url'],
+                self.accounts(options),
+                parse_mix(options['mix']),
+                workers=options['workers'],
+                duration=options['duration'],
+                seed=options['seed'],
+                file_size=options['file_size']
+            )
+        except LoadTestError as exc:
+            raise CommandError(str(exc))
+
+        self.print_report(report)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2, sort_keys=True)
+            self.stdout.write(f'Saved report to {options["output"]}')
+
+    def accounts(self, options):
+        seeded = User.objects.filter(
+            email__endswith=f'.seed{options["seed"]}@example.com'
+        ).order_by('id')
+        limit = options['workers']
+        students = seeded.filter(role='student').filter(
+            Exists(Enrollment.objects.filter(user=OuterRef('pk')))
+        ).values_list('email', flat=True)[:limit]
+        teachers = seeded.filter(role='teacher').filter(
+            Exists(Course.objects.filter(owner=OuterRef('pk')))
+        ).values_list('email', flat=True)[:limit]
+
+        return {
+            'student': [(email, options['password']) for email in students],
+            'teacher': [(email, options['password']) for email in teachers],
+        }
+
+    def print_report(self, report):
+        self.stdout.write(
+            f'{"endpoint":<36}' + ''.join(f'{c:>21}' for c in COLUMNS)
+        )
+        for name, row in report['endpoints'].items():
+            self.stdout.write(f'{name:<36}' + ''.join(
+                f'{"-" if row[c] is None else row[c]:>21}' for c in COLUMNS
+            ))
+
+    def compare(self, base_path, head_path):
+        with open(base_path) as base, open(head_path) as head:
+            self.print_comparison(compare(json.load(base), json.load(head)))
+
+    def print_comparison(self, rows):
+        metrics = COLUMNS[2:]
+        self.stdout.write(
+            f'{"endpoint":<36}' + ''.join(f'{m:>28}' for m in metrics)
+        )
+        for row in rows:
+            cells = []
+            for metric in metrics:
+                before, after, change = row[metric]
+                cell = f'{before} -> {after}'
+                if change is not None:
+                    cell += f' ({change:+}%)'
+                cells.append(f'{cell:>28}')
+            self.stdout.write(f'{row["endpoint"]:<36}' + ''.join(cells))
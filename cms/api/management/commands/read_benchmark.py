@@ -0,0 +1,111 @@
+import json
+
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import OuterRef, Subquery
+from django.utils.module_loading import import_string
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from api.management.commands.loadtest import Command as LoadTestCommand
+from api.models import Lecture, User
+from api.readbench import CONNECTION_MODES, benchmark, \
+    connection_benchmark, read_paths
+
+
+class Command(LoadTestCommand):
+    help = (
+        'Replay the course, lecture and assignment read endpoints through '
+        'the WSGI and ASGI handlers under the same concurrency and compare '
+        'latency percentiles and throughput'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clients', type=int, default=32,
+            help='Concurrent clients, one seeded student each'
+        )
+        parser.add_argument(
+            '--requests', type=int, default=20,
+            help='Requests each client sends'
+        )
+        parser.add_argument(
+            '--threads', type=int, default=8,
+            help='Worker threads serving the WSGI run'
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Seed that seed_scale used to create the accounts'
+        )
+        parser.add_argument(
+            '--connections', nargs='*', choices=CONNECTION_MODES,
+            metavar='MODE',
+            help='Compare database connection handling (per-request, '
+                 'persistent, pool) instead of WSGI and ASGI; the pool needs '
+                 'psycopg[pool]'
+        )
+        parser.add_argument(
+            '--handler', choices=('wsgi', 'asgi'), default='wsgi',
+            help='Handler used with --connections'
+        )
+        parser.add_argument('--output', help='Write the reports as JSON')
+
+    def handle(self, *args, **options):
+        users = self.users(options)
+
+        if not users:
+            raise CommandError(
+                'No enrolled students with lectures, run seed_scale first'
+            )
+
+        if options['connections'] is not None:
+            reports = connection_benchmark(
+                users, options['requests'], options['threads'],
+                connection.settings_dict['NAME'], options['handler'],
+                options['connections']
+            )
+            comparisons = reports['comparison']
+        else:
+            reports = benchmark(
+                users, options['requests'], options['threads'],
+                connection.settings_dict['NAME']
+            )
+            comparisons = {'asgi': reports['comparison']}
+
+        names = [name for name in reports if name != 'comparison']
+        for name in names:
+            meta = reports[name]['meta']
+            self.stdout.write(
+                f'\n{name}: {meta["clients"]} clients, '
+                f'{meta["duration_s"]} s'
+            )
+            self.print_report(reports[name])
+
+        for name, rows in comparisons.items():
+            self.stdout.write(f'\n{names[0]} -> {name}')
+            self.print_comparison(rows)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(reports, output, indent=2, sort_keys=True)
+            self.stdout.write(f'Saved report to {options["output"]}')
+
+    def users(self, options):
+        token_class = import_string(jwt_settings.TOKEN_OBTAIN_SERIALIZER)
+        lectures = Lecture.objects.filter(
+            course__enrollments__user=OuterRef('pk')
+        ).order_by('id')
+        students = User.objects.filter(
+            email__endswith=f'.seed{options["seed"]}@example.com',
+            role='student'
+        ).annotate(
+            lecture_id=Subquery(lectures.values('id')[:1]),
+            course_id=Subquery(lectures.values('course_id')[:1]),
+        ).filter(lecture_id__isnull=False).order_by('id')
+
+        return [
+            {
+                'token': str(token_class.get_token(student).access_token),
+                'paths': read_paths(student.course_id, student.lecture_id),
+            }
+            for student in students[:options['clients']]
+        ]
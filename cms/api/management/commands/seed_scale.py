@@ -0,0 +1,297 @@
+import io
+import random
+import time
+from collections import Counter
+from datetime import datetime
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import F, Max
+
+from api.models import User, Course, Enrollment, Lecture, Assignment, \
+    Submission, Grade, Comment, StoredBlob
+from api.storage import upload_storage
+
+PLACEHOLDER = b'%PDF-1.4\n% seed_scale placeholder\n%%EOF\n'
+
+
+class BulkWriter:
+    def __init__(self, model, batch_size, use_copy):
+        self.model = model
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.fields = [field for field in model._meta.concrete_fields]
+        self.rows = []
+        self.count = 0
+        self.next_id = (
+            model.objects.aggregate(last=Max('pk'))['last'] or 0
+        ) + 1
+
+    def add(self, **values):
+        obj = self.model(id=self.next_id, **values)
+        self.next_id += 1
+        self.rows.append(obj)
+
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+        return obj.id
+
+    def flush(self):
+        if not self.rows:
+            return
+
+        if self.use_copy:
+            self.copy(self.rows)
+        else:
+            self.model.objects.bulk_create(self.rows)
+
+        self.count += len(self.rows)
+        self.rows = []
+
+    def copy(self, rows):
+        buffer = io.StringIO()
+
+        for obj in rows:
+            buffer.write('\t'.join(
+                self.encode(field.get_db_prep_save(
+                    field.pre_save(obj, True), connection
+                ))
+                for field in self.fields
+            ))
+            buffer.write('\n')
+
+        buffer.seek(0)
+        columns = ', '.join(
+            connection.ops.quote_name(field.column) for field in self.fields
+        )
+        sql = (
+            f'COPY {connection.ops.quote_name(self.model._meta.db_table)} '
+            f'({columns}) FROM STDIN'
+        )
+
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+
+            if hasattr(raw, 'copy_expert'):
+                raw.copy_expert(sql, buffer)
+            else:
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    @staticmethod
+    def encode(value):
+        if value is None:
+            return r'\N'
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        return (
+            str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r')
+        )
+
+
+class Command(BaseCommand):
+    help = 'Fill the database with a large, reproducible synthetic dataset'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50_000)
+        parser.add_argument(
+            '--teachers', type=int, default=None,
+            help='Number of teachers among the users (default: users / 25)'
+        )
+        parser.add_argument('--courses', type=int, default=2_000)
+        parser.add_argument('--lectures', type=int, default=100_000)
+        parser.add_argument(
+            '--assignments-per-lecture', type=int, default=1
+        )
+        parser.add_argument(
+            '--enrollments-per-student', type=int, default=4
+        )
+        parser.add_argument('--submissions', type=int, default=2_000_000)
+        parser.add_argument(
+            '--graded', type=float, default=0.8,
+            help='Share of submissions that receive a grade'
+        )
+        parser.add_argument(
+            '--comments', type=int, default=None,
+            help='Number of comments (default: submissions / 4)'
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--password', default='password')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument(
+            '--no-copy', action='store_true',
+            help='Use bulk_create even on PostgreSQL'
+        )
+
+    def handle(self, *args, **options):
+        teachers = options['teachers'] or max(1, options['users'] // 25)
+        students = options['users'] - teachers
+        comments = options['comments']
+        if comments is None:
+            comments = options['submissions'] // 4
+
+        if students < 1 or options['courses'] < 1 or options['lectures'] < 1:
+            raise CommandError(
+                'Need at least one student, one course and one lecture'
+            )
+
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.use_copy = (
+            connection.vendor == 'postgresql' and not options['no_copy']
+        )
+        self.writers = {}
+        started = time.monotonic()
+
+        with transaction.atomic():
+            self.seed(teachers, students, comments)
+            self.reset_sequences()
+
+        for model, writer in self.writers.items():
+            self.stdout.write(f'{model.__name__}: {writer.count} rows')
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded in {time.monotonic() - started:.1f}s '
+            f'({"COPY" if self.use_copy else "bulk_create"}, '
+            f'seed {options["seed"]})'
+        ))
+
+    def writer(self, model):
+        if model not in self.writers:
+            self.writers[model] = BulkWriter(
+                model, self.options['batch_size'], self.use_copy
+            )
+
+        return self.writers[model]
+
+    def seed(self, teachers, students, comments):
+        rng, options = self.rng, self.options
+        seed = options['seed']
+        password = make_password(
+            options['password'], salt=f'seedscale{abs(seed)}'
+        )
+
+        users = self.writer(User)
+        teacher_ids = [
+            users.add(
+                email=f'teacher{i}.seed{seed}@example.com', password=password,
+                first_name='Teacher', last_name=str(i), role='teacher'
+            )
+            for i in range(teachers)
+        ]
+        student_ids = [
+            users.add(
+                email=f'student{i}.seed{seed}@example.com', password=password,
+                first_name='Student', last_name=str(i), role='student'
+            )
+            for i in range(students)
+        ]
+        users.flush()
+
+        courses = self.writer(Course)
+        owners = {}
+        for i in range(options['courses']):
+            owner_id = rng.choice(teacher_ids)
+            course_id = courses.add(
+                title=f'Course {i}', description=f'Synthetic course {i}',
+                owner_id=owner_id
+            )
+            owners[course_id] = owner_id
+        courses.flush()
+        course_ids = list(owners)
+
+        enrollments = self.writer(Enrollment)
+        enrolled = []
+        for course_id, owner_id in owners.items():
+            enrollments.add(user_id=owner_id, course_id=course_id)
+        per_student = min(options['enrollments_per_student'], len(course_ids))
+        for student_id in student_ids:
+            for course_id in rng.sample(course_ids, per_student):
+                enrollments.add(user_id=student_id, course_id=course_id)
+                enrolled.append((student_id, course_id))
+        enrollments.flush()
+
+        lecture_file = self.placeholder('lectures/placeholder.pdf')
+        lectures = self.writer(Lecture)
+        assignments = self.writer(Assignment)
+        course_assignments = {}
+        for i in range(options['lectures']):
+            course_id = course_ids[i % len(course_ids)]
+            lecture_id = lectures.add(
+                course_id=course_id, topic=f'Lecture {i}', file=lecture_file
+            )
+            for j in range(options['assignments_per_lecture']):
+                course_assignments.setdefault(course_id, []).append(
+                    assignments.add(
+                        lecture_id=lecture_id, course_id=course_id,
+                        title=f'Assignment {i}.{j}', description=''
+                    )
+                )
+        lectures.flush()
+        assignments.flush()
+
+        enrolled = [
+            (student_id, course_id) for student_id, course_id in enrolled
+            if course_id in course_assignments
+        ]
+        if not enrolled and options['submissions']:
+            raise CommandError('No enrolled course has an assignment')
+
+        submission_file = self.placeholder('submissions/placeholder.pdf')
+        submissions = self.writer(Submission)
+        grades = self.writer(Grade)
+        notes = self.writer(Comment)
+        commented = Counter(
+            rng.choices(range(options['submissions']), k=comments)
+        ) if options['submissions'] else Counter()
+        for index in range(options['submissions']):
+            student_id, course_id = rng.choice(enrolled)
+            submission_id = submissions.add(
+                user_id=student_id, course_id=course_id,
+                assignment_id=rng.choice(course_assignments[course_id]),
+                file=submission_file
+            )
+
+            if rng.random() < options['graded']:
+                grades.add(
+                    submission_id=submission_id, course_id=course_id,
+                    teacher_id=owners[course_id], score=rng.randint(0, 100)
+                )
+            for _ in range(commented[index]):
+                notes.add(
+                    submission_id=submission_id, course_id=course_id,
+                    user_id=rng.choice((student_id, owners[course_id])),
+                    content=f'Comment on submission {submission_id}'
+                )
+
+        for writer in (submissions, grades, notes):
+            writer.flush()
+
+        self.add_references(lecture_file, lectures.count)
+        self.add_references(submission_file, submissions.count)
+
+    @staticmethod
+    def placeholder(name):
+        return upload_storage().save(name, ContentFile(PLACEHOLDER))
+
+    @staticmethod
+    def add_references(name, count):
+        StoredBlob.objects.filter(name=name).update(
+            refcount=F('refcount') + count - 1
+        )
+
+    def reset_sequences(self):
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), list(self.writers)
+        )
+
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from api.importtime import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Measure how long a fresh worker takes to import the project'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target', default='cms.wsgi',
+            help='Module a worker imports on start'
+        )
+        parser.add_argument('--runs', type=int, default=5)
+        parser.add_argument('--top', type=int, default=25)
+        parser.add_argument(
+            '--no-warm-up', action='store_true',
+            help='Skip the URL resolver and serializer warm-up'
+        )
+        parser.add_argument('--output', help='Write the full report as JSON')
+
+    def handle(self, *args, **options):
+        report = benchmark(
+            options['target'], options['runs'], not options['no_warm_up']
+        )
+
+        self.stdout.write(
+            f'{report["target"]}: {report["total_ms"]:.1f} ms '
+            f'(median of {report["runs"]} runs, '
+            f'warm-up {"on" if report["warm_up"] else "off"})'
+        )
+        self.stdout.write(f'\n{"cumulative ms":>14} {"self ms":>9}  module')
+        for row in report['modules'][:options['top']]:
+            self.stdout.write(
+                f'{row["cumulative_ms"]:>14.2f} {row["self_ms"]:>9.2f}  '
+                f'{row["module"]}'
+            )
+
+        self.stdout.write(f'\n{"self ms":>14}  package')
+        for name, ms in list(report['packages'].items())[:options['top']]:
+            self.stdout.write(f'{ms:>14.2f}  {name}')
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f'\nWrote {options["output"]}')
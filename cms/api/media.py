@@ -0,0 +1,121 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, \
+    StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+
+RANGE = re.compile(r'bytes=(\d*)-(\d*)')
+BLOCK_SIZE = 64 * 1024
+
+
+def parse_range(header, size):
+    match = RANGE.fullmatch(header.strip())
+
+    if not match or match.groups() == ('', ''):
+        return None
+
+    start, end = match.groups()
+
+    if start == '':
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+
+    return start, end
+
+
+def iter_range(path, start, length):
+    with open(path, 'rb') as f:
+        f.seek(start)
+
+        while length > 0:
+            block = f.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+
+
+def serve_media(request, field_file):
+    if not field_file:
+        raise Http404('No file attached')
+
+    path = field_file.path
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404('File not found')
+
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = int(stat.st_mtime)
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+
+    if response is None:
+        response = _file_response(
+            request, field_file, path, stat, etag, content_type
+        )
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = 'private, no-cache'
+
+    return response
+
+
+def _file_response(request, field_file, path, stat, etag, content_type):
+    filename = field_file.original_name
+
+    if settings.MEDIA_SENDFILE == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = (
+            settings.MEDIA_SENDFILE_PREFIX + field_file.name
+        )
+    elif settings.MEDIA_SENDFILE == 'apache':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = path
+    else:
+        range_header = request.headers.get('Range')
+        if_range = request.headers.get('If-Range')
+        byte_range = None
+
+        if range_header and (if_range is None or if_range == etag):
+            byte_range = parse_range(range_header, stat.st_size)
+
+        if byte_range is None:
+            return FileResponse(
+                open(path, 'rb'),
+                content_type=content_type,
+                filename=filename
+            )
+
+        start, end = byte_range
+
+        if start >= stat.st_size or start > end:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+            return response
+
+        response = StreamingHttpResponse(
+            iter_range(path, start, end - start + 1),
+            status=206,
+            content_type=content_type
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+        response['Content-Length'] = str(end - start + 1)
+
+    response['Content-Disposition'] = content_disposition_header(
+        False, filename
+    )
+
+    return response
@@ -0,0 +1,369 @@
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+def label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Counter:
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def inc(self, amount=1, **labels):
+        key = (self.name, label_key(labels))
+
+        with self.registry.lock:
+            self.registry.counters[key] += amount
+
+    def value(self, **labels):
+        with self.registry.lock:
+            return self.registry.counters.get(
+                (self.name, label_key(labels)), 0
+            )
+
+
+class Gauge:
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def set(self, value, **labels):
+        key = (self.name, label_key(labels))
+
+        with self.registry.lock:
+            self.registry.gauges[key] = value
+
+
+class Histogram:
+    def __init__(self, registry, name, buckets):
+        self.registry = registry
+        self.name = name
+        self.buckets = buckets
+
+    def observe(self, value, **labels):
+        key = (self.name, label_key(labels))
+
+        with self.registry.lock:
+            series = self.registry.histograms.get(key)
+            if series is None:
+                series = self.registry.histograms[key] = {
+                    'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0
+                }
+
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['buckets'][index] += 1
+                    break
+            series['sum'] += value
+            series['count'] += 1
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+        self.counters = defaultdict(float)
+        self.gauges = {}
+        self.histograms = {}
+        self.collectors = []
+        self.refresh_lock = threading.Lock()
+        self.token = uuid.uuid4().hex[:8]
+        self.flushed_at = 0.0
+
+    def counter(self, name, help_text):
+        self.metrics[name] = ('counter', help_text, None)
+
+        return Counter(self, name)
+
+    def gauge(self, name, help_text):
+        self.metrics[name] = ('gauge', help_text, None)
+
+        return Gauge(self, name)
+
+    def collector(self, func):
+        self.collectors.append(func)
+
+        return func
+
+    def refresh(self):
+        with self.refresh_lock:
+            for collect in self.collectors:
+                collect()
+
+    def histogram(self, name, help_text, buckets):
+        self.metrics[name] = ('histogram', help_text, tuple(buckets))
+
+        return Histogram(self, name, tuple(buckets))
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'counters': [
+                    [name, list(labels), value]
+                    for (name, labels), value in self.counters.items()
+                ],
+                'gauges': [
+                    [name, list(labels), value]
+                    for (name, labels), value in self.gauges.items()
+                ],
+                'histograms': [
+                    [name, list(labels), dict(series, buckets=list(
+                        series['buckets']
+                    ))]
+                    for (name, labels), series in self.histograms.items()
+                ],
+            }
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+
+    @staticmethod
+    def directory():
+        path = settings.METRICS_DIR
+        return Path(path) if path else None
+
+    def snapshot_path(self):
+        return self.directory() / f'{os.getpid()}-{self.token}.json'
+
+    def flush(self):
+        directory = self.directory()
+        if directory is None:
+            return
+
+        self.refresh()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_path()
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp, path)
+        self.flushed_at = time.monotonic()
+
+    def maybe_flush(self):
+        if time.monotonic() - self.flushed_at >= settings.METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def collect(self):
+        directory = self.directory()
+        if directory is None:
+            self.refresh()
+            return [self.snapshot()]
+
+        self.flush()
+        snapshots = []
+
+        for path in directory.glob('*.json'):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+
+            if not process_alive(path.name.split('-', 1)[0]):
+                snapshot['gauges'] = []
+            snapshots.append(snapshot)
+
+        return snapshots
+
+    def merge(self, snapshots):
+        counters = defaultdict(float)
+        gauges = defaultdict(float)
+        histograms = {}
+
+        for snapshot in snapshots:
+            for name, labels, value in snapshot['counters']:
+                counters[(name, tuple(map(tuple, labels)))] += value
+
+            for name, labels, value in snapshot.get('gauges', []):
+                gauges[(name, tuple(map(tuple, labels)))] += value
+
+            for name, labels, series in snapshot['histograms']:
+                key = (name, tuple(map(tuple, labels)))
+                merged = histograms.setdefault(key, {
+                    'buckets': [0] * len(series['buckets']),
+                    'sum': 0.0, 'count': 0
+                })
+                merged['buckets'] = [
+                    a + b for a, b in zip(merged['buckets'], series['buckets'])
+                ]
+                merged['sum'] += series['sum']
+                merged['count'] += series['count']
+
+        return counters, gauges, histograms
+
+    def render(self):
+        counters, gauges, histograms = self.merge(self.collect())
+        values = {'counter': counters, 'gauge': gauges}
+        lines = []
+
+        for name, (kind, help_text, buckets) in sorted(self.metrics.items()):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+            if kind in values:
+                for (metric, labels), value in sorted(values[kind].items()):
+                    if metric == name:
+                        lines.append(
+                            f'{name}{format_labels(labels)} '
+                            f'{format_value(value)}'
+                        )
+                continue
+
+            for (metric, labels), series in sorted(histograms.items()):
+                if metric != name:
+                    continue
+
+                cumulative = 0
+                for bound, count in zip(buckets, series['buckets']):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_bucket'
+                        f'{format_labels(labels, le=format_bound(bound))} '
+                        f'{cumulative}'
+                    )
+                lines.append(
+                    f'{name}_bucket{format_labels(labels, le="+Inf")} '
+                    f'{series["count"]}'
+                )
+                lines.append(
+                    f'{name}_sum{format_labels(labels)} '
+                    f'{format_value(series["sum"])}'
+                )
+                lines.append(
+                    f'{name}_count{format_labels(labels)} {series["count"]}'
+                )
+
+        return '\n'.join(lines) + '\n'
+
+
+def process_alive(pid):
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def format_bound(bound):
+    return repr(float(bound))
+
+
+def format_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+
+    def escape(value):
+        return value.replace('\\', r'\\').replace('"', r'\"').replace(
+            '\n', r'\n'
+        )
+
+    return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in pairs) + '}'
+
+
+registry = Registry()
+atexit.register(lambda: registry.directory() and registry.flush())
+
+REQUEST_LATENCY = registry.histogram(
+    'cms_http_request_duration_seconds',
+    'Time spent handling a request, by URL name',
+    LATENCY_BUCKETS
+)
+REQUESTS = registry.counter(
+    'cms_http_requests_total',
+    'Handled requests, by URL name, method and status code'
+)
+REQUEST_QUERIES = registry.histogram(
+    'cms_db_queries_per_request',
+    'SQL queries run by one request, by URL name',
+    QUERY_BUCKETS
+)
+CACHE_REQUESTS = registry.counter(
+    'cms_cache_requests_total',
+    'Application cache lookups, by cache and result (hit or miss)'
+)
+UPLOAD_BYTES = registry.counter(
+    'cms_upload_bytes_total',
+    'Uploaded bytes: files stored, by upload_to prefix, and resumable '
+    'upload chunks received (kind="chunk")'
+)
+DB_CONNECTIONS = registry.counter(
+    'cms_db_connections_total',
+    'Database connections opened by Django or taken from the pool, by alias'
+)
+DB_READ_REQUESTS = registry.counter(
+    'cms_db_read_requests_total',
+    'Requests by the database alias their reads were routed to (primary '
+    'or replica), when read replicas are configured'
+)
+DB_POOL_SIZE = registry.gauge(
+    'cms_db_pool_size',
+    'Connections held by the pools of all workers, idle or in use, by alias'
+)
+DB_POOL_AVAILABLE = registry.gauge(
+    'cms_db_pool_available',
+    'Idle connections in the pools of all workers, by alias'
+)
+DB_POOL_MAX_SIZE = registry.gauge(
+    'cms_db_pool_max_size',
+    'Largest number of connections the pools of all workers may hold, '
+    'by alias'
+)
+DB_POOL_WAITING = registry.gauge(
+    'cms_db_pool_waiting_requests',
+    'Requests waiting for a pooled connection, by alias'
+)
+DB_POOL_REQUESTS = registry.counter(
+    'cms_db_pool_requests_total',
+    'Connections handed out by the pool, by alias'
+)
+DB_POOL_WAIT = registry.counter(
+    'cms_db_pool_wait_seconds_total',
+    'Time requests spent waiting for a pooled connection, by alias'
+)
+DB_POOL_ERRORS = registry.counter(
+    'cms_db_pool_errors_total',
+    'Requests that got no pooled connection in time, by alias'
+)
+
+
+@registry.collector
+def collect_pool_stats():
+    for alias in connections:
+        pools = getattr(connections[alias], '_connection_pools', {})
+        pool = pools.get(alias)
+        if pool is None:
+            continue
+
+        stats = pool.pop_stats()
+        DB_POOL_SIZE.set(stats.get('pool_size', 0), alias=alias)
+        DB_POOL_AVAILABLE.set(stats.get('pool_available', 0), alias=alias)
+        DB_POOL_MAX_SIZE.set(stats.get('pool_max', 0), alias=alias)
+        DB_POOL_WAITING.set(stats.get('requests_waiting', 0), alias=alias)
+        DB_POOL_REQUESTS.inc(stats.get('requests_num', 0), alias=alias)
+        DB_POOL_WAIT.inc(stats.get('requests_wait_ms', 0) / 1000, alias=alias)
+        DB_POOL_ERRORS.inc(stats.get('requests_errors', 0), alias=alias)
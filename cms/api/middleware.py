@@ -0,0 +1,237 @@
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, \
+    sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from api.metrics import DB_READ_REQUESTS, REQUEST_LATENCY, REQUEST_QUERIES, \
+    REQUESTS, registry
+from api.profiling import Profile, current_profile
+from api.routers import ReplicaRouter, RequestRouting, current_routing, \
+    request_user_id
+
+logger = logging.getLogger('api.profiling')
+
+
+class QueryCounter:
+    def __init__(self):
+        self.queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+
+        return execute(sql, params, many, context)
+
+
+def wrap_connections(stack, wrapper):
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(wrapper))
+
+
+class AsyncConnectionWrapper:
+    def __init__(self, wrapper):
+        self.wrapper = wrapper
+        self.stack = ExitStack()
+
+    async def __aenter__(self):
+        await sync_to_async(wrap_connections)(self.stack, self.wrapper)
+
+    async def __aexit__(self, *exc_info):
+        await sync_to_async(self.stack.close)()
+
+
+class HybridMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        return self.handle(request)
+
+
+class MetricsMiddleware(HybridMiddleware):
+    def handle(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        counter = QueryCounter()
+        started = time.perf_counter()
+
+        with ExitStack() as stack:
+            wrap_connections(stack, counter)
+            response = self.get_response(request)
+
+        return self.observe(request, response, counter, started)
+
+    async def __acall__(self, request):
+        if not settings.METRICS_ENABLED:
+            return await self.get_response(request)
+
+        counter = QueryCounter()
+        started = time.perf_counter()
+
+        async with AsyncConnectionWrapper(counter):
+            response = await self.get_response(request)
+
+        return self.observe(request, response, counter, started)
+
+    @staticmethod
+    def observe(request, response, counter, started):
+        match = request.resolver_match
+        url_name = (match.url_name if match else None) or 'unmatched'
+
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - started,
+            url_name=url_name, method=request.method
+        )
+        REQUESTS.inc(
+            url_name=url_name, method=request.method,
+            status=response.status_code
+        )
+        REQUEST_QUERIES.observe(counter.queries, url_name=url_name)
+        registry.maybe_flush()
+
+        return response
+
+
+class ProfilingMiddleware(HybridMiddleware):
+    @staticmethod
+    def sampled():
+        rate = settings.PROFILING_SAMPLE_RATE
+
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    def handle(self, request):
+        if not self.sampled():
+            return self.get_response(request)
+
+        profile = Profile()
+        request._profile = profile
+        token = current_profile.set(profile)
+
+        try:
+            with ExitStack() as stack:
+                wrap_connections(stack, profile)
+                response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+
+        return self.finish(request, response, profile)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        profile = Profile()
+        request._profile = profile
+        token = current_profile.set(profile)
+
+        try:
+            async with AsyncConnectionWrapper(profile):
+                response = await self.get_response(request)
+        finally:
+            current_profile.reset(token)
+
+        return self.finish(request, response, profile)
+
+    def finish(self, request, response, profile):
+        response['Server-Timing'] = profile.server_timing()
+        response['X-Query-Count'] = str(profile.queries)
+        self.log(request, response, profile)
+
+        return response
+
+    def process_template_response(self, request, response):
+        profile = getattr(request, '_profile', None)
+
+        if profile is not None:
+            started = profile.elapsed()
+            response.add_post_render_callback(
+                lambda rendered: self.rendered(profile, started)
+            )
+
+        return response
+
+    @staticmethod
+    def rendered(profile, started):
+        profile.phases['render'] += profile.elapsed() - started
+
+    @staticmethod
+    def log(request, response, profile):
+        match = request.resolver_match
+
+        logger.info(json.dumps({
+            'event': 'request_profile',
+            'method': request.method,
+            'path': request.path,
+            'url_name': match.url_name if match else None,
+            'status': response.status_code,
+            'queries': profile.queries,
+            'total_ms': round(profile.elapsed() * 1000, 2),
+            **{
+                f'{phase}_ms': round(seconds * 1000, 2)
+                for phase, seconds in profile.phases.items()
+            },
+        }))
+
+
+class ReplicaMiddleware(HybridMiddleware):
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def handle(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        routing, token = self.route(request)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            current_routing.reset(token)
+
+        return self.finish(request, response, routing)
+
+    async def __acall__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+
+        routing, token = self.route(request)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_routing.reset(token)
+
+        return self.finish(request, response, routing)
+
+    def route(self, request):
+        replica = (
+            ReplicaRouter.choose_replica()
+            if request.method in self.SAFE_METHODS else None
+        )
+        routing = RequestRouting(request, replica)
+
+        return routing, current_routing.set(routing)
+
+    def finish(self, request, response, routing):
+        if routing.wrote and response.status_code < 400:
+            user_id = request_user_id(request)
+            if user_id is not None:
+                ReplicaRouter.pin(user_id)
+
+        DB_READ_REQUESTS.inc(alias=routing.database())
+
+        return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 23:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('student', 'Student'), ('teacher', 'Teacher')], db_index=True, max_length=20),
+        ),
+    ]
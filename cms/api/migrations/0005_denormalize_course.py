@@ -0,0 +1,98 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+BACKFILL = [
+    ('Assignment', 'Lecture', 'lecture_id'),
+    ('Submission', 'Assignment', 'assignment_id'),
+    ('Grade', 'Submission', 'submission_id'),
+    ('Comment', 'Submission', 'submission_id'),
+]
+
+
+def backfill_course(apps, schema_editor):
+    for model_name, parent_name, parent_field in BACKFILL:
+        model = apps.get_model('api', model_name)
+        parent = apps.get_model('api', parent_name)
+        course = Subquery(
+            parent.objects.filter(
+                pk=OuterRef(parent_field)
+            ).values('course_id')[:1]
+        )
+        bounds = model.objects.aggregate(
+            low=models.Min('pk'), high=models.Max('pk')
+        )
+
+        if bounds['low'] is None:
+            continue
+
+        for start in range(bounds['low'], bounds['high'] + 1, BATCH_SIZE):
+            model.objects.filter(
+                pk__gte=start,
+                pk__lt=start + BATCH_SIZE,
+                course__isnull=True
+            ).update(course_id=course)
+
+
+def course_field(related_name, null):
+    return models.ForeignKey(
+        editable=False,
+        null=null,
+        on_delete=django.db.models.deletion.CASCADE,
+        related_name=related_name,
+        to='api.course'
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('api', '0004_stored_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignment',
+            name='course',
+            field=course_field('assignments', null=True),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='course',
+            field=course_field('submissions', null=True),
+        ),
+        migrations.AddField(
+            model_name='grade',
+            name='course',
+            field=course_field('grades', null=True),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='course',
+            field=course_field('comments', null=True),
+        ),
+        migrations.RunPython(backfill_course, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='assignment',
+            name='course',
+            field=course_field('assignments', null=False),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='course',
+            field=course_field('submissions', null=False),
+        ),
+        migrations.AlterField(
+            model_name='grade',
+            name='course',
+            field=course_field('grades', null=False),
+        ),
+        migrations.AlterField(
+            model_name='comment',
+            name='course',
+            field=course_field('comments', null=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:45
+
+import api.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_user_email_lower'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lecture',
+            name='file_name',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='file_name',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='lecture',
+            name='file',
+            field=api.storage.BlobFileField(name_field='file_name', storage=api.storage.upload_storage, upload_to='lectures/'),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='file',
+            field=api.storage.BlobFileField(name_field='file_name', storage=api.storage.upload_storage, upload_to='submissions/'),
+        ),
+    ]
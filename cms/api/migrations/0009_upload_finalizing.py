@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_original_file_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadsession',
+            name='finalizing',
+            field=models.BooleanField(default=False),
+        ),
+    ]
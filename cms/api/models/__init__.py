@@ -6,6 +6,8 @@ from .assignment import Assignment
 from .submission import Submission
 from .comment import Comment
 from .grade import Grade
+from .upload import UploadSession
+from .blob import StoredBlob
 
 
 __all__ = [
@@ -16,5 +18,7 @@ __all__ = [
     'Assignment',
     'Submission',
     'Comment',
-    'Grade'
+    'Grade',
+    'UploadSession',
+    'StoredBlob'
 ]
@@ -1,4 +1,5 @@
 from django.db import models
+from .course import Course
 from .lecture import Lecture
 
 
@@ -8,8 +9,20 @@ class Assignment(models.Model):
         on_delete=models.CASCADE,
         related_name='assignments'
     )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='assignments',
+        editable=False
+    )
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        self.course_id = self.lecture.course_id
+
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f'{self.title} (Lecture: {self.lecture.topic})'
@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class StoredBlob(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField()
+    refcount = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.name} ({self.refcount} references)'
@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.db import models
 
+from .course import Course
 from .submission import Submission
 
 
@@ -10,12 +11,24 @@ class Comment(models.Model):
         on_delete=models.CASCADE,
         related_name='comments'
     )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='comments',
+        editable=False
+    )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name='comments'
     )
     content = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        self.course_id = self.submission.course_id
+
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return (
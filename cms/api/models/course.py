@@ -17,6 +17,7 @@ class Course(models.Model):
         through='Enrollment',
         related_name='course_enrolled'
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
@@ -2,6 +2,7 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 from django.conf import settings
 
+from .course import Course
 from .submission import Submission
 
 
@@ -11,6 +12,12 @@ class Grade(models.Model):
         on_delete=models.CASCADE,
         related_name='grade'
     )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='grades',
+        editable=False
+    )
     teacher = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -20,11 +27,14 @@ class Grade(models.Model):
     score = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(0), MaxValueValidator(100)]
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def save(self, *args, **kwargs):
         if not (0 <= self.score <= 100):
             raise ValueError('Score must be between 0 and 100')
 
+        self.course_id = self.submission.course_id
+
         super().save(*args, **kwargs)
 
     def __str__(self):
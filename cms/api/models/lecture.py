@@ -1,5 +1,6 @@
 from django.db import models
 from api.models import Course
+from api.storage import BlobFileField, upload_storage
 
 
 class Lecture(models.Model):
@@ -9,7 +10,13 @@ class Lecture(models.Model):
         related_name='lectures'
     )
     topic = models.CharField(max_length=255)
-    file = models.FileField(upload_to='lectures/')
+    file = BlobFileField(
+        upload_to='lectures/',
+        storage=upload_storage,
+        name_field='file_name'
+    )
+    file_name = models.CharField(max_length=255, blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.topic
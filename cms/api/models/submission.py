@@ -1,7 +1,9 @@
 from django.db import models
 from django.conf import settings
 
+from api.storage import BlobFileField, upload_storage
 from .assignment import Assignment
+from .course import Course
 
 
 class Submission(models.Model):
@@ -16,7 +18,24 @@ class Submission(models.Model):
         on_delete=models.CASCADE,
         related_name='submissions'
     )
-    file = models.FileField(upload_to='submissions/')
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='submissions',
+        editable=False
+    )
+    file = BlobFileField(
+        upload_to='submissions/',
+        storage=upload_storage,
+        name_field='file_name'
+    )
+    file_name = models.CharField(max_length=255, blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        self.course_id = self.assignment.course_id
+
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Submission by {self.user.email} for {self.assignment.title}"
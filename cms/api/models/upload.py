@@ -0,0 +1,49 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from .assignment import Assignment
+from .course import Course
+
+
+class UploadSession(models.Model):
+    LECTURE = 'lecture'
+    SUBMISSION = 'submission'
+    KIND_CHOICES = [
+        (LECTURE, 'Lecture'),
+        (SUBMISSION, 'Submission'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions'
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    received = models.PositiveBigIntegerField(default=0)
+    checksum = models.CharField(max_length=64, blank=True)
+    finalizing = models.BooleanField(default=False)
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='upload_sessions'
+    )
+    topic = models.CharField(max_length=255, blank=True)
+    assignment = models.ForeignKey(
+        Assignment,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='upload_sessions'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self):
+        return f'{self.kind} upload {self.filename} ({self.received}/{self.size})'
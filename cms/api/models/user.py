@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import BaseUserManager, AbstractBaseUser
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models.functions import Lower
 
 from api.factories.roles import UserRoleFactory
 
@@ -34,7 +35,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(unique=True)
     role = models.CharField(
         max_length=20,
-        choices=UserRoleFactory.choices()
+        choices=UserRoleFactory.choices(),
+        db_index=True
     )
 
     is_staff = models.BooleanField(default=False)
@@ -45,5 +47,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [models.Index(Lower('email'), name='api_user_email_lower')]
+
     def __str__(self):
         return f'{self.first_name} {self.last_name} ({self.email})'
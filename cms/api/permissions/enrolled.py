@@ -1,27 +1,73 @@
 from rest_framework.permissions import BasePermission
 
-from api.models import Lecture, Course, Assignment, Submission, Enrollment
+from api.models import Lecture, Course, Assignment, Submission, Grade, \
+    Comment
+from api.services.enrollment import EnrollmentService
 
 
 class IsEnrolled(BasePermission):
     @staticmethod
-    def user_has_access(user, course):
-        return Enrollment.objects.filter(
-            user=user,
-            course=course
-        ).exists()
+    def course_access(request):
+        access = getattr(request, '_course_access', None)
 
-    def has_object_permission(self, request, view, obj):
+        if access is None:
+            access = EnrollmentService.course_access(request.user.id)
+            request._course_access = access
+
+        return access
+
+    @staticmethod
+    async def acourse_access(request):
+        access = getattr(request, '_course_access', None)
+
+        if access is None:
+            access = await EnrollmentService.acourse_access(request.user.id)
+            request._course_access = access
+
+        return access
+
+    @classmethod
+    def course_ids(cls, request):
+        return cls.course_access(request).enrolled
+
+    @classmethod
+    async def acourse_ids(cls, request):
+        return (await cls.acourse_access(request)).enrolled
+
+    @classmethod
+    def accessible_course_ids(cls, request):
+        access = cls.course_access(request)
+
+        return access.enrolled | access.owned
+
+    @classmethod
+    def accessible_courses(cls, request):
+        return Course.objects.filter(
+            id__in=cls.course_ids(request)
+        ).order_by('id')
+
+    @classmethod
+    def has_course_access(cls, request, course_id):
+        return course_id in cls.course_ids(request)
+
+    @classmethod
+    async def ahas_course_access(cls, request, course_id):
+        return course_id in await cls.acourse_ids(request)
+
+    @staticmethod
+    def course_id_of(obj):
         match obj:
-            case Lecture():
-                course = obj.course
             case Course():
-                course = obj
-            case Assignment():
-                course = obj.lecture.course
-            case Submission():
-                course = obj.assignment.lecture.course
-            case _:
-                return False
-
-        return self.user_has_access(request.user, course)
+                return obj.pk
+            case Lecture() | Assignment() | Submission() | Grade() | Comment():
+                return obj.course_id
+
+        return None
+
+    def has_object_permission(self, request, view, obj):
+        course_id = self.course_id_of(obj)
+
+        if course_id is None:
+            return False
+
+        return self.has_course_access(request, course_id)
@@ -3,11 +3,11 @@ from rest_framework.permissions import BasePermission
 
 class IsOwner(BasePermission):
     def has_object_permission(self, request, view, obj):
-        if hasattr(obj, 'owner'):
-            return obj.owner == request.user
-        elif hasattr(obj, 'user'):
-            return obj.user == request.user
-        elif hasattr(obj, 'teacher'):
-            return obj.submission.user == request.user
+        if hasattr(obj, 'owner_id'):
+            return obj.owner_id == request.user.id
+        elif hasattr(obj, 'user_id'):
+            return obj.user_id == request.user.id
+        elif hasattr(obj, 'teacher_id'):
+            return obj.submission.user_id == request.user.id
 
         return False
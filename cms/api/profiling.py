@@ -0,0 +1,80 @@
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from rest_framework.serializers import BaseSerializer
+from rest_framework.views import APIView
+
+current_profile = ContextVar('current_profile', default=None)
+
+
+class Profile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.phases = {'db': 0.0, 'perm': 0.0, 'serialize': 0.0, 'render': 0.0}
+        self.depth = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.phases['db'] += time.perf_counter() - started
+
+    def measure(self, phase, func, *args, **kwargs):
+        if self.depth.get(phase):
+            return func(*args, **kwargs)
+
+        self.depth[phase] = 1
+        started = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.phases[phase] += time.perf_counter() - started
+            self.depth[phase] = 0
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self):
+        entries = [
+            f'{phase};dur={seconds * 1000:.2f}'
+            + (f';desc="{self.queries} queries"' if phase == 'db' else '')
+            for phase, seconds in self.phases.items()
+        ]
+        entries.append(f'total;dur={self.elapsed() * 1000:.2f}')
+
+        return ', '.join(entries)
+
+
+def profiled(phase, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = current_profile.get()
+
+        if profile is None:
+            return func(*args, **kwargs)
+
+        return profile.measure(phase, func, *args, **kwargs)
+
+    return wrapper
+
+
+def install():
+    if getattr(BaseSerializer, '_profiled', False):
+        return
+
+    BaseSerializer.data = property(
+        profiled('serialize', BaseSerializer.data.fget)
+    )
+    APIView.check_permissions = profiled(
+        'perm', APIView.check_permissions
+    )
+    APIView.check_object_permissions = profiled(
+        'perm', APIView.check_object_permissions
+    )
+    BaseSerializer._profiled = True
@@ -0,0 +1,241 @@
+import asyncio
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from importlib.util import find_spec
+
+from django.conf import settings
+
+from api.loadtest import API_PREFIX, Recorder, compare, summarize
+
+MODES = {'wsgi': False, 'asgi': True}
+
+CONNECTION_MODES = {
+    'per-request': {'DB_POOL': 'False', 'DB_CONN_MAX_AGE': '0'},
+    'persistent': {'DB_POOL': 'False', 'DB_CONN_MAX_AGE': '60'},
+    'pool': {'DB_POOL': 'True'},
+}
+
+BENCH_SCRIPT = (
+    'import django\n'
+    'django.setup()\n'
+    'from api.readbench import serve\n'
+    'serve()\n'
+)
+
+
+def read_paths(course_id, lecture_id):
+    return [
+        'courses/',
+        f'courses/{course_id}/',
+        f'lectures/course/{course_id}/',
+        f'lectures/{lecture_id}/',
+        f'assignments/lecture/{lecture_id}/',
+    ]
+
+
+def run_wsgi(plan, recorder):
+    from cms.wsgi import application
+
+    workers = threading.BoundedSemaphore(plan['threads'])
+
+    def request(token, path):
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'QUERY_STRING': '',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '80',
+            'HTTP_HOST': 'localhost',
+            'HTTP_AUTHORIZATION': f'Bearer {token}',
+            'wsgi.input': io.BytesIO(),
+            'wsgi.errors': sys.stderr,
+            'wsgi.url_scheme': 'http',
+        }
+        result = {}
+
+        def start_response(status, headers, exc_info=None):
+            result['status'] = int(status.split()[0])
+            result['headers'] = dict(headers)
+
+        started = time.perf_counter()
+        with workers:
+            response = application(environ, start_response)
+            b''.join(response)
+            response.close()
+        recorder.add(
+            'GET', path, result['status'], time.perf_counter() - started,
+            int(result['headers'].get('X-Query-Count', 0))
+        )
+
+    def client(user):
+        for index in range(plan['requests']):
+            request(user['token'], user['paths'][index % len(user['paths'])])
+
+    threads = [
+        threading.Thread(target=client, args=(user,), daemon=True)
+        for user in plan['users']
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_asgi(plan, recorder):
+    from cms.asgi import application
+
+    async def request(token, path):
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': b'',
+            'headers': [
+                (b'host', b'localhost'),
+                (b'authorization', f'Bearer {token}'.encode()),
+            ],
+            'server': ('localhost', 80),
+            'client': ('127.0.0.1', 0),
+        }
+        disconnected = asyncio.Event()
+        requested = False
+        messages = []
+
+        async def receive():
+            nonlocal requested
+
+            if not requested:
+                requested = True
+                return {'type': 'http.request', 'body': b''}
+
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+
+        started = time.perf_counter()
+        await application(scope, receive, send)
+        latency = time.perf_counter() - started
+        disconnected.set()
+
+        start = next(
+            m for m in messages if m['type'] == 'http.response.start'
+        )
+        headers = dict(start['headers'])
+        recorder.add(
+            'GET', path, start['status'], latency,
+            int(headers.get(b'X-Query-Count', 0))
+        )
+
+    async def client(user):
+        for index in range(plan['requests']):
+            await request(
+                user['token'], user['paths'][index % len(user['paths'])]
+            )
+
+    async def main():
+        await asyncio.gather(*(client(user) for user in plan['users']))
+
+    asyncio.run(main())
+
+
+def serve():
+    plan = json.load(sys.stdin)
+    recorder = Recorder()
+    logging.getLogger('api.profiling').disabled = True
+    runner = run_asgi if plan['mode'] == 'asgi' else run_wsgi
+
+    started = time.monotonic()
+    runner(plan, recorder)
+    elapsed = time.monotonic() - started
+
+    json.dump({
+        'meta': {
+            'mode': plan['mode'],
+            'clients': len(plan['users']),
+            'requests_per_client': plan['requests'],
+            'threads': plan['threads'] if plan['mode'] == 'wsgi' else None,
+            'duration_s': round(elapsed, 2),
+        },
+        'endpoints': summarize(recorder.samples, elapsed),
+    }, sys.stdout)
+
+
+def run_mode(mode, users, requests, threads, database=None, env=None):
+    env = dict(
+        os.environ,
+        ASYNC_READ_VIEWS=str(MODES[mode]),
+        PROFILING_SAMPLE_RATE='1',
+        METRICS_ENABLED='False',
+        **(env or {}),
+    )
+    if database:
+        env['DB_NAME'] = database
+
+    plan = {
+        'mode': mode,
+        'requests': requests,
+        'threads': threads,
+        'users': [
+            {**user, 'paths': [f'{API_PREFIX}{p}' for p in user['paths']]}
+            for user in users
+        ],
+    }
+    result = subprocess.run(
+        [sys.executable, '-c', BENCH_SCRIPT], input=json.dumps(plan),
+        capture_output=True, text=True, env=env, cwd=settings.BASE_DIR
+    )
+
+    if result.returncode:
+        raise RuntimeError(
+            f'{mode} benchmark failed:\n{result.stderr[-2000:]}'
+        )
+
+    return json.loads(result.stdout)
+
+
+def benchmark(users, requests=20, threads=8, database=None):
+    reports = {
+        mode: run_mode(mode, users, requests, threads, database)
+        for mode in MODES
+    }
+    reports['comparison'] = compare(reports['wsgi'], reports['asgi'])
+
+    return reports
+
+
+def connection_modes():
+    return [
+        name for name in CONNECTION_MODES
+        if name != 'pool' or find_spec('psycopg_pool') is not None
+    ]
+
+
+def connection_benchmark(users, requests=20, threads=8, database=None,
+                         mode='wsgi', names=None):
+    names = names or connection_modes()
+    reports = {}
+
+    for name in names:
+        reports[name] = run_mode(
+            mode, users, requests, threads, database, CONNECTION_MODES[name]
+        )
+        reports[name]['meta']['connections'] = name
+
+    reports['comparison'] = {
+        name: compare(reports[names[0]], reports[name])
+        for name in names[1:]
+    }
+
+    return reports
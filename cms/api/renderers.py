@@ -0,0 +1,33 @@
+import csv
+import io
+
+from rest_framework.renderers import BaseRenderer
+
+
+class GradebookCSVRenderer(BaseRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if 'scores' not in data:
+            writer.writerows(data.items())
+            return buffer.getvalue()
+
+        writer.writerow(
+            ['student_id', 'email', *data['assignments']['title']]
+        )
+        for user_id, email, scores in zip(
+            data['students']['id'],
+            data['students']['email'],
+            data['scores']
+        ):
+            writer.writerow([
+                user_id, email,
+                *('' if score is None else score for score in scores)
+            ])
+
+        return buffer.getvalue()
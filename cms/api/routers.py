@@ -0,0 +1,101 @@
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import LazyObject, empty
+
+current_routing = ContextVar('current_routing', default=None)
+primary_only = ContextVar('primary_only', default=False)
+
+
+@contextmanager
+def use_primary():
+    token = primary_only.set(True)
+
+    try:
+        yield
+    finally:
+        primary_only.reset(token)
+
+
+def request_user_id(request):
+    user = getattr(request, 'user', None)
+
+    if user is None or (
+        isinstance(user, LazyObject) and user._wrapped is empty
+    ):
+        return None
+
+    return user.pk if user.is_authenticated else None
+
+
+class RequestRouting:
+    def __init__(self, request, replica):
+        self.request = request
+        self.replica = replica
+        self.user_id = None
+        self.wrote = False
+
+    def database(self):
+        if self.replica is not None:
+            user_id = request_user_id(self.request)
+
+            if user_id is not None and user_id != self.user_id:
+                self.user_id = user_id
+                if ReplicaRouter.is_pinned(user_id):
+                    self.replica = None
+
+        return self.replica or DEFAULT_DB_ALIAS
+
+
+class ReplicaRouter:
+    PIN_KEY = 'db-primary:{user_id}'
+
+    _counter = itertools.count()
+
+    @classmethod
+    def choose_replica(cls):
+        replicas = settings.DATABASE_REPLICAS
+
+        return replicas[next(cls._counter) % len(replicas)] if replicas \
+            else None
+
+    @classmethod
+    def pin(cls, user_id):
+        cache.set(
+            cls.PIN_KEY.format(user_id=user_id), True,
+            settings.DB_REPLICA_PIN_SECONDS
+        )
+
+    @classmethod
+    def is_pinned(cls, user_id):
+        return bool(cache.get(cls.PIN_KEY.format(user_id=user_id)))
+
+    def db_for_read(self, model, **hints):
+        routing = current_routing.get()
+
+        if (
+            routing is None or primary_only.get() or
+            connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+
+        return routing.database()
+
+    def db_for_write(self, model, **hints):
+        routing = current_routing.get()
+
+        if routing is not None:
+            routing.replica = None
+            routing.wrote = True
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
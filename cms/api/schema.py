@@ -0,0 +1,153 @@
+import hashlib
+import os
+import threading
+from functools import cache
+from pathlib import Path
+
+import drf_yasg
+import rest_framework
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.renderers import OpenAPIRenderer, SwaggerJSONRenderer, \
+    SwaggerYAMLRenderer
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+from api.docs import load_swagger_schemas
+
+SOURCE_PACKAGES = ('api', 'cms')
+
+SPEC_FORMATS = {
+    OpenAPIRenderer: 'json',
+    SwaggerJSONRenderer: 'json',
+    SwaggerYAMLRenderer: 'yaml',
+}
+
+API_INFO = openapi.Info(
+    title="CMS API",
+    default_version='v1',
+    description="API documentation for CMS project",
+)
+
+
+class DeferredSchemaGenerator(OpenAPISchemaGenerator):
+    def get_endpoints(self, request):
+        endpoints = super().get_endpoints(request)
+        load_swagger_schemas()
+
+        return endpoints
+
+
+SchemaView = get_schema_view(
+    API_INFO,
+    public=True,
+    generator_class=DeferredSchemaGenerator,
+    permission_classes=[permissions.AllowAny],
+)
+
+
+class SchemaDocument:
+    CODECS = {'json': OpenAPICodecJson, 'yaml': OpenAPICodecYaml}
+
+    _documents = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    @cache
+    def code_version():
+        if settings.CODE_VERSION:
+            return settings.CODE_VERSION
+
+        digest = hashlib.sha256(
+            f'{drf_yasg.__version__}:{rest_framework.VERSION}'.encode()
+        )
+        base_dir = Path(settings.BASE_DIR)
+
+        for package in SOURCE_PACKAGES:
+            for path in sorted((base_dir / package).rglob('*.py')):
+                if 'tests' in path.parts or 'migrations' in path.parts:
+                    continue
+                digest.update(path.relative_to(base_dir).as_posix().encode())
+                digest.update(path.read_bytes())
+
+        return digest.hexdigest()[:16]
+
+    @classmethod
+    def path(cls, fmt):
+        return (
+            Path(settings.OPENAPI_SCHEMA_ROOT)
+            / f'openapi-{cls.code_version()}.{fmt}'
+        )
+
+    @staticmethod
+    def generate():
+        generator = SchemaView.generator_class(API_INFO)
+
+        return generator.get_schema(request=None, public=True)
+
+    @classmethod
+    def write(cls, schema=None):
+        schema = schema or cls.generate()
+        paths = []
+
+        for fmt, codec in cls.CODECS.items():
+            path = cls.path(fmt)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            tmp.write_bytes(codec(validators=[]).encode(schema))
+            os.replace(tmp, path)
+            paths.append(path)
+
+        return paths
+
+    @classmethod
+    def get(cls, fmt):
+        key = (cls.code_version(), fmt)
+        document = cls._documents.get(key)
+
+        if document is not None:
+            return document
+
+        with cls._lock:
+            if key not in cls._documents:
+                path = cls.path(fmt)
+                if not path.exists():
+                    cls.write()
+
+                content = path.read_bytes()
+                etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+                cls._documents[key] = (content, etag)
+
+        return cls._documents[key]
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._documents.clear()
+
+
+class CachedSchemaView(SchemaView):
+    def get(self, request, version='', format=None):
+        renderer = request.accepted_renderer
+        fmt = next((
+            fmt for renderer_class, fmt in SPEC_FORMATS.items()
+            if isinstance(renderer, renderer_class)
+        ), None)
+
+        if fmt is None:
+            return super().get(request, version, format)
+
+        content, etag = SchemaDocument.get(fmt)
+        response = get_conditional_response(request, etag=etag)
+
+        if response is None:
+            response = HttpResponse(content, content_type=renderer.media_type)
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, no-cache'
+
+        return response
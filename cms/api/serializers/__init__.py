@@ -4,7 +4,8 @@ from .enrollment import EnrollmentSerializer
 from .lecture import LectureSerializer
 from .assignment import AssignmentSerializer
 from .submission import SubmissionSerializer
-from .grade import GradeSerializer
+from .grade import GradeSerializer, GradeBatchSerializer
+from .upload import UploadSessionSerializer
 
 
 __all__ = [
@@ -17,5 +18,7 @@ __all__ = [
     'AssignmentSerializer',
     'SubmissionSerializer',
     'GradeSerializer',
+    'GradeBatchSerializer',
+    'UploadSessionSerializer',
     ''
 ]
@@ -7,3 +7,11 @@ class AssignmentSerializer(serializers.ModelSerializer):
         model = Assignment
         fields = ['id', 'title', 'description']
         read_only_fields = ['id']
+
+    @staticmethod
+    def eager_lookups():
+        return []
+
+    @staticmethod
+    def version_querysets(queryset):
+        return [queryset]
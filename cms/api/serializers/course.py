@@ -1,5 +1,6 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
-from api.models import Course
+from api.models import Assignment, Course, Enrollment, Lecture
 from .lecture import LectureSerializer
 from .user import UserSerializer
 from ..services.course import CourseService
@@ -42,10 +43,42 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             'students'
         ]
 
+    @staticmethod
+    def eager_lookups():
+        return [
+            Prefetch(
+                'lectures',
+                queryset=Lecture.objects.order_by('id')
+            ),
+            'lectures__assignments',
+            Prefetch(
+                'enrollments',
+                queryset=Enrollment.objects.select_related('user')
+            ),
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.prefetch_related(*cls.eager_lookups())
+
+    @staticmethod
+    def version_querysets(queryset):
+        course_ids = queryset.values('pk')
+
+        return [
+            queryset,
+            Lecture.objects.filter(course__in=course_ids),
+            Assignment.objects.filter(course__in=course_ids),
+            Enrollment.objects.filter(course__in=course_ids),
+        ]
+
+    def _users_with_role(self, obj, role):
+        return [e.user for e in obj.enrollments.all() if e.user.role == role]
+
     def get_teachers(self, obj):
-        enrollments = obj.enrollments.filter(user__role__iexact='teacher')
-        return UserSerializer([e.user for e in enrollments], many=True).data
+        users = self._users_with_role(obj, 'teacher')
+        return UserSerializer(users, many=True).data
 
     def get_students(self, obj):
-        enrollments = obj.enrollments.filter(user__role__iexact='student')
-        return UserSerializer([e.user for e in enrollments], many=True).data
+        users = self._users_with_role(obj, 'student')
+        return UserSerializer(users, many=True).data
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+
+class DownloadFileField(serializers.FileField):
+    def __init__(self, view_name, **kwargs):
+        self.view_name = view_name
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+
+        return reverse(
+            self.view_name, kwargs={'pk': value.instance.pk},
+            request=self.context.get('request')
+        )
@@ -15,3 +15,23 @@ class GradeSerializer(serializers.ModelSerializer):
             )
 
         return value
+
+
+class GradeBatchItemSerializer(serializers.Serializer):
+    submission = serializers.IntegerField(min_value=1)
+    score = serializers.IntegerField(min_value=0, max_value=100)
+
+
+class GradeBatchSerializer(serializers.Serializer):
+    assignment = serializers.IntegerField(min_value=1)
+    grades = GradeBatchItemSerializer(many=True, allow_empty=False)
+
+    def validate_grades(self, value):
+        submission_ids = [item['submission'] for item in value]
+
+        if len(submission_ids) != len(set(submission_ids)):
+            raise serializers.ValidationError(
+                'Each submission can only be graded once per batch'
+            )
+
+        return value
@@ -1,9 +1,23 @@
 from rest_framework import serializers
-from api.models import Lecture
+from api.models import Assignment, Lecture
+from .fields import DownloadFileField
 
 
 class LectureSerializer(serializers.ModelSerializer):
+    file = DownloadFileField('lecture-file')
+
     class Meta:
         model = Lecture
         fields = ['id', 'course', 'topic', 'file', 'assignments']
         read_only_fields = ['id', 'assignments']
+
+    @staticmethod
+    def eager_lookups():
+        return ['assignments']
+
+    @staticmethod
+    def version_querysets(queryset):
+        return [
+            queryset,
+            Assignment.objects.filter(lecture__in=queryset.values('pk')),
+        ]
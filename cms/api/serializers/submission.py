@@ -1,12 +1,14 @@
 from rest_framework import serializers
 from api.models import Submission, Assignment
 from api.services.submission import SubmissionService
+from .fields import DownloadFileField
 
 
 class SubmissionSerializer(serializers.ModelSerializer):
     assignment = serializers.PrimaryKeyRelatedField(
         queryset=Assignment.objects.all()
     )
+    file = DownloadFileField('submission-file')
 
     class Meta:
         model = Submission
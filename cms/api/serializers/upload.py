@@ -0,0 +1,51 @@
+from django.conf import settings
+from rest_framework import serializers
+from api.models import Assignment, UploadSession
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    assignment = serializers.PrimaryKeyRelatedField(
+        queryset=Assignment.objects.all(),
+        required=False,
+        allow_null=True
+    )
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            'id',
+            'kind',
+            'filename',
+            'size',
+            'received',
+            'checksum',
+            'course',
+            'topic',
+            'assignment'
+        ]
+        read_only_fields = ['id', 'received']
+
+    def validate_size(self, value):
+        if not (0 < value <= settings.UPLOAD_MAX_SIZE):
+            raise serializers.ValidationError(
+                f'Size must be between 1 and {settings.UPLOAD_MAX_SIZE} bytes'
+            )
+
+        return value
+
+    def validate(self, data):
+        if data['kind'] == UploadSession.LECTURE:
+            if not data.get('course') or not data.get('topic'):
+                raise serializers.ValidationError(
+                    'course and topic are required for lecture uploads'
+                )
+            data['assignment'] = None
+        elif not data.get('assignment'):
+            raise serializers.ValidationError(
+                'assignment is required for submission uploads'
+            )
+        else:
+            data['course'] = None
+            data['topic'] = ''
+
+        return data
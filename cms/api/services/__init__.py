@@ -1,8 +1,16 @@
 from .user import UserService
 from .comment import CommentService
+from .enrollment import EnrollmentService
+from .grade import GradeService
+from .gradebook import GradebookService
+from .upload import UploadService
 
 
 __all__ = [
     'UserService',
     'CommentService',
+    'EnrollmentService',
+    'GradeService',
+    'GradebookService',
+    'UploadService',
 ]
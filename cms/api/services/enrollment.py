@@ -0,0 +1,209 @@
+import uuid
+from collections import namedtuple
+
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Lower
+
+from api.metrics import CACHE_REQUESTS
+from api.services.gradebook import GradebookService
+from api.models import Course, Enrollment, User
+from api.routers import use_primary
+
+
+CourseAccess = namedtuple('CourseAccess', ['enrolled', 'owned'])
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class EnrollmentService:
+    CACHE_KEY = 'enrollment:access:{user_id}'
+    VERSION_KEY = 'enrollment:version:{user_id}'
+    BULK_CHUNK_SIZE = 1000
+
+    @classmethod
+    def _cache_key(cls, user_id):
+        return cls.CACHE_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def course_access_rows(user_id):
+        enrolled = Enrollment.objects.filter(user_id=user_id).annotate(
+            owned=Value(False)
+        ).values_list('course_id', 'owned')
+        owned = Course.objects.filter(owner_id=user_id).annotate(
+            owned=Value(True)
+        ).values_list('id', 'owned')
+
+        return enrolled.union(owned, all=True)
+
+    @staticmethod
+    def build_course_access(rows):
+        return CourseAccess(
+            enrolled=frozenset(pk for pk, is_owned in rows if not is_owned),
+            owned=frozenset(pk for pk, is_owned in rows if is_owned),
+        )
+
+    @classmethod
+    def load_course_access(cls, user_id):
+        with use_primary():
+            rows = list(cls.course_access_rows(user_id))
+
+        return cls.build_course_access(rows)
+
+    @classmethod
+    async def aload_course_access(cls, user_id):
+        with use_primary():
+            rows = [row async for row in cls.course_access_rows(user_id)]
+
+        return cls.build_course_access(rows)
+
+    @classmethod
+    def _cached_access(cls, access):
+        hit = access is not None
+        CACHE_REQUESTS.inc(
+            cache='enrollment', result='hit' if hit else 'miss'
+        )
+
+        return CourseAccess(*access) if hit else None
+
+    @classmethod
+    def course_access(cls, user_id):
+        key = cls._cache_key(user_id)
+        access = cls._cached_access(cache.get(key))
+
+        if access is None:
+            access = cls.load_course_access(user_id)
+            cache.set(key, tuple(access), settings.ENROLLMENT_CACHE_TIMEOUT)
+
+        return access
+
+    @classmethod
+    async def acourse_access(cls, user_id):
+        key = cls._cache_key(user_id)
+        access = cls._cached_access(await cache.aget(key))
+
+        if access is None:
+            access = await cls.aload_course_access(user_id)
+            await cache.aset(
+                key, tuple(access), settings.ENROLLMENT_CACHE_TIMEOUT
+            )
+
+        return access
+
+    @classmethod
+    def access_version(cls, user_id):
+        key = cls.VERSION_KEY.format(user_id=user_id)
+        version = cache.get(key)
+
+        if version is None:
+            version = uuid.uuid4().hex[:12]
+            if not cache.add(
+                key, version, settings.JWT_ACCESS_VERSION_TIMEOUT
+            ):
+                version = cache.get(key)
+
+        return version
+
+    @classmethod
+    async def aaccess_version(cls, user_id):
+        key = cls.VERSION_KEY.format(user_id=user_id)
+        version = await cache.aget(key)
+
+        if version is None:
+            version = uuid.uuid4().hex[:12]
+            if not await cache.aadd(
+                key, version, settings.JWT_ACCESS_VERSION_TIMEOUT
+            ):
+                version = await cache.aget(key)
+
+        return version
+
+    @classmethod
+    def invalidate(cls, *user_ids):
+        user_ids = [pk for pk in user_ids if pk is not None]
+
+        if not user_ids:
+            return
+
+        cache.delete_many([cls._cache_key(pk) for pk in user_ids])
+        cache.set_many({
+            cls.VERSION_KEY.format(user_id=pk): uuid.uuid4().hex[:12]
+            for pk in user_ids
+        }, settings.JWT_ACCESS_VERSION_TIMEOUT)
+
+    @classmethod
+    def bulk_enroll(cls, course, identifiers, field='id'):
+        model_field = User._meta.get_field(field)
+        key = Lower(field) if field == 'email' else F(field)
+        seen = set()
+
+        for chunk in _chunks(identifiers, cls.BULK_CHUNK_SIZE):
+            values = []
+
+            for identifier in chunk:
+                try:
+                    value = model_field.to_python(str(identifier).strip())
+                    model_field.run_validators(value)
+                except ValidationError:
+                    value = None
+
+                values.append(
+                    value.lower() if field == 'email' and value else value
+                )
+
+            users = dict(User.objects.annotate(key=key).filter(
+                key__in={v for v in values if v is not None}
+            ).values_list('key', 'id'))
+
+            with transaction.atomic():
+                enrolled = set(Enrollment.objects.filter(
+                    course=course,
+                    user_id__in=users.values()
+                ).values_list('user_id', flat=True))
+
+                new_user_ids = []
+                results = []
+
+                for identifier, value in zip(chunk, values):
+                    user_id = users.get(value)
+
+                    if value is None:
+                        status = 'invalid'
+                    elif user_id is None:
+                        status = 'not_found'
+                    elif user_id in seen:
+                        status = 'duplicate'
+                    elif user_id in enrolled:
+                        status = 'already_enrolled'
+                    else:
+                        status = 'enrolled'
+                        new_user_ids.append(user_id)
+
+                    if user_id is not None:
+                        seen.add(user_id)
+
+                    results.append({'user': identifier, 'status': status})
+
+                Enrollment.objects.bulk_create(
+                    [
+                        Enrollment(user_id=user_id, course=course)
+                        for user_id in new_user_ids
+                    ],
+                    ignore_conflicts=True
+                )
+
+            if new_user_ids:
+                cls.invalidate(*new_user_ids)
+                GradebookService.invalidate(course.id)
+
+            yield from results
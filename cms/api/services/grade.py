@@ -0,0 +1,31 @@
+from api.models import Grade, Submission
+
+
+class GradeService:
+    @staticmethod
+    def submission_courses(assignment_id, submission_ids):
+        return dict(
+            Submission.objects.filter(
+                assignment_id=assignment_id,
+                id__in=submission_ids
+            ).values_list('id', 'course_id')
+        )
+
+    @staticmethod
+    def upsert_grades(teacher, scores, courses):
+        grades = [
+            Grade(
+                submission_id=submission_id,
+                course_id=courses[submission_id],
+                teacher=teacher,
+                score=score
+            )
+            for submission_id, score in scores.items()
+        ]
+
+        return Grade.objects.bulk_create(
+            grades,
+            update_conflicts=True,
+            unique_fields=['submission'],
+            update_fields=['teacher', 'score', 'updated_at']
+        )
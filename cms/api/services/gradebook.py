@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+
+from api.metrics import CACHE_REQUESTS
+from api.models import Assignment, Enrollment, Grade
+from api.routers import use_primary
+
+
+class GradebookService:
+    CACHE_KEY = 'gradebook:{course_id}'
+
+    @classmethod
+    def gradebook(cls, course_id):
+        key = cls.CACHE_KEY.format(course_id=course_id)
+        gradebook = cache.get(key)
+
+        if gradebook is None:
+            CACHE_REQUESTS.inc(cache='gradebook', result='miss')
+            with use_primary():
+                gradebook = cls.build(course_id)
+            cache.set(key, gradebook, settings.GRADEBOOK_CACHE_TIMEOUT)
+        else:
+            CACHE_REQUESTS.inc(cache='gradebook', result='hit')
+
+        return gradebook
+
+    @classmethod
+    def invalidate(cls, *course_ids):
+        cache.delete_many([
+            cls.CACHE_KEY.format(course_id=course_id)
+            for course_id in course_ids
+            if course_id is not None
+        ])
+
+    @staticmethod
+    def build(course_id):
+        students = list(
+            Enrollment.objects.filter(
+                course_id=course_id,
+                user__role='student'
+            ).order_by('user_id').values_list('user_id', 'user__email')
+        )
+        assignments = list(
+            Assignment.objects.filter(course_id=course_id).order_by('id').values_list('id', 'title')
+        )
+        scores = Grade.objects.filter(course_id=course_id).values(
+            'submission__user_id', 'submission__assignment_id'
+        ).annotate(best=Max('score')).values_list(
+            'submission__user_id', 'submission__assignment_id', 'best'
+        ).order_by()
+
+        rows = {user_id: index for index, (user_id, _) in enumerate(students)}
+        columns = {
+            assignment_id: index
+            for index, (assignment_id, _) in enumerate(assignments)
+        }
+        matrix = [[None] * len(assignments) for _ in students]
+
+        for user_id, assignment_id, score in scores:
+            if user_id in rows and assignment_id in columns:
+                matrix[rows[user_id]][columns[assignment_id]] = score
+
+        return {
+            'course': course_id,
+            'students': {
+                'id': [user_id for user_id, _ in students],
+                'email': [email for _, email in students],
+            },
+            'assignments': {
+                'id': [assignment_id for assignment_id, _ in assignments],
+                'title': [title for _, title in assignments],
+            },
+            'scores': matrix,
+        }
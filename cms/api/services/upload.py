@@ -0,0 +1,215 @@
+import hashlib
+import threading
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from api.metrics import UPLOAD_BYTES
+from api.models import Lecture, Submission, UploadSession
+
+
+class UploadError(Exception):
+    pass
+
+
+class PartFile(File):
+    def __init__(self, file, name=None, sha256=None):
+        super().__init__(file, name)
+        self.sha256 = sha256
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+class UploadService:
+    BLOCK_SIZE = 1024 * 1024
+    MAX_DIGESTS = 1000
+
+    _digests = {}
+    _digests_lock = threading.Lock()
+
+    @staticmethod
+    def part_path(session):
+        return Path(settings.UPLOAD_SESSION_ROOT) / f'{session.pk}.part'
+
+    @staticmethod
+    def check_chunk(session, start, length):
+        if session.finalizing:
+            raise UploadError('Upload is being finalized')
+
+        if start > session.received:
+            raise UploadError(
+                f'Expected a chunk starting at byte {session.received}'
+            )
+
+        if start + length > session.size:
+            raise UploadError('Chunk extends past the declared size')
+
+    @classmethod
+    def write_chunk(cls, session_id, start, length, stream):
+        session = UploadSession.objects.get(pk=session_id)
+        cls.check_chunk(session, start, length)
+
+        path = cls.part_path(session)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = cls.running_digest(session, start)
+        written = 0
+
+        with open(path, 'r+b' if path.exists() else 'wb') as part:
+            part.seek(start)
+
+            while written < length:
+                block = stream.read(min(cls.BLOCK_SIZE, length - written))
+                if not block:
+                    break
+                part.write(block)
+                if digest is not None:
+                    digest.update(block)
+                written += len(block)
+
+        UPLOAD_BYTES.inc(written, kind='chunk')
+
+        if written != length:
+            raise UploadError('Chunk is shorter than its Content-Range')
+
+        with transaction.atomic():
+            session = UploadSession.objects.select_for_update().get(
+                pk=session_id
+            )
+            cls.check_chunk(session, start, length)
+            session.received = max(session.received, start + written)
+            session.save(update_fields=['received', 'updated_at'])
+
+        cls.keep_digest(session, start + written, digest)
+
+        return session
+
+    @classmethod
+    def running_digest(cls, session, start):
+        with cls._digests_lock:
+            entry = cls._digests.pop(session.pk, None)
+
+        if start == 0:
+            return hashlib.sha256()
+
+        if entry is None:
+            return None
+
+        updated_at, offset, digest = entry
+        if updated_at != session.updated_at or offset != start:
+            return None
+
+        return digest
+
+    @classmethod
+    def keep_digest(cls, session, offset, digest):
+        if digest is None or offset != session.received:
+            return
+
+        expired = timezone.now() - timedelta(
+            seconds=settings.UPLOAD_SESSION_TTL
+        )
+
+        with cls._digests_lock:
+            cls._digests[session.pk] = (session.updated_at, offset, digest)
+
+            while cls._digests:
+                oldest = next(iter(cls._digests))
+                if len(cls._digests) <= cls.MAX_DIGESTS and \
+                        cls._digests[oldest][0] >= expired:
+                    break
+                del cls._digests[oldest]
+
+    @classmethod
+    def checksum(cls, session):
+        with cls._digests_lock:
+            entry = cls._digests.pop(session.pk, None)
+
+        if entry is not None:
+            updated_at, offset, digest = entry
+            if updated_at == session.updated_at and offset == session.size:
+                return digest.hexdigest()
+
+        return cls.hash_part(session)
+
+    @classmethod
+    def hash_part(cls, session):
+        digest = hashlib.sha256()
+
+        with open(cls.part_path(session), 'rb') as part:
+            while block := part.read(cls.BLOCK_SIZE):
+                digest.update(block)
+
+        return digest.hexdigest()
+
+    @classmethod
+    def finalize(cls, session, user):
+        claimed = UploadSession.objects.filter(
+            pk=session.pk, finalizing=False
+        ).update(finalizing=True)
+
+        if not claimed:
+            raise UploadError('Upload is already being finalized')
+
+        try:
+            session.refresh_from_db()
+            return cls.complete(session, user)
+        except BaseException:
+            UploadSession.objects.filter(pk=session.pk).update(
+                finalizing=False
+            )
+            raise
+
+    @classmethod
+    def complete(cls, session, user):
+        if session.received != session.size:
+            raise UploadError(
+                f'Upload is incomplete ({session.received}/{session.size} bytes)'
+            )
+
+        checksum = cls.checksum(session)
+        if session.checksum and session.checksum.lower() != checksum:
+            raise UploadError('Checksum does not match the uploaded bytes')
+
+        with open(cls.part_path(session), 'rb') as part:
+            upload = PartFile(part, name=session.filename, sha256=checksum)
+
+            if session.kind == UploadSession.LECTURE:
+                instance = Lecture(course=session.course, topic=session.topic)
+            else:
+                instance = Submission(user=user, assignment=session.assignment)
+
+            instance.file.save(session.filename, upload, save=False)
+
+        with transaction.atomic():
+            instance.save()
+            session.delete()
+
+        return instance, checksum
+
+    @classmethod
+    def discard(cls, session):
+        with cls._digests_lock:
+            cls._digests.pop(session.pk, None)
+
+        cls.part_path(session).unlink(missing_ok=True)
+
+    @classmethod
+    def cleanup(cls, max_age=None):
+        if max_age is None:
+            max_age = timedelta(seconds=settings.UPLOAD_SESSION_TTL)
+
+        expired = UploadSession.objects.filter(
+            updated_at__lt=timezone.now() - max_age
+        )
+        count = 0
+
+        for session in expired.iterator():
+            session.delete()
+            count += 1
+
+        return count
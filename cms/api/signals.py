@@ -0,0 +1,166 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from api.metrics import DB_CONNECTIONS
+from api.models import (
+    Assignment, Comment, Course, Enrollment, Grade, Lecture, Submission,
+    UploadSession, User
+)
+from api.services.enrollment import EnrollmentService
+from api.services.gradebook import GradebookService
+from api.services.upload import UploadService
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def invalidate_enrollment_access(sender, instance, **kwargs):
+    EnrollmentService.invalidate(instance.user_id)
+    GradebookService.invalidate(instance.course_id)
+
+
+@receiver(pre_save, sender=Course)
+def remember_course_owner(sender, instance, **kwargs):
+    if instance.pk is None:
+        instance._previous_owner_id = None
+        return
+
+    instance._previous_owner_id = Course.objects.filter(
+        pk=instance.pk
+    ).values_list('owner_id', flat=True).first()
+
+
+@receiver(post_save, sender=Course)
+def invalidate_course_owner_access(sender, instance, **kwargs):
+    previous_owner_id = getattr(instance, '_previous_owner_id', None)
+
+    if previous_owner_id != instance.owner_id:
+        EnrollmentService.invalidate(previous_owner_id, instance.owner_id)
+
+
+@receiver(post_delete, sender=Course)
+def invalidate_deleted_course_access(sender, instance, **kwargs):
+    EnrollmentService.invalidate(instance.owner_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_access(sender, instance, created, **kwargs):
+    if not created:
+        EnrollmentService.invalidate(instance.pk)
+
+
+PROFILE_FIELDS = {'first_name', 'last_name', 'email', 'role'}
+
+
+@receiver(post_save, sender=User)
+def touch_enrolled_courses(sender, instance, created, update_fields,
+                           **kwargs):
+    if created or (
+        update_fields is not None and not PROFILE_FIELDS & set(update_fields)
+    ):
+        return
+
+    Course.objects.filter(enrollments__user=instance).update(
+        updated_at=timezone.now()
+    )
+
+
+@receiver(post_delete, sender=UploadSession)
+def discard_upload_part(sender, instance, **kwargs):
+    UploadService.discard(instance)
+
+
+@receiver(post_delete, sender=Lecture)
+@receiver(post_delete, sender=Submission)
+def release_stored_file(sender, instance, **kwargs):
+    if instance.file:
+        instance.file.delete(save=False)
+
+
+COURSE_SCOPED = {
+    Lecture: [
+        (Assignment, 'lecture'),
+        (Submission, 'assignment__lecture'),
+        (Grade, 'submission__assignment__lecture'),
+        (Comment, 'submission__assignment__lecture'),
+    ],
+    Assignment: [
+        (Submission, 'assignment'),
+        (Grade, 'submission__assignment'),
+        (Comment, 'submission__assignment'),
+    ],
+    Submission: [
+        (Grade, 'submission'),
+        (Comment, 'submission'),
+    ],
+}
+
+
+FILE_MODELS = (Lecture, Submission)
+
+
+@receiver(pre_save, sender=Lecture)
+@receiver(pre_save, sender=Assignment)
+@receiver(pre_save, sender=Submission)
+def remember_course(sender, instance, **kwargs):
+    if instance.pk is None:
+        instance._previous_course_id = None
+        instance._previous_file = None
+        return
+
+    fields = ['course_id', 'file'] if sender in FILE_MODELS else ['course_id']
+    previous = sender.objects.filter(
+        pk=instance.pk
+    ).values(*fields).first() or {}
+
+    instance._previous_course_id = previous.get('course_id')
+    instance._previous_file = previous.get('file')
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=Submission)
+def release_replaced_file(sender, instance, created, **kwargs):
+    stored = instance.__dict__.pop('_stored_file', False)
+    previous = getattr(instance, '_previous_file', None)
+
+    if created or not previous or (
+        not stored and previous == instance.file.name
+    ):
+        return
+
+    storage = instance.file.storage
+    transaction.on_commit(lambda: storage.delete(previous))
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=Submission)
+def move_course_scoped_rows(sender, instance, created, **kwargs):
+    previous_course_id = getattr(instance, '_previous_course_id', None)
+
+    if created or previous_course_id in (None, instance.course_id):
+        return
+
+    for model, lookup in COURSE_SCOPED[sender]:
+        model.objects.filter(**{lookup: instance}).update(
+            course_id=instance.course_id, updated_at=timezone.now()
+        )
+
+    GradebookService.invalidate(previous_course_id, instance.course_id)
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+@receiver(post_save, sender=Grade)
+@receiver(post_delete, sender=Grade)
+def invalidate_course_gradebook(sender, instance, **kwargs):
+    GradebookService.invalidate(instance.course_id)
+
+
+@receiver(connection_created)
+def count_database_connection(sender, connection, **kwargs):
+    DB_CONNECTIONS.inc(alias=connection.alias)
@@ -0,0 +1,36 @@
+import time
+
+from django.urls import URLResolver, get_resolver
+
+
+def view_classes(patterns=None):
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from view_classes(pattern.url_patterns)
+            continue
+
+        view_class = getattr(pattern.callback, 'cls', None)
+        if view_class is not None:
+            yield view_class
+
+
+def warm_up():
+    started = time.perf_counter()
+    urls = len(get_resolver().reverse_dict)
+    serializer_classes = {
+        view_class.serializer_class
+        for view_class in set(view_classes())
+        if getattr(view_class, 'serializer_class', None) is not None
+    }
+
+    for serializer_class in serializer_classes:
+        serializer_class().fields
+
+    return {
+        'urls': urls,
+        'serializers': len(serializer_classes),
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
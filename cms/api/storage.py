@@ -0,0 +1,150 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.fields.files import FieldFile
+
+from api.metrics import UPLOAD_BYTES
+from api.models.blob import StoredBlob
+
+
+def upload_storage():
+    return storages['uploads']
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    BLOB_DIR = 'blobs'
+
+    def blob_name(self, digest, ext):
+        return f'{self.BLOB_DIR}/{digest[:2]}/{digest}{ext}'
+
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        sha256 = getattr(content, 'sha256', None)
+        ext = os.path.splitext(name)[1].lower()
+
+        if hasattr(content, 'temporary_file_path'):
+            tmp_path, owns_tmp = content.temporary_file_path(), False
+
+            if sha256 is None:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+        else:
+            os.makedirs(self.location, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.location, suffix='.tmp')
+            owns_tmp = True
+
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    tmp.write(chunk)
+
+        blob_name = self.blob_name(sha256 or digest.hexdigest(), ext)
+        full_path = self.path(blob_name)
+        size = os.path.getsize(tmp_path)
+
+        try:
+            with transaction.atomic():
+                blob, _ = StoredBlob.objects.select_for_update().get_or_create(
+                    name=blob_name,
+                    defaults={'size': size}
+                )
+
+                if not os.path.exists(full_path):
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    file_move_safe(tmp_path, full_path, allow_overwrite=True)
+                    self._set_permissions(full_path)
+                    owns_tmp = False
+
+                StoredBlob.objects.filter(pk=blob.pk).update(
+                    refcount=F('refcount') + 1
+                )
+        finally:
+            if owns_tmp:
+                os.remove(tmp_path)
+
+        UPLOAD_BYTES.inc(
+            size, kind=os.path.dirname(name).split('/')[0] or 'other'
+        )
+
+        return blob_name
+
+    def _set_permissions(self, full_path):
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+
+    def delete(self, name):
+        with transaction.atomic():
+            blob = StoredBlob.objects.select_for_update().filter(
+                name=name
+            ).first()
+
+            if blob is None:
+                return
+
+            if blob.refcount > 1:
+                StoredBlob.objects.filter(pk=blob.pk).update(
+                    refcount=F('refcount') - 1
+                )
+                return
+
+            blob.delete()
+            transaction.on_commit(lambda: self.remove_unreferenced(name))
+
+    def remove_unreferenced(self, name):
+        with transaction.atomic():
+            blobs = StoredBlob.objects.select_for_update()
+            blob, created = blobs.get_or_create(
+                name=name,
+                defaults={'size': 0}
+            )
+
+            if created:
+                super().delete(name)
+                blob.delete()
+
+
+class BlobFieldFile(FieldFile):
+    def save(self, name, content, save=True):
+        super().save(name, content, save=False)
+        self.instance._stored_file = True
+
+        if self.field.name_field:
+            setattr(
+                self.instance, self.field.name_field, os.path.basename(name)
+            )
+
+        if save:
+            self.instance.save()
+
+    @property
+    def original_name(self):
+        if self.field.name_field:
+            name = getattr(self.instance, self.field.name_field)
+            if name:
+                return name
+
+        return os.path.basename(self.name)
+
+
+class BlobFileField(models.FileField):
+    attr_class = BlobFieldFile
+
+    def __init__(self, *args, name_field=None, **kwargs):
+        self.name_field = name_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+
+        if self.name_field:
+            kwargs['name_field'] = self.name_field
+
+        return name, path, args, kwargs
@@ -0,0 +1,51 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+SIZES = (1, 10, 100)
+
+
+def view_class(path):
+    return resolve(path).func.view_class
+
+
+def capture(request):
+    cache.clear()
+
+    with CaptureQueriesContext(connection) as context:
+        response = request()
+
+    return response, context.captured_queries
+
+
+def format_queries(queries):
+    return '\n'.join(
+        f'  {number}. {query["sql"]}'
+        for number, query in enumerate(queries, start=1)
+    )
+
+
+def assert_query_budget(path, runs):
+    view = view_class(path)
+    budget = getattr(view, 'query_budget', None)
+    counts = {size: len(queries) for size, queries in runs.items()}
+
+    if budget is None:
+        pytest.fail(f'{view.__name__} does not declare a query_budget')
+
+    constant = len(set(counts.values())) == 1
+    if constant and max(counts.values()) <= budget:
+        return
+
+    size, queries = max(runs.items(), key=lambda run: len(run[1]))
+    problem = (
+        'grows with the data' if not constant
+        else f'exceeds its budget of {budget}'
+    )
+    pytest.fail(
+        f'{view.__name__} {problem}: queries per size {counts}\n'
+        f'SQL for size {size}:\n{format_queries(queries)}',
+        pytrace=False
+    )
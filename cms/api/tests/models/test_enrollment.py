@@ -1,6 +1,8 @@
 import pytest
 from django.db import IntegrityError
+from api.metrics import CACHE_REQUESTS
 from api.models import Enrollment
+from api.services import EnrollmentService
 
 
 @pytest.mark.django_db
@@ -33,3 +35,59 @@ def test_multiple_enrollments(course, teacher_user, student_user):
     assert teacher_user in students
     assert student_user in students
     assert students.count() == 2
+
+
+@pytest.mark.django_db
+def test_enrollment_access_cache_hits(student_user, course):
+    Enrollment.objects.create(user=student_user, course=course)
+    hits, misses = (
+        CACHE_REQUESTS.value(cache='enrollment', result=result)
+        for result in ('hit', 'miss')
+    )
+
+    first = EnrollmentService.course_access(student_user.id)
+    second = EnrollmentService.course_access(student_user.id)
+
+    assert first == second
+    assert first.enrolled == {course.id}
+    assert CACHE_REQUESTS.value(cache='enrollment', result='hit') == hits + 1
+    assert CACHE_REQUESTS.value(cache='enrollment', result='miss') == misses + 1
+
+
+@pytest.mark.django_db
+def test_enrollment_access_cache_invalidated_on_enrollment(student_user, course):
+    assert EnrollmentService.course_access(student_user.id).enrolled == set()
+
+    enrollment = Enrollment.objects.create(user=student_user, course=course)
+    assert EnrollmentService.course_access(student_user.id).enrolled == {course.id}
+
+    enrollment.delete()
+    assert EnrollmentService.course_access(student_user.id).enrolled == set()
+
+
+@pytest.mark.django_db
+def test_enrollment_access_cache_invalidated_on_owner_change(
+    teacher_user, student_user, course
+):
+    assert EnrollmentService.course_access(teacher_user.id).owned == {course.id}
+    assert EnrollmentService.course_access(student_user.id).owned == set()
+
+    course.owner = student_user
+    course.save()
+
+    assert EnrollmentService.course_access(teacher_user.id).owned == set()
+    assert EnrollmentService.course_access(student_user.id).owned == {course.id}
+
+
+@pytest.mark.django_db
+def test_enrollment_access_cache_invalidated_on_course_delete(
+    teacher_user, student_user, course
+):
+    Enrollment.objects.create(user=student_user, course=course)
+    assert EnrollmentService.course_access(student_user.id).enrolled == {course.id}
+    assert EnrollmentService.course_access(teacher_user.id).owned == {course.id}
+
+    course.delete()
+
+    assert EnrollmentService.course_access(student_user.id).enrolled == set()
+    assert EnrollmentService.course_access(teacher_user.id).owned == set()
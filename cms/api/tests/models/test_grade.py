@@ -1,5 +1,6 @@
 import pytest
 from api.models import Grade
+from api.services import GradeService
 
 
 @pytest.mark.django_db
@@ -34,3 +35,18 @@ def test_grade_one_to_one_constraint(submission, teacher_user):
 
     with pytest.raises(Exception):
         Grade.objects.create(submission=submission, teacher=teacher_user, score=95)
+
+
+@pytest.mark.django_db
+def test_grade_upsert_touches_updated_at(submission, teacher_user):
+    grade = Grade.objects.create(
+        submission=submission, teacher=teacher_user, score=70
+    )
+
+    GradeService.upsert_grades(
+        teacher_user, {submission.id: 90}, {submission.id: grade.course_id}
+    )
+    grade_after = Grade.objects.get(pk=grade.pk)
+
+    assert grade_after.score == 90
+    assert grade_after.updated_at > grade.updated_at
@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 from api.models import Submission
 import os
@@ -18,8 +19,7 @@ def test_submission_creation(student_user, assignment, uploaded_file):
     assert submission.assignment == assignment
 
     actual_file_name = os.path.basename(submission.file.name)
-    assert actual_file_name.startswith('test_submission')
-    assert actual_file_name.endswith('.pdf')
+    assert actual_file_name == hashlib.sha256(b'Test file content').hexdigest() + '.pdf'
 
     expected_str = f"Submission by {submission.user.email} for {submission.assignment.title}"
     assert str(submission) == expected_str
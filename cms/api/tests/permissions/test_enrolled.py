@@ -0,0 +1,53 @@
+import pytest
+from rest_framework.test import APIRequestFactory
+from api.models import Course, Enrollment, Submission
+from api.permissions import IsEnrolled
+
+
+def make_request(user):
+    request = APIRequestFactory().get("/")
+    request.user = user
+
+    return request
+
+
+@pytest.mark.django_db
+def test_course_ids_loaded_once_per_request(
+    student_user, course, django_assert_num_queries
+):
+    other = Course.objects.create(title="Other", description="Desc")
+    Enrollment.objects.create(user=student_user, course=course)
+    request = make_request(student_user)
+
+    with django_assert_num_queries(1):
+        assert IsEnrolled.has_course_access(request, course.id)
+        assert not IsEnrolled.has_course_access(request, other.id)
+        assert IsEnrolled.course_ids(request) == {course.id}
+
+
+@pytest.mark.django_db
+def test_course_ids_not_shared_between_requests(student_user, course):
+    assert not IsEnrolled.has_course_access(make_request(student_user), course.id)
+
+    Enrollment.objects.create(user=student_user, course=course)
+
+    assert IsEnrolled.has_course_access(make_request(student_user), course.id)
+
+
+@pytest.mark.django_db
+def test_object_permission_uses_fk_ids(
+    student_user, course, submission, django_assert_num_queries
+):
+    Enrollment.objects.create(user=student_user, course=course)
+    obj = Submission.objects.select_related('assignment__lecture').get(
+        id=submission.id
+    )
+    request = make_request(student_user)
+    permission = IsEnrolled()
+
+    with django_assert_num_queries(1):
+        assert permission.has_object_permission(request, None, obj)
+        assert permission.has_object_permission(request, None, obj.assignment)
+        assert permission.has_object_permission(
+            request, None, obj.assignment.lecture
+        )
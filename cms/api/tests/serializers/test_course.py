@@ -40,3 +40,23 @@ def test_course_detail_serializer_nested(course, teacher_user, student_user):
 
     assert teacher_user.email in teacher_emails
     assert student_user.email in student_emails
+
+
+@pytest.mark.django_db
+def test_course_detail_serializer_eager_loading(
+    course, teacher_user, student_user, django_assert_num_queries
+):
+    Enrollment.objects.create(user=teacher_user, course=course)
+    Enrollment.objects.create(user=student_user, course=course)
+    Lecture.objects.create(course=course, topic="Lecture 1", file="lectures/file1.pdf")
+
+    queryset = CourseDetailSerializer.setup_eager_loading(
+        Course.objects.filter(id=course.id)
+    )
+
+    with django_assert_num_queries(4):
+        data = CourseDetailSerializer(queryset, many=True).data
+
+    assert [t['email'] for t in data[0]['teachers']] == [teacher_user.email]
+    assert [s['email'] for s in data[0]['students']] == [student_user.email]
+    assert data[0]['lectures'][0]['assignments'] == []
@@ -17,7 +17,7 @@ def test_lecture_serializer_basic(course):
     assert data['id'] == lecture.id
     assert data['course'] == lecture.course.id
     assert data['topic'] == "Test Lecture"
-    assert data['file'].endswith('lectures/test_file.pdf')
+    assert data['file'] == f'/api/v1/lectures/{lecture.id}/file/'
     assert data['assignments'] == []
 
 
@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 import os
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -32,9 +33,10 @@ def test_submission_serializer_basic(student_user, course):
     assert data['user'] == student_user.id
     assert data['assignment'] == assignment.id
 
-    actual_file_name = os.path.basename(data['file'])
-    assert actual_file_name.startswith('test_submission')
-    assert actual_file_name.endswith('.pdf')
+    assert data['file'] == f'/api/v1/submissions/{submission.id}/file/'
+
+    actual_file_name = os.path.basename(submission.file.name)
+    assert actual_file_name == hashlib.sha256(b"file_content").hexdigest() + '.pdf'
 
 
 @pytest.mark.django_db
@@ -56,5 +58,4 @@ def test_submission_serializer_create(student_user, course):
     assert submission.assignment == assignment
 
     actual_file_name = os.path.basename(submission.file.name)
-    assert actual_file_name.startswith('upload')
-    assert actual_file_name.endswith('.pdf')
+    assert actual_file_name == hashlib.sha256(b"data").hexdigest() + '.pdf'
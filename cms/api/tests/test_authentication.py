@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.authentication import ClaimsJWTAuthentication, \
+    ClaimsTokenObtainPairSerializer, ClaimsTokenRefreshSerializer
+from api.models import Enrollment
+from api.services.enrollment import EnrollmentService
+
+
+def access_token_for(user):
+    return ClaimsTokenObtainPairSerializer.get_token(user).access_token
+
+
+@pytest.mark.django_db
+def test_token_carries_access_claims(student_user):
+    token = access_token_for(student_user)
+
+    assert token['role'] == 'student'
+    assert token['access_ver']
+
+
+@pytest.mark.django_db
+def test_claims_authentication_skips_user_lookup(
+    student_user, django_assert_num_queries
+):
+    token = access_token_for(student_user)
+
+    with django_assert_num_queries(0):
+        user = ClaimsJWTAuthentication().get_user(token)
+
+    assert user.pk == student_user.pk
+    assert user.role == 'student'
+    assert user.email == student_user.email
+    assert str(user) == str(student_user)
+    assert user.is_authenticated
+
+
+@pytest.mark.django_db
+def test_claims_token_rejected_after_enrollment_change(student_user, course):
+    token = access_token_for(student_user)
+
+    Enrollment.objects.create(user=student_user, course=course)
+
+    with pytest.raises(InvalidToken):
+        ClaimsJWTAuthentication().get_user(token)
+
+
+@pytest.mark.django_db
+def test_claims_token_refresh_restamps_access_version(student_user, course):
+    refresh = ClaimsTokenObtainPairSerializer.get_token(student_user)
+    Enrollment.objects.create(user=student_user, course=course)
+
+    serializer = ClaimsTokenRefreshSerializer(data={'refresh': str(refresh)})
+    serializer.is_valid(raise_exception=True)
+    access = RefreshToken.access_token_class(serializer.validated_data['access'])
+
+    user = ClaimsJWTAuthentication().get_user(access)
+    assert user.pk == student_user.pk
+
+
+@pytest.mark.django_db
+def test_access_versions_expire(student_user, settings, monkeypatch):
+    settings.JWT_ACCESS_VERSION_TIMEOUT = 60
+    version = EnrollmentService.access_version(student_user.pk)
+    assert EnrollmentService.access_version(student_user.pk) == version
+
+    now = time.time() + 61
+    monkeypatch.setattr(time, 'time', lambda: now)
+    assert EnrollmentService.access_version(student_user.pk) != version
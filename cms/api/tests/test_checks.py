@@ -0,0 +1,21 @@
+from api.checks import async_connection_check
+
+
+def test_async_views_warn_about_persistent_connections(settings):
+    default = settings.DATABASES['default']
+    settings.ASYNC_READ_VIEWS = True
+
+    settings.DATABASES = {'default': {**default, 'CONN_MAX_AGE': 60}}
+    assert [w.id for w in async_connection_check(None)] == ['api.W003']
+
+    settings.DATABASES = {'default': {**default, 'CONN_MAX_AGE': 0}}
+    assert async_connection_check(None) == []
+
+    settings.DATABASES = {'default': {
+        **default, 'CONN_MAX_AGE': 0, 'OPTIONS': {'pool': {}}
+    }}
+    assert async_connection_check(None) == []
+
+    settings.ASYNC_READ_VIEWS = False
+    settings.DATABASES = {'default': {**default, 'CONN_MAX_AGE': 60}}
+    assert async_connection_check(None) == []
@@ -0,0 +1,62 @@
+import pytest
+from api.models import Assignment, Comment, Course, Grade, Lecture, Submission
+from api.permissions import IsEnrolled
+from api.services import GradeService
+
+
+@pytest.fixture
+def graded(teacher_user, student_user, course):
+    lecture = Lecture.objects.create(course=course, topic="Lecture", file="lectures/file.pdf")
+    assignment = Assignment.objects.create(lecture=lecture, title="Assignment", description="Desc")
+    submission = Submission.objects.create(user=student_user, assignment=assignment, file="sub/file.pdf")
+    grade = Grade.objects.create(submission=submission, teacher=teacher_user, score=80)
+    comment = Comment.objects.create(submission=submission, user=student_user, content="Hi")
+
+    return lecture, assignment, submission, grade, comment
+
+
+def course_ids(*objects):
+    return {
+        type(obj).objects.values_list('course_id', flat=True).get(pk=obj.pk)
+        for obj in objects
+    }
+
+
+@pytest.mark.django_db
+def test_course_is_set_on_create(course, graded):
+    assert course_ids(*graded) == {course.id}
+    assert {IsEnrolled.course_id_of(obj) for obj in graded} == {course.id}
+
+
+@pytest.mark.django_db
+def test_moving_lecture_moves_everything_below(teacher_user, graded):
+    lecture = graded[0]
+    other = Course.objects.create(title="Other", description="Desc", owner=teacher_user)
+
+    lecture.course = other
+    lecture.save()
+
+    assert course_ids(*graded) == {other.id}
+
+
+@pytest.mark.django_db
+def test_moving_assignment_moves_its_submissions(teacher_user, graded):
+    _, assignment, submission, grade, comment = graded
+    other = Course.objects.create(title="Other", description="Desc", owner=teacher_user)
+    target = Lecture.objects.create(course=other, topic="Target", file="lectures/file.pdf")
+
+    assignment.lecture = target
+    assignment.save()
+
+    assert course_ids(assignment, submission, grade, comment) == {other.id}
+    assert course_ids(graded[0]) != {other.id}
+
+
+@pytest.mark.django_db
+def test_batch_grades_carry_course(teacher_user, student_user, graded):
+    assignment, course_id = graded[1], graded[1].course_id
+    submission = Submission.objects.create(user=student_user, assignment=assignment, file="sub/other.pdf")
+
+    GradeService.upsert_grades(teacher_user, {submission.id: 70}, {submission.id: course_id})
+
+    assert Grade.objects.get(submission=submission).course_id == course_id
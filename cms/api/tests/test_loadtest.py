@@ -0,0 +1,91 @@
+import json
+import random
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from api.models import Enrollment
+from api.loadtest import assign_scenarios, compare, percentile, summarize
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) is None
+
+
+def test_summarize_groups_by_endpoint():
+    samples = [
+        ('GET course-list', 200, 0.010, 5),
+        ('GET course-list', 200, 0.030, 5),
+        ('POST grade-batch', 400, 0.020, None),
+    ]
+
+    report = summarize(samples, elapsed=2)
+
+    assert report['GET course-list']['requests'] == 2
+    assert report['GET course-list']['rps'] == 1
+    assert report['GET course-list']['queries_per_request'] == 5
+    assert report['POST grade-batch']['errors'] == 1
+    assert report['POST grade-batch']['queries_per_request'] is None
+    assert report['total']['requests'] == 3
+
+
+def test_assign_scenarios_follows_weights():
+    plan = assign_scenarios({'student_browsing': 3, 'teacher_grading': 1}, 8, random.Random(0))
+
+    assert sorted(plan) == ['student_browsing'] * 6 + ['teacher_grading'] * 2
+
+
+def test_compare_reports():
+    base = {'endpoints': {'GET course-list': {'p50_ms': 10, 'p95_ms': 20, 'p99_ms': 40, 'rps': 100, 'queries_per_request': 5}}}
+    head = {'endpoints': {'GET course-list': {'p50_ms': 5, 'p95_ms': 20, 'p99_ms': 30, 'rps': 150, 'queries_per_request': 3}}}
+
+    [row] = compare(base, head)
+
+    assert row['p50_ms'] == (10, 5, -50.0)
+    assert row['rps'] == (100, 150, 50.0)
+    assert row['queries_per_request'] == (5, 3, -40.0)
+
+
+@pytest.mark.django_db
+def test_query_count_header(settings, student_user, course):
+    Enrollment.objects.create(user=student_user, course=course)
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+
+    assert 'X-Query-Count' not in client.get('/api/v1/courses/')
+
+    settings.PROFILING_SAMPLE_RATE = 1
+    assert int(client.get('/api/v1/courses/')['X-Query-Count']) >= 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_loadtest_against_live_server(live_server, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.PROFILING_SAMPLE_RATE = 1
+    call_command(
+        'seed_scale', users=30, courses=3, lectures=6, submissions=30,
+        seed=3, stdout=StringIO()
+    )
+    output = tmp_path / 'report.json'
+
+    call_command(
+        'loadtest', base_url=live_server.url, duration=1, workers=3,
+        seed=3, output=str(output), stdout=StringIO()
+    )
+
+    report = json.loads(output.read_text())
+    endpoints = report['endpoints']
+    assert report['meta']['mix'] == {
+        'student_browsing': 1, 'submission_rush': 1, 'teacher_grading': 1
+    }
+    assert {'GET course-list', 'POST submission-create', 'POST grade-batch'} <= set(endpoints)
+    assert endpoints['total']['errors'] == 0
+    assert endpoints['GET course-list']['queries_per_request'] >= 1
+    assert endpoints['GET course-list']['p99_ms'] >= endpoints['GET course-list']['p50_ms']
@@ -0,0 +1,222 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from django.core.files.base import ContentFile
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from rest_framework.test import APIClient
+from api import metrics
+from api.metrics import Registry, registry
+from api.models import Enrollment, Lecture
+from api.storage import upload_storage
+
+
+def samples(text):
+    return {
+        line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith('#')
+    }
+
+
+def scrape():
+    return Client().get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(settings):
+    settings.METRICS_DIR = ''
+    settings.METRICS_TOKEN = 'secret'
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def client(student_user, course):
+    Enrollment.objects.create(user=student_user, course=course)
+    Lecture.objects.create(course=course, topic="Lecture", file="lectures/file.pdf")
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+
+    return client
+
+
+@pytest.mark.django_db
+def test_requests_are_counted_by_url_name(client):
+    client.get('/api/v1/courses/')
+    client.get('/api/v1/courses/')
+    client.get('/api/v1/courses/999999/')
+
+    data = samples(scrape().content.decode())
+
+    assert data['cms_http_requests_total{method="GET",status="200",url_name="course-list"}'] == 2
+    assert data['cms_http_requests_total{method="GET",status="404",url_name="course-detail"}'] == 1
+    assert data['cms_http_request_duration_seconds_count{method="GET",url_name="course-list"}'] == 2
+    assert data['cms_http_request_duration_seconds_bucket{method="GET",url_name="course-list",le="+Inf"}'] == 2
+    assert data['cms_db_queries_per_request_count{url_name="course-list"}'] == 2
+    assert data['cms_db_queries_per_request_sum{url_name="course-list"}'] > 0
+
+
+@pytest.mark.django_db
+def test_cache_and_upload_metrics(client):
+    client.get('/api/v1/courses/')
+    client.get('/api/v1/courses/')
+    upload_storage().save('submissions/file.pdf', ContentFile(b'x' * 100))
+
+    data = samples(scrape().content.decode())
+
+    assert data['cms_cache_requests_total{cache="enrollment",result="miss"}'] == 1
+    assert data['cms_cache_requests_total{cache="enrollment",result="hit"}'] >= 1
+    assert data['cms_upload_bytes_total{kind="submissions"}'] == 100
+
+
+@pytest.mark.django_db
+def test_metrics_access(settings):
+    settings.METRICS_ALLOWED_IPS = []
+    settings.METRICS_TOKEN = 'secret'
+
+    assert Client().get('/metrics').status_code == 403
+    assert Client().get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code == 403
+
+    response = Client().get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+
+
+@pytest.mark.django_db
+def test_metrics_ip_access_ignores_proxied_requests(settings):
+    settings.METRICS_TOKEN = ''
+    settings.METRICS_ALLOWED_IPS = ['127.0.0.1', '10.0.0.5']
+
+    assert Client().get('/metrics').status_code == 403
+    assert Client(REMOTE_ADDR='10.0.0.5').get('/metrics').status_code == 200
+    assert Client(REMOTE_ADDR='10.0.0.5').get(
+        '/metrics', HTTP_X_FORWARDED_FOR='203.0.113.9'
+    ).status_code == 403
+    assert Client(REMOTE_ADDR='10.0.0.5').get(
+        '/metrics', HTTP_X_REAL_IP='203.0.113.9'
+    ).status_code == 403
+
+
+def test_render_format():
+    local = Registry()
+    latency = local.histogram('latency_seconds', 'Latency', (0.1, 1))
+    requests = local.counter('requests_total', 'Requests')
+
+    for value in (0.05, 0.5, 5):
+        latency.observe(value, view='a')
+    requests.inc(view='say "hi"\n')
+
+    assert local.render().splitlines() == [
+        '# HELP latency_seconds Latency',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{view="a",le="0.1"} 1',
+        'latency_seconds_bucket{view="a",le="1.0"} 2',
+        'latency_seconds_bucket{view="a",le="+Inf"} 3',
+        'latency_seconds_sum{view="a"} 5.55',
+        'latency_seconds_count{view="a"} 3',
+        '# HELP requests_total Requests',
+        '# TYPE requests_total counter',
+        'requests_total{view="say \\"hi\\"\\n"} 1',
+    ]
+
+
+def test_worker_snapshots_are_merged(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    workers = [Registry(), Registry()]
+
+    for worker in workers:
+        counter = worker.counter('requests_total', 'Requests')
+        histogram = worker.histogram('queries', 'Queries', (1, 10))
+        counter.inc(view='a')
+        histogram.observe(3, view='a')
+        worker.flush()
+
+    assert len(list(tmp_path.glob('*.json'))) == 2
+    assert json.loads(next(tmp_path.glob('*.json')).read_text())['counters']
+
+    data = samples(workers[0].render())
+    assert data['requests_total{view="a"}'] == 2
+    assert data['queries_bucket{view="a",le="10.0"}'] == 2
+    assert data['queries_count{view="a"}'] == 2
+
+
+@pytest.mark.django_db
+def test_metrics_can_be_disabled(client, settings):
+    settings.METRICS_ENABLED = False
+    client.get('/api/v1/courses/')
+
+    assert 'cms_http_requests_total{' not in scrape().content.decode()
+
+
+def test_gauges_are_summed_over_workers(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    workers = [Registry(), Registry()]
+
+    for size, worker in zip((3, 4), workers):
+        gauge = worker.gauge('pool_size', 'Pool size')
+        worker.collector(lambda gauge=gauge, size=size: gauge.set(size, alias='default'))
+        worker.flush()
+
+    lines = workers[0].render().splitlines()
+    assert '# TYPE pool_size gauge' in lines
+    assert samples('\n'.join(lines))['pool_size{alias="default"}'] == 7
+
+
+def test_gauges_of_exited_workers_are_dropped(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+    exited.wait()
+    (tmp_path / f'{exited.pid}-old.json').write_text(json.dumps({
+        'counters': [['requests_total', [], 5]],
+        'gauges': [['pool_size', [['alias', 'default']], 3]],
+        'histograms': [],
+    }))
+
+    worker = Registry()
+    worker.counter('requests_total', 'Requests').inc()
+    gauge = worker.gauge('pool_size', 'Pool size')
+    worker.collector(lambda: gauge.set(4, alias='default'))
+
+    data = samples(worker.render())
+    assert data['requests_total'] == 6
+    assert data['pool_size{alias="default"}'] == 4
+
+
+class FakePool:
+    def pop_stats(self):
+        return {
+            'pool_max': 10, 'pool_size': 4, 'pool_available': 1,
+            'requests_waiting': 2, 'requests_num': 30,
+            'requests_wait_ms': 1500, 'requests_errors': 1,
+        }
+
+
+class FakeConnection:
+    _connection_pools = {'default': FakePool()}
+
+
+def test_pool_stats_are_exported(monkeypatch):
+    monkeypatch.setattr(metrics, 'connections', {'default': FakeConnection()})
+
+    data = samples(registry.render())
+
+    assert data['cms_db_pool_size{alias="default"}'] == 4
+    assert data['cms_db_pool_available{alias="default"}'] == 1
+    assert data['cms_db_pool_max_size{alias="default"}'] == 10
+    assert data['cms_db_pool_waiting_requests{alias="default"}'] == 2
+    assert data['cms_db_pool_requests_total{alias="default"}'] == 30
+    assert data['cms_db_pool_wait_seconds_total{alias="default"}'] == 1.5
+    assert data['cms_db_pool_errors_total{alias="default"}'] == 1
+
+
+def test_new_connections_are_counted():
+    connection_created.send(sender=None, connection=connections['default'])
+
+    data = samples(registry.render())
+
+    assert data['cms_db_connections_total{alias="default"}'] == 1
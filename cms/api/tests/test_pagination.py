@@ -0,0 +1,109 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from api.models import Enrollment, Submission
+from api.pagination import KeysetPagination
+
+
+def walk_pages(client, url):
+    pages = []
+
+    while url:
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+
+        assert response.status_code == 200
+        pages.append((response.data['results'], ctx.captured_queries))
+        url = response.data['next']
+
+    return pages
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_walks_all_rows(student_user, course, assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+    submissions = Submission.objects.bulk_create([
+        Submission(user=student_user, assignment=assignment, course=course, file="sub/file.pdf")
+        for _ in range(23)
+    ])
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    pages = walk_pages(client, "/api/v1/submissions/?page_size=5")
+
+    ids = [item['id'] for results, _ in pages for item in results]
+    assert ids == [s.id for s in submissions]
+    assert len(pages) == 5
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_page_n_costs_same_as_page_one(
+    student_user, course, assignment
+):
+    Enrollment.objects.create(user=student_user, course=course)
+    Submission.objects.bulk_create([
+        Submission(user=student_user, assignment=assignment, course=course, file="sub/file.pdf")
+        for _ in range(200)
+    ])
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    pages = walk_pages(client, "/api/v1/submissions/?page_size=10")
+
+    query_counts = {len(queries) for _, queries in pages}
+    assert len(pages) == 20
+    assert query_counts == {1}
+
+    for _, queries in pages[1:]:
+        sql = queries[-1]['sql'].upper()
+        assert 'OFFSET' not in sql
+        assert '"API_SUBMISSION"."ID" >' in sql
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_page_size_ceiling(
+    student_user, course, assignment, monkeypatch
+):
+    monkeypatch.setattr(KeysetPagination, 'max_page_size', 2)
+    Enrollment.objects.create(user=student_user, course=course)
+    Submission.objects.bulk_create([
+        Submission(user=student_user, assignment=assignment, course=course, file="sub/file.pdf")
+        for _ in range(3)
+    ])
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.get("/api/v1/submissions/?page_size=100000")
+
+    assert response.status_code == 200
+    assert len(response.data['results']) == 2
+    assert response.data['next'] is not None
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_walks_back(student_user, course, assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+    submissions = Submission.objects.bulk_create([
+        Submission(user=student_user, assignment=assignment, course=course, file="sub/file.pdf")
+        for _ in range(12)
+    ])
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    last = walk_pages(client, "/api/v1/submissions/?page_size=5")[-1][0]
+    assert [item['id'] for item in last] == [s.id for s in submissions[10:]]
+
+    url = client.get("/api/v1/submissions/?page_size=5").data['next']
+    url = client.get(url).data['next']
+    pages = []
+    while url:
+        data = client.get(url).data
+        pages.append([item['id'] for item in data['results']])
+        url = data['previous']
+
+    assert pages == [
+        [s.id for s in submissions[10:]],
+        [s.id for s in submissions[5:10]],
+        [s.id for s in submissions[:5]],
+    ]
@@ -0,0 +1,96 @@
+import json
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from api.models import Enrollment, Lecture
+from api.profiling import Profile
+
+
+def timings(response):
+    return {
+        entry.split(';')[0].strip(): entry
+        for entry in response['Server-Timing'].split(',')
+    }
+
+
+@pytest.fixture
+def client(student_user, course):
+    Enrollment.objects.create(user=student_user, course=course)
+    Lecture.objects.create(course=course, topic="Lecture", file="lectures/file.pdf")
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+
+    return client
+
+
+@pytest.mark.django_db
+def test_profiling_is_off_by_default(client):
+    response = client.get('/api/v1/courses/')
+
+    assert 'Server-Timing' not in response
+    assert 'X-Query-Count' not in response
+
+
+@pytest.mark.django_db
+def test_profiled_request_reports_phases(client, settings, caplog):
+    settings.PROFILING_SAMPLE_RATE = 1
+    logger = logging.getLogger('api.profiling')
+    logger.addHandler(caplog.handler)
+
+    try:
+        with caplog.at_level(logging.INFO, logger='api.profiling'):
+            response = client.get('/api/v1/courses/')
+    finally:
+        logger.removeHandler(caplog.handler)
+
+    phases = timings(response)
+    assert set(phases) == {'db', 'perm', 'serialize', 'render', 'total'}
+    assert f'desc="{response["X-Query-Count"]} queries"' in phases['db']
+
+    [record] = [r for r in caplog.records if r.name == 'api.profiling']
+    line = json.loads(record.getMessage())
+    assert line['url_name'] == 'course-list'
+    assert line['status'] == 200
+    assert line['queries'] == int(response['X-Query-Count']) > 0
+    assert line['serialize_ms'] > 0
+    assert line['render_ms'] > 0
+    assert line['total_ms'] >= line['serialize_ms']
+
+
+@pytest.mark.django_db
+def test_profiling_sample_rate(client, settings, monkeypatch):
+    settings.PROFILING_SAMPLE_RATE = 0.5
+
+    monkeypatch.setattr('api.middleware.random.random', lambda: 0.7)
+    assert 'Server-Timing' not in client.get('/api/v1/courses/')
+
+    monkeypatch.setattr('api.middleware.random.random', lambda: 0.2)
+    assert 'Server-Timing' in client.get('/api/v1/courses/')
+
+
+def test_nested_measurements_are_counted_once():
+    profile = Profile()
+
+    def outer():
+        return profile.measure('serialize', lambda: 42)
+
+    assert profile.measure('serialize', outer) == 42
+    assert profile.phases['serialize'] > 0
+    assert profile.depth == {'serialize': 0}
+
+
+@pytest.mark.django_db
+def test_profiled_request_under_asgi(client, settings, student_user):
+    settings.PROFILING_SAMPLE_RATE = 1
+    token = AccessToken.for_user(student_user)
+
+    response = async_to_sync(AsyncClient().get)(
+        '/api/v1/courses/', headers={'authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == 200
+    assert int(response['X-Query-Count']) > 0
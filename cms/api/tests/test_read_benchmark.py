@@ -0,0 +1,49 @@
+import pytest
+from django.db import connection
+from rest_framework_simplejwt.tokens import AccessToken
+from api.models import Enrollment
+from api.readbench import benchmark, connection_benchmark, read_paths
+
+
+@pytest.fixture
+def users(student_user, course, lecture, assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+
+    return [{
+        'token': str(AccessToken.for_user(student_user)),
+        'paths': read_paths(course.id, lecture.id),
+    }]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_benchmark_runs_both_handlers(users):
+    reports = benchmark(
+        users, requests=5, threads=1,
+        database=connection.settings_dict['NAME']
+    )
+
+    for mode in ('wsgi', 'asgi'):
+        endpoints = reports[mode]['endpoints']
+        assert reports[mode]['meta']['mode'] == mode
+        assert endpoints['total']['requests'] == 5
+        assert endpoints['total']['errors'] == 0
+        assert endpoints['GET lecture-detail']['queries_per_request'] > 0
+
+    assert {row['endpoint'] for row in reports['comparison']} == {
+        'GET course-list', 'GET course-detail', 'GET lecture-list',
+        'GET lecture-detail', 'GET assignment-list', 'total'
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_connection_benchmark(users):
+    reports = connection_benchmark(
+        users, requests=5, threads=1,
+        database=connection.settings_dict['NAME'],
+        names=['per-request', 'persistent']
+    )
+
+    assert reports['persistent']['meta']['connections'] == 'persistent'
+    assert reports['per-request']['endpoints']['total']['errors'] == 0
+    assert reports['persistent']['endpoints']['total']['requests'] == 5
+    assert set(reports['comparison']) == {'persistent'}
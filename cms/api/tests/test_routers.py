@@ -0,0 +1,145 @@
+from contextlib import ExitStack
+
+import pytest
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from api.checks import replica_cache_check
+from api.models import Course, Enrollment
+from api.routers import ReplicaRouter, RequestRouting, current_routing, \
+    use_primary
+
+
+@pytest.fixture
+def routing(settings, student_user):
+    settings.DATABASE_REPLICAS = ['replica_a', 'replica_b']
+    request = RequestFactory().get('/api/v1/courses/')
+    request.user = student_user
+    routing = RequestRouting(request, 'replica_a')
+    token = current_routing.set(routing)
+    yield routing
+    current_routing.reset(token)
+
+
+def test_replicas_take_turns(settings):
+    settings.DATABASE_REPLICAS = ['replica_a', 'replica_b']
+
+    chosen = {ReplicaRouter.choose_replica() for _ in range(4)}
+
+    assert chosen == {'replica_a', 'replica_b'}
+
+
+def test_reads_outside_requests_use_primary():
+    assert ReplicaRouter().db_for_read(Course) == 'default'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_routing(routing, student_user):
+    router = ReplicaRouter()
+
+    assert router.db_for_read(Course) == 'replica_a'
+
+    with use_primary():
+        assert router.db_for_read(Course) == 'default'
+
+    with transaction.atomic():
+        assert router.db_for_read(Course) == 'default'
+
+    assert router.db_for_read(Course) == 'replica_a'
+    assert router.db_for_write(Course) == 'default'
+    assert router.db_for_read(Course) == 'default'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pinned_user_reads_from_primary(routing, student_user):
+    ReplicaRouter.pin(student_user.pk)
+
+    assert ReplicaRouter().db_for_read(Course) == 'default'
+
+
+@pytest.fixture
+def replica(transactional_db, settings):
+    alias = 'replica_test'
+    primary = connections['default']
+    connections[alias] = primary.__class__(dict(primary.settings_dict), alias)
+    settings.DATABASE_REPLICAS = [alias]
+    settings.DATABASE_ROUTERS = ['api.routers.ReplicaRouter']
+
+    yield alias
+
+    connections[alias].close()
+    del connections[alias]
+
+
+@pytest.fixture
+def queries(replica):
+    counts = {'default': 0, replica: 0}
+
+    def counter(alias):
+        def count(execute, sql, params, many, context):
+            counts[alias] += 1
+            return execute(sql, params, many, context)
+
+        return count
+
+    with ExitStack() as stack:
+        for alias in counts:
+            stack.enter_context(
+                connections[alias].execute_wrapper(counter(alias))
+            )
+        yield counts
+
+
+def test_reads_follow_the_users_writes(replica, queries, teacher_user,
+                                       course):
+    Enrollment.objects.create(user=teacher_user, course=course)
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+
+    assert client.get('/api/v1/courses/').status_code == 200
+    assert queries[replica] > 0
+
+    replica_reads = queries[replica]
+    response = client.post(
+        '/api/v1/courses/create/',
+        {'title': 'Second', 'description': 'Another'}, format='json'
+    )
+    assert response.status_code == 201
+    assert queries[replica] == replica_reads
+
+    response = client.get('/api/v1/courses/')
+    assert len(response.data['results']) == 2
+    assert queries[replica] == replica_reads
+
+    cache.delete(ReplicaRouter.PIN_KEY.format(user_id=teacher_user.pk))
+    client.get('/api/v1/courses/')
+    assert queries[replica] > replica_reads
+
+
+def test_failed_writes_do_not_pin(replica, teacher_user):
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+    key = ReplicaRouter.PIN_KEY.format(user_id=teacher_user.pk)
+
+    response = client.post('/api/v1/courses/create/', {}, format='json')
+    assert response.status_code == 400
+    assert cache.get(key) is None
+
+    response = client.post(
+        '/api/v1/courses/create/',
+        {'title': 'Second', 'description': 'Another'}, format='json'
+    )
+    assert response.status_code == 201
+    assert cache.get(key)
+
+
+def test_replicas_need_a_shared_cache(settings):
+    settings.DATABASE_REPLICAS = ['replica_a']
+
+    assert [w.id for w in replica_cache_check(None)] == ['api.W002']
+
+    settings.CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache'
+    }}
+    assert replica_cache_check(None) == []
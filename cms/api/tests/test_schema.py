@@ -0,0 +1,89 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from api.schema import SchemaDocument
+
+
+@pytest.fixture(autouse=True)
+def schema_root(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_ROOT = str(tmp_path)
+    SchemaDocument.clear()
+    yield tmp_path
+    SchemaDocument.clear()
+
+
+def test_schema_is_generated_once(schema_root, monkeypatch):
+    client = Client()
+    first = client.get('/swagger.json')
+
+    assert first.status_code == 200
+    assert json.loads(first.content)['info']['title'] == 'CMS API'
+    assert '/courses/' in json.loads(first.content)['paths']
+    assert first['ETag'].startswith('"')
+    assert sorted(path.suffix for path in schema_root.iterdir()) == ['.json', '.yaml']
+
+    monkeypatch.setattr(SchemaDocument, 'generate', lambda: pytest.fail('regenerated'))
+    SchemaDocument.clear()
+
+    assert client.get('/swagger.json').content == first.content
+    assert client.get('/api/v1/swagger/?format=openapi').content == first.content
+    assert client.get('/swagger.yaml').content.startswith(b'swagger:')
+
+
+def test_schema_etag(schema_root):
+    client = Client()
+    etag = client.get('/swagger.json')['ETag']
+
+    response = client.get('/swagger.json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+    assert not response.content
+
+    assert client.get('/swagger.json', HTTP_IF_NONE_MATCH='"stale"').status_code == 200
+    assert client.get('/swagger.yaml')['ETag'] != etag
+
+
+def test_schema_follows_code_version(schema_root, settings):
+    call_command('generate_schema', stdout=StringIO())
+    SchemaDocument.code_version.cache_clear()
+    settings.CODE_VERSION = 'release-2'
+
+    try:
+        Client().get('/swagger.json')
+        names = sorted(path.name for path in schema_root.iterdir())
+    finally:
+        SchemaDocument.code_version.cache_clear()
+
+    assert 'openapi-release-2.json' in names
+    assert len(names) == 4
+
+
+def test_code_version_hashes_only_package_sources(settings, tmp_path):
+    settings.BASE_DIR = tmp_path
+    for name in ('api', 'cms', 'media/blobs'):
+        (tmp_path / name).mkdir(parents=True)
+    (tmp_path / 'api' / 'views.py').write_text('VIEWS = 1\n')
+
+    def version():
+        SchemaDocument.code_version.cache_clear()
+        return SchemaDocument.code_version()
+
+    try:
+        first = version()
+        (tmp_path / 'media' / 'blobs' / 'upload.py').write_text('x = 1\n')
+        assert version() == first
+
+        (tmp_path / 'api' / 'views.py').write_text('VIEWS = 2\n')
+        assert version() != first
+    finally:
+        SchemaDocument.code_version.cache_clear()
+
+
+def test_schema_ui_still_renders():
+    response = Client().get('/api/v1/swagger/')
+
+    assert response.status_code == 200
+    assert b'swagger-ui' in response.content
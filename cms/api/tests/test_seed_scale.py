@@ -0,0 +1,88 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command
+from django.db.models import F
+from api.models import User, Course, Enrollment, Lecture, Assignment, \
+    Submission, Grade, Comment, StoredBlob
+
+SEEDED = [User, Course, Enrollment, Lecture, Assignment, Submission, Grade, Comment]
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+def seed(**options):
+    defaults = dict(
+        users=50, courses=5, lectures=20, submissions=300, comments=40,
+        seed=7, batch_size=64, stdout=StringIO()
+    )
+    call_command('seed_scale', **{**defaults, **options})
+
+
+def snapshot():
+    return {
+        model.__name__: [
+            {key: value for key, value in row.items() if key != 'updated_at'}
+            for row in model.objects.order_by('pk').values()
+        ]
+        for model in SEEDED
+    }
+
+
+@pytest.mark.django_db
+def test_seed_scale_volumes():
+    seed()
+
+    assert User.objects.count() == 50
+    assert User.objects.filter(role='teacher').count() == 2
+    assert Course.objects.count() == 5
+    assert Lecture.objects.count() == 20
+    assert Assignment.objects.count() == 20
+    assert Submission.objects.count() == 300
+    assert Comment.objects.count() == 40
+    assert 0 < Grade.objects.count() < 300
+    enrolled = set(Enrollment.objects.values_list('user_id', 'course_id'))
+    assert set(Submission.objects.values_list('user_id', 'course_id')) <= enrolled
+    assert not Submission.objects.exclude(course_id=F('assignment__course_id')).exists()
+
+
+@pytest.mark.django_db
+def test_seed_scale_is_reproducible():
+    seed()
+    first = snapshot()
+
+    for model in reversed(SEEDED):
+        model.objects.all().delete()
+
+    seed()
+    assert snapshot() == first
+
+    seed(seed=8)
+    assert User.objects.count() == 100
+
+
+@pytest.mark.django_db
+def test_seed_scale_users_can_log_in_and_files_are_shared():
+    seed()
+
+    user = User.objects.get(email='student0.seed7@example.com')
+    assert check_password('password', user.password)
+
+    names = set(Submission.objects.values_list('file', flat=True))
+    assert len(names) == 1
+    assert Lecture.objects.filter(file__in=names).count() == 20
+    assert StoredBlob.objects.get(name=names.pop()).refcount == 320
+
+    created = User.objects.create_user(email='new@example.com', password='x', role='student')
+    assert created.pk > max(User.objects.exclude(pk=created.pk).values_list('pk', flat=True))
+
+
+@pytest.mark.django_db
+def test_seed_scale_without_copy():
+    seed(no_copy=True)
+
+    assert Submission.objects.count() == 300
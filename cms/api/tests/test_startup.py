@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from api import docs
+from api.importtime import import_profile
+from api.schema import SchemaDocument
+from api.startup import warm_up
+from api.views.course import CourseDetailView
+
+
+def test_swagger_metadata_is_built_on_schema_generation():
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'import sys, django; django.setup(); import cms.urls, api.docs; '
+         'print("drf_yasg.codecs" in sys.modules, len(api.docs._pending))'],
+        capture_output=True, text=True, cwd=settings.BASE_DIR, check=True
+    )
+    loaded, pending = result.stdout.split()
+
+    assert loaded == 'False'
+    assert int(pending) > 30
+
+    SchemaDocument.generate()
+
+    assert not docs._pending
+    assert CourseDetailView.get._swagger_auto_schema['tags'] == ['courses']
+
+
+def test_api_urls_do_not_import_openapi():
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'import sys, django; django.setup(); import api.urls; '
+         'print("drf_yasg.openapi" in sys.modules)'],
+        capture_output=True, text=True, cwd=settings.BASE_DIR, check=True
+    )
+
+    assert result.stdout.strip() == 'False'
+
+
+def test_warm_up():
+    report = warm_up()
+
+    assert report['urls'] > 50
+    assert report['serializers'] >= 8
+
+
+def test_import_profile():
+    total, modules = import_profile('json')
+
+    assert total > 0
+    assert modules['json'][1] >= modules['json'][0] > 0
+    assert 'json.decoder' in modules
+
+
+def test_startup_benchmark_command(tmp_path):
+    output = StringIO()
+    call_command(
+        'startup_benchmark', target='json', runs=1, top=3,
+        output=str(tmp_path / 'startup.json'), stdout=output
+    )
+
+    assert output.getvalue().startswith('json: ')
+    assert (tmp_path / 'startup.json').exists()
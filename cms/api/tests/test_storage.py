@@ -0,0 +1,162 @@
+import hashlib
+import pytest
+from django.core.files.base import ContentFile
+from api.models import Lecture, StoredBlob, Submission
+from api.storage import upload_storage
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+    return tmp_path
+
+
+def blob_files(media_root):
+    return [path for path in (media_root / 'blobs').rglob('*') if path.is_file()]
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_one_blob(course, uploaded_file, media_root):
+    first = Lecture.objects.create(course=course, topic='A', file=uploaded_file(name='a.pdf'))
+    second = Lecture.objects.create(course=course, topic='B', file=uploaded_file(name='b.pdf'))
+
+    digest = hashlib.sha256(b'Test file content').hexdigest()
+
+    assert first.file.name == second.file.name == f'blobs/{digest[:2]}/{digest}.pdf'
+    assert len(blob_files(media_root)) == 1
+    assert StoredBlob.objects.get(name=first.file.name).refcount == 2
+
+
+@pytest.mark.django_db
+def test_different_content_is_stored_separately(course, uploaded_file, media_root):
+    Lecture.objects.create(course=course, topic='A', file=uploaded_file(content=b'one'))
+    Lecture.objects.create(course=course, topic='B', file=uploaded_file(content=b'two'))
+
+    assert len(blob_files(media_root)) == 2
+    assert StoredBlob.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_blob_is_removed_with_last_reference(
+    course, assignment, student_user, uploaded_file, media_root,
+    django_capture_on_commit_callbacks
+):
+    lecture = Lecture.objects.create(course=course, topic='A', file=uploaded_file())
+    submission = Submission.objects.create(
+        user=student_user, assignment=assignment, file=uploaded_file()
+    )
+    name = lecture.file.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        submission.delete()
+
+    assert upload_storage().exists(name)
+    assert StoredBlob.objects.get(name=name).refcount == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lecture.delete()
+
+    assert not upload_storage().exists(name)
+    assert not StoredBlob.objects.filter(name=name).exists()
+
+
+@pytest.mark.django_db
+def test_replaced_file_releases_old_blob(
+    course, uploaded_file, media_root, django_capture_on_commit_callbacks
+):
+    lecture = Lecture.objects.create(
+        course=course, topic='A', file=uploaded_file(content=b'one')
+    )
+    Lecture.objects.create(
+        course=course, topic='B', file=uploaded_file(content=b'one')
+    )
+    old = lecture.file.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lecture.file = uploaded_file(content=b'two')
+        lecture.save()
+
+    assert StoredBlob.objects.get(name=old).refcount == 1
+    assert StoredBlob.objects.get(name=lecture.file.name).refcount == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Lecture.objects.get(topic='B').delete()
+        lecture.file = uploaded_file(content=b'three')
+        lecture.save()
+
+    assert not upload_storage().exists(old)
+    assert not StoredBlob.objects.filter(name=old).exists()
+    assert len(blob_files(media_root)) == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lecture.topic = 'Renamed'
+        lecture.save()
+
+    assert upload_storage().exists(lecture.file.name)
+
+
+@pytest.mark.django_db
+def test_same_content_replace_keeps_one_reference(
+    course, uploaded_file, media_root, django_capture_on_commit_callbacks
+):
+    lecture = Lecture.objects.create(course=course, topic='A', file=uploaded_file())
+    name = lecture.file.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lecture.file = uploaded_file(name='again.pdf')
+        lecture.save()
+
+    assert lecture.file.name == name
+    assert lecture.file_name == 'again.pdf'
+    assert StoredBlob.objects.get(name=name).refcount == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lecture.delete()
+
+    assert not StoredBlob.objects.filter(name=name).exists()
+    assert blob_files(media_root) == []
+
+
+@pytest.mark.django_db
+def test_blob_saved_before_unlink_is_kept(
+    course, uploaded_file, media_root, django_capture_on_commit_callbacks
+):
+    lecture = Lecture.objects.create(course=course, topic='A', file=uploaded_file())
+    name = lecture.file.name
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        lecture.delete()
+
+    second = Lecture.objects.create(course=course, topic='B', file=uploaded_file())
+    for callback in callbacks:
+        callback()
+
+    assert second.file.name == name
+    assert upload_storage().exists(name)
+    assert StoredBlob.objects.get(name=name).refcount == 1
+
+
+@pytest.mark.django_db
+def test_unknown_names_are_left_alone(media_root):
+    (media_root / 'lectures').mkdir()
+    (media_root / 'lectures' / 'legacy.pdf').write_bytes(b'legacy')
+
+    upload_storage().delete('lectures/legacy.pdf')
+
+    assert (media_root / 'lectures' / 'legacy.pdf').exists()
+
+
+@pytest.mark.django_db
+def test_temporary_file_is_moved_into_place(tmp_path, media_root):
+    part = tmp_path / 'part'
+    part.write_bytes(b'chunked')
+
+    class PartFile(ContentFile):
+        def temporary_file_path(self):
+            return str(part)
+
+    name = upload_storage().save('submissions/x.bin', PartFile(b'chunked'))
+
+    assert name.endswith(hashlib.sha256(b'chunked').hexdigest() + '.bin')
+    assert not part.exists()
@@ -64,14 +64,14 @@ def test_assignment_list_access(teacher_user, student_user, django_user_model):
 
     client.force_authenticate(user=teacher_user)
     response = client.get(url)
-    data = response.json()
+    data = response.json()['results']
     assert response.status_code == 200
     assert len(data) == 2
     client.force_authenticate(user=None)
 
     client.force_authenticate(user=student_user)
     response = client.get(url)
-    data = response.json()
+    data = response.json()['results']
     assert response.status_code == 200
     assert len(data) == 2
     client.force_authenticate(user=None)
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from api.models import Enrollment, Lecture
+from api.views.asynchronous import AsyncAssignmentListView, \
+    AsyncCourseDetailView, AsyncCourseListView, AsyncLectureAllListView, \
+    AsyncLectureDetailView, AsyncLectureListView
+
+
+def call_async(view_class, path, user=None, **kwargs):
+    headers = {}
+    if user is not None:
+        headers['HTTP_AUTHORIZATION'] = f'Bearer {AccessToken.for_user(user)}'
+
+    request = RequestFactory().get(path, **headers)
+    response = async_to_sync(view_class.as_view())(request, **kwargs)
+
+    return response, json.loads(response.content)
+
+
+def call_sync(path, user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+    response = client.get(path)
+
+    return response.status_code, json.loads(response.content)
+
+
+@pytest.mark.django_db
+def test_async_views_match_sync_views(student_user, course, lecture,
+                                      assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+    Lecture.objects.create(course=course, topic='Second', file='lectures/b.pdf')
+
+    cases = [
+        (AsyncCourseListView, '/api/v1/courses/', {}),
+        (AsyncCourseDetailView, f'/api/v1/courses/{course.id}/',
+         {'pk': course.id}),
+        (AsyncLectureAllListView, '/api/v1/lectures/?page_size=1', {}),
+        (AsyncLectureListView, f'/api/v1/lectures/course/{course.id}/',
+         {'course_id': course.id}),
+        (AsyncLectureDetailView, f'/api/v1/lectures/{lecture.id}/',
+         {'pk': lecture.id}),
+        (AsyncAssignmentListView,
+         f'/api/v1/assignments/lecture/{lecture.id}/',
+         {'lecture_id': lecture.id}),
+    ]
+
+    for view_class, path, kwargs in cases:
+        response, data = call_async(view_class, path, student_user, **kwargs)
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/json'
+        assert (200, data) == call_sync(path, student_user), path
+
+
+@pytest.mark.django_db
+def test_async_views_follow_cursor(student_user, course, lecture):
+    Enrollment.objects.create(user=student_user, course=course)
+    Lecture.objects.create(course=course, topic='Second', file='lectures/b.pdf')
+
+    _, first = call_async(
+        AsyncLectureAllListView, '/api/v1/lectures/?page_size=1', student_user
+    )
+    _, second = call_async(
+        AsyncLectureAllListView, first['next'], student_user
+    )
+
+    assert [row['topic'] for row in first['results'] + second['results']] == [
+        'Test Lecture', 'Second'
+    ]
+    assert second['next'] is None
+    assert second['previous'] is not None
+
+
+@pytest.mark.django_db
+def test_async_views_reject_anonymous(course):
+    response, data = call_async(
+        AsyncCourseDetailView, f'/api/v1/courses/{course.id}/', pk=course.id
+    )
+
+    assert response.status_code == 401
+    assert response['WWW-Authenticate'].startswith('Bearer')
+    assert 'credentials' in data['detail']
+
+
+@pytest.mark.django_db
+def test_async_views_check_enrollment(student_user, course, lecture):
+    response, _ = call_async(
+        AsyncLectureDetailView, f'/api/v1/lectures/{lecture.id}/',
+        student_user, pk=lecture.id
+    )
+    assert response.status_code == 403
+
+    response, data = call_async(
+        AsyncLectureListView, f'/api/v1/lectures/course/{course.id}/',
+        student_user, course_id=course.id
+    )
+    assert response.status_code == 403
+    assert data['detail'] == 'You are not enrolled in this course'
+
+    response, _ = call_async(
+        AsyncAssignmentListView, '/api/v1/assignments/lecture/0/',
+        student_user, lecture_id=0
+    )
+    assert response.status_code == 404
@@ -47,7 +47,7 @@ def test_comment_list(student_user, teacher_user):
     response = client.get(f"/api/v1/submissions/{submission.id}/comments/")
     assert response.status_code == 200
 
-    data = response.json()
+    data = response.json()['results']
     assert len(data) == 1
     assert data[0]['content'] == "Hello comment"
 
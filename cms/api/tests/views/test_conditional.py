@@ -0,0 +1,128 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from api.models import Assignment, Enrollment, Lecture
+from api.views.asynchronous import AsyncCourseDetailView
+
+
+@pytest.fixture
+def client(student_user, course):
+    Enrollment.objects.create(user=student_user, course=course)
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+
+    return client
+
+
+def revalidate(client, path):
+    response = client.get(path)
+    assert response.status_code == 200
+
+    return response, client.get(path, HTTP_IF_NONE_MATCH=response['ETag'])
+
+
+@pytest.mark.django_db
+def test_unchanged_course_is_not_modified(client, course, lecture):
+    response, cached = revalidate(client, f'/api/v1/courses/{course.id}/')
+
+    assert response['Cache-Control'] == 'private, no-cache'
+    assert cached.status_code == 304
+    assert cached.content == b''
+    assert cached['ETag'] == response['ETag']
+
+
+@pytest.mark.django_db
+def test_changes_invalidate_etag(client, course, lecture, assignment):
+    path = f'/api/v1/lectures/course/{course.id}/'
+    etag = client.get(path)['ETag']
+
+    assignment.title = 'Renamed'
+    assignment.save()
+    response = client.get(path, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+    etag = response['ETag']
+    Assignment.objects.get(pk=assignment.pk).delete()
+    response = client.get(path, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data['results'][0]['assignments'] == []
+
+
+@pytest.mark.django_db
+def test_list_etags_follow_pages(client, course, lecture):
+    Lecture.objects.create(course=course, topic='Second', file='lectures/b.pdf')
+
+    first, cached = revalidate(client, '/api/v1/lectures/?page_size=1')
+    assert cached.status_code == 304
+
+    second = client.get(
+        first.data['next'], HTTP_IF_NONE_MATCH=first['ETag']
+    )
+    assert second.status_code == 200
+    assert second['ETag'] != first['ETag']
+
+
+@pytest.mark.django_db
+def test_validators_respect_permissions(client, teacher_user, course,
+                                        assignment):
+    path = f'/api/v1/assignments/{assignment.id}/'
+    response, cached = revalidate(client, path)
+    assert cached.status_code == 304
+
+    Enrollment.objects.filter(course=course).delete()
+    response = client.get(path, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 403
+
+    owner = APIClient()
+    owner.force_authenticate(user=teacher_user)
+    response = owner.get('/api/v1/courses/')
+    assert response['ETag'] != client.get('/api/v1/courses/')['ETag']
+
+
+@pytest.mark.django_db
+def test_async_views_share_validators(client, student_user, course, lecture):
+    path = f'/api/v1/courses/{course.id}/'
+    etag = client.get(path)['ETag']
+
+    request = RequestFactory().get(
+        path, HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(student_user)}',
+        HTTP_IF_NONE_MATCH=etag
+    )
+    response = async_to_sync(AsyncCourseDetailView.as_view())(
+        request, pk=course.id
+    )
+
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+
+@pytest.mark.django_db
+def test_list_etags_cover_only_the_served_page(client, course, lecture):
+    other = Lecture.objects.create(
+        course=course, topic='Second', file='lectures/b.pdf'
+    )
+    path = '/api/v1/lectures/?page_size=1'
+    etag = client.get(path)['ETag']
+
+    other.topic = 'Renamed'
+    other.save()
+    assert client.get(path, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    lecture.topic = 'Renamed'
+    lecture.save()
+    assert client.get(path, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_not_modified_lists_skip_prefetches(client, course, lecture):
+    etag = client.get('/api/v1/courses/')['ETag']
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get('/api/v1/courses/', HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert len(queries) == 2
@@ -1,6 +1,7 @@
 import pytest
-from rest_framework.test import APIClient
-from api.models import Course, Enrollment
+from rest_framework.test import APIClient, APIRequestFactory
+from api.models import Assignment, Course, Enrollment, Lecture
+from api.permissions import IsEnrolled
 
 
 @pytest.mark.django_db
@@ -62,11 +63,103 @@ def test_course_list_view(teacher_user, student_user, course):
 
     response = api_client.get("/api/v1/courses/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()['results']
     assert any(c['id'] == course.id for c in data)
 
     api_client.force_authenticate(user=student_user)
     Enrollment.objects.get_or_create(user=student_user, course=course)
     response = api_client.get("/api/v1/courses/")
-    data = response.json()
+    data = response.json()['results']
     assert any(c['id'] == course.id for c in data)
+
+
+@pytest.mark.django_db
+def test_owner_list_and_detail_access_agree(teacher_user, course, lecture):
+    api_client = APIClient()
+    api_client.force_authenticate(user=teacher_user)
+
+    data = api_client.get("/api/v1/courses/").json()['results']
+    assert [c['id'] for c in data] == [course.id]
+
+    assert api_client.get(f"/api/v1/courses/{course.id}/").status_code == 200
+    response = api_client.get(f"/api/v1/lectures/{lecture.id}/")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_owner_list_and_detail_access_agree(teacher_user, course):
+    api_client = APIClient()
+    api_client.force_authenticate(user=teacher_user)
+
+    assert api_client.get("/api/v1/courses/").json()['results'] == []
+    assert api_client.get(f"/api/v1/courses/{course.id}/").status_code == 403
+
+    Enrollment.objects.create(user=teacher_user, course=course)
+    data = api_client.get("/api/v1/courses/").json()['results']
+
+    assert [c['id'] for c in data] == [course.id]
+    assert api_client.get(f"/api/v1/courses/{course.id}/").status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("course_count", [1, 50])
+def test_course_list_access_is_single_query(
+    teacher_user, student_user, course_count, django_assert_num_queries
+):
+    courses = Course.objects.bulk_create([
+        Course(title=f"Course {i}", description="Desc")
+        for i in range(course_count)
+    ])
+    Enrollment.objects.bulk_create([
+        Enrollment(user=student_user, course=course)
+        for course in courses[::2]
+    ])
+    owned = Course.objects.create(
+        title="Owned", description="Desc", owner=student_user
+    )
+    request = APIRequestFactory().get("/api/v1/courses/")
+    request.user = student_user
+    IsEnrolled.course_access(request)
+
+    with django_assert_num_queries(1):
+        accessible = list(IsEnrolled.accessible_courses(request))
+
+    assert [c.id for c in accessible] == [c.id for c in courses[::2]]
+    assert owned not in accessible
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("course_count", [1, 20])
+def test_course_list_constant_queries(
+    teacher_user, student_user, course_count, django_assert_num_queries
+):
+    courses = Course.objects.bulk_create([
+        Course(title=f"Course {i}", description="Desc", owner=teacher_user)
+        for i in range(course_count)
+    ])
+    Enrollment.objects.bulk_create([
+        Enrollment(user=user, course=course)
+        for course in courses
+        for user in (teacher_user, student_user)
+    ])
+    lectures = Lecture.objects.bulk_create([
+        Lecture(course=course, topic="Lecture", file="lectures/file.pdf")
+        for course in courses
+    ])
+    Assignment.objects.bulk_create([
+        Assignment(lecture=lecture, course_id=lecture.course_id, title="Assignment")
+        for lecture in lectures
+    ])
+
+    api_client = APIClient()
+    api_client.force_authenticate(user=student_user)
+
+    with django_assert_num_queries(6):
+        response = api_client.get("/api/v1/courses/")
+
+    assert response.status_code == 200
+    assert len(response.data['results']) == course_count
+    for item in response.data['results']:
+        assert [t['id'] for t in item['teachers']] == [teacher_user.id]
+        assert [s['id'] for s in item['students']] == [student_user.id]
+        assert len(item['lectures'][0]['assignments']) == 1
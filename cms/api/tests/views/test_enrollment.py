@@ -1,6 +1,7 @@
 import pytest
 from rest_framework.test import APIClient
-from api.models import Enrollment
+from api.models import Course, Enrollment
+from api.services import EnrollmentService
 
 
 @pytest.mark.django_db
@@ -112,3 +113,126 @@ def test_unenroll_missing_fields(teacher_user):
     response = client.delete("/api/v1/courses/unenroll/", {}, format='json')
     assert response.status_code == 400
     assert 'course_id and user_id are required' in response.data['detail']
+
+
+@pytest.mark.django_db
+def test_bulk_enroll_by_user_ids(teacher_user, student_user, course,
+                                 django_user_model, monkeypatch):
+    monkeypatch.setattr(EnrollmentService, 'BULK_CHUNK_SIZE', 2)
+    Enrollment.objects.create(user=teacher_user, course=course)
+    students = [
+        django_user_model.objects.create(
+            email=f"bulk{i}@test.com", role="student"
+        )
+        for i in range(3)
+    ]
+    Enrollment.objects.create(user=students[0], course=course)
+
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+
+    user_ids = [s.id for s in students] + [students[1].id, 999999, "abc"]
+    response = client.post(
+        "/api/v1/courses/enroll/bulk/",
+        {"course_id": course.id, "user_ids": user_ids},
+        format="json"
+    )
+
+    assert response.status_code == 200
+    assert response.data['enrolled'] == 2
+    assert [r['status'] for r in response.data['results']] == [
+        'already_enrolled', 'enrolled', 'enrolled',
+        'duplicate', 'not_found', 'invalid'
+    ]
+    assert Enrollment.objects.filter(course=course).count() == 4
+
+
+@pytest.mark.django_db
+def test_bulk_enroll_by_csv(teacher_user, student_user, course, uploaded_file):
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+
+    csv_file = uploaded_file(
+        name="students.csv",
+        content=(
+            f"email\n{student_user.email.upper()}\nmissing@test.com\n"
+            "not-an-email\n"
+        ).encode(),
+        content_type="text/csv"
+    )
+    response = client.post(
+        "/api/v1/courses/enroll/bulk/",
+        {"course_id": course.id, "file": csv_file},
+        format="multipart"
+    )
+
+    assert response.status_code == 200
+    assert response.data['results'] == [
+        {'user': student_user.email.upper(), 'status': 'enrolled'},
+        {'user': 'missing@test.com', 'status': 'not_found'},
+        {'user': 'not-an-email', 'status': 'invalid'},
+    ]
+    assert Enrollment.objects.filter(user=student_user, course=course).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_enroll_invalidates_gradebook(teacher_user, student_user, course):
+    Enrollment.objects.create(user=teacher_user, course=course)
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+    gradebook = f"/api/v1/courses/{course.id}/gradebook/"
+
+    assert student_user.id not in client.get(gradebook).json()['students']['id']
+
+    response = client.post(
+        "/api/v1/courses/enroll/bulk/",
+        {"course_id": course.id, "user_ids": [student_user.id]},
+        format="json"
+    )
+    assert response.data['enrolled'] == 1
+
+    assert student_user.id in client.get(gradebook).json()['students']['id']
+
+
+@pytest.mark.django_db
+def test_bulk_enroll_constant_queries(
+    teacher_user, course, django_user_model, django_assert_max_num_queries
+):
+    django_user_model.objects.bulk_create([
+        django_user_model(email=f"many{i}@test.com", role="student")
+        for i in range(200)
+    ])
+    emails = [f"many{i}@test.com" for i in range(200)]
+
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+
+    with django_assert_max_num_queries(10):
+        response = client.post(
+            "/api/v1/courses/enroll/bulk/",
+            {"course_id": course.id, "emails": emails},
+            format="json"
+        )
+
+    assert response.status_code == 200
+    assert response.data['enrolled'] == 200
+
+
+@pytest.mark.django_db
+def test_bulk_enroll_forbidden_without_access(teacher_user, student_user,
+                                              django_user_model):
+    other = django_user_model.objects.create(
+        email="other@test.com", role="teacher"
+    )
+    course = Course.objects.create(title="Other", description="Desc", owner=other)
+
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+    response = client.post(
+        "/api/v1/courses/enroll/bulk/",
+        {"course_id": course.id, "user_ids": [student_user.id]},
+        format="json"
+    )
+
+    assert response.status_code == 403
+    assert not Enrollment.objects.filter(course=course).exists()
@@ -102,3 +102,190 @@ def test_grade_delete(student_user, teacher_user):
     response = client.delete(f"/api/v1/grades/{grade.id}/delete/")
     assert response.status_code == 204
     assert not Grade.objects.filter(id=grade.id).exists()
+
+
+@pytest.mark.django_db
+def test_grade_batch_upsert(student_user, teacher_user, django_user_model,
+                            django_assert_max_num_queries):
+    client = APIClient()
+    course = Course.objects.create(title="Course 6", description="Desc", owner=teacher_user)
+    Enrollment.objects.create(user=teacher_user, course=course)
+
+    lecture = Lecture.objects.create(course=course, topic="Lecture 6", file="lectures/file6.pdf")
+    assignment = Assignment.objects.create(lecture=lecture, title="Assignment 6", description="Desc")
+    students = django_user_model.objects.bulk_create([
+        django_user_model(email=f"batch{i}@test.com", role="student")
+        for i in range(50)
+    ])
+    submissions = Submission.objects.bulk_create([
+        Submission(user=s, assignment=assignment, course=course, file="sub/file6.pdf")
+        for s in students
+    ])
+    Grade.objects.create(submission=submissions[0], teacher=teacher_user, score=10)
+
+    client.force_authenticate(user=teacher_user)
+    payload = {
+        "assignment": assignment.id,
+        "grades": [{"submission": s.id, "score": 80} for s in submissions]
+    }
+
+    with django_assert_max_num_queries(3):
+        response = client.post("/api/v1/grades/batch/", payload, format="json")
+
+    assert response.status_code == 200
+    assert len(response.data) == 50
+    assert Grade.objects.filter(submission__in=submissions).count() == 50
+    assert set(Grade.objects.values_list('score', flat=True)) == {80}
+
+
+@pytest.mark.django_db
+def test_grade_batch_rejects_foreign_submissions(student_user, teacher_user):
+    client = APIClient()
+    course = Course.objects.create(title="Course 7", description="Desc", owner=teacher_user)
+    Enrollment.objects.create(user=teacher_user, course=course)
+
+    lecture = Lecture.objects.create(course=course, topic="Lecture 7", file="lectures/file7.pdf")
+    assignment = Assignment.objects.create(lecture=lecture, title="Assignment 7", description="Desc")
+    other = Assignment.objects.create(lecture=lecture, title="Other", description="Desc")
+    submission = Submission.objects.create(user=student_user, assignment=other, file="sub/file7.pdf")
+
+    client.force_authenticate(user=teacher_user)
+    response = client.post("/api/v1/grades/batch/", {
+        "assignment": assignment.id,
+        "grades": [{"submission": submission.id, "score": 50}]
+    }, format="json")
+
+    assert response.status_code == 400
+    assert response.data['submissions'] == [submission.id]
+    assert not Grade.objects.exists()
+
+
+@pytest.mark.django_db
+def test_grade_batch_forbidden_not_enrolled(student_user, teacher_user):
+    client = APIClient()
+    course = Course.objects.create(title="Course 8", description="Desc", owner=teacher_user)
+    lecture = Lecture.objects.create(course=course, topic="Lecture 8", file="lectures/file8.pdf")
+    assignment = Assignment.objects.create(lecture=lecture, title="Assignment 8", description="Desc")
+    submission = Submission.objects.create(user=student_user, assignment=assignment, file="sub/file8.pdf")
+
+    client.force_authenticate(user=teacher_user)
+    response = client.post("/api/v1/grades/batch/", {
+        "assignment": assignment.id,
+        "grades": [{"submission": submission.id, "score": 120}]
+    }, format="json")
+    assert response.status_code == 400
+
+    response = client.post("/api/v1/grades/batch/", {
+        "assignment": assignment.id,
+        "grades": [{"submission": submission.id, "score": 90}]
+    }, format="json")
+    assert response.status_code == 403
+    assert not Grade.objects.exists()
+
+
+@pytest.fixture
+def gradebook_course(teacher_user, student_user, django_user_model):
+    course = Course.objects.create(title="Gradebook", description="Desc", owner=teacher_user)
+    other = django_user_model.objects.create_user(
+        email="other@test.com", password="pass123", role="student"
+    )
+    Enrollment.objects.create(user=teacher_user, course=course)
+    Enrollment.objects.create(user=student_user, course=course)
+    Enrollment.objects.create(user=other, course=course)
+
+    lecture = Lecture.objects.create(course=course, topic="Lecture", file="lectures/file.pdf")
+    first = Assignment.objects.create(lecture=lecture, title="First", description="Desc")
+    second = Assignment.objects.create(lecture=lecture, title="Second", description="Desc")
+
+    for score in (40, 80):
+        submission = Submission.objects.create(user=student_user, assignment=first, file="sub/file.pdf")
+        Grade.objects.create(submission=submission, teacher=teacher_user, score=score)
+
+    submission = Submission.objects.create(user=other, assignment=second, file="sub/file.pdf")
+    Grade.objects.create(submission=submission, teacher=teacher_user, score=70)
+
+    return course, [student_user, other], [first, second]
+
+
+@pytest.mark.django_db
+def test_gradebook_matrix(teacher_user, gradebook_course):
+    course, students, assignments = gradebook_course
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+
+    response = client.get(f"/api/v1/courses/{course.id}/gradebook/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data['students']['id'] == [student.id for student in students]
+    assert data['assignments']['title'] == ["First", "Second"]
+    assert data['scores'] == [[80, None], [None, 70]]
+
+
+@pytest.mark.django_db
+def test_gradebook_csv(teacher_user, student_user, gradebook_course):
+    course, students, _ = gradebook_course
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+
+    response = client.get(f"/api/v1/courses/{course.id}/gradebook/?format=csv")
+
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/csv')
+    assert response.content.decode().splitlines() == [
+        'student_id,email,First,Second',
+        f'{students[0].id},{students[0].email},80,',
+        f'{students[1].id},{students[1].email},,70',
+    ]
+
+
+@pytest.mark.django_db
+def test_gradebook_is_cached_and_invalidated(
+    teacher_user, gradebook_course, django_assert_num_queries
+):
+    course, students, assignments = gradebook_course
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+    url = f"/api/v1/courses/{course.id}/gradebook/"
+
+    client.get(url)
+    with django_assert_num_queries(0):
+        client.get(url)
+
+    submission = Submission.objects.create(user=students[1], assignment=assignments[0], file="sub/file.pdf")
+    Grade.objects.create(submission=submission, teacher=teacher_user, score=55)
+
+    assert client.get(url).json()['scores'][1] == [55, 70]
+
+
+@pytest.mark.django_db
+def test_gradebook_batch_invalidates(teacher_user, gradebook_course):
+    course, students, assignments = gradebook_course
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+    url = f"/api/v1/courses/{course.id}/gradebook/"
+    client.get(url)
+
+    submission = Submission.objects.get(assignment=assignments[1])
+    client.post("/api/v1/grades/batch/", data={
+        "assignment": assignments[1].id,
+        "grades": [{"submission": submission.id, "score": 99}]
+    }, format='json')
+
+    assert client.get(url).json()['scores'][1] == [None, 99]
+
+
+@pytest.mark.django_db
+def test_gradebook_forbidden(student_user, gradebook_course, django_user_model):
+    course, _, _ = gradebook_course
+    outsider = django_user_model.objects.create_user(
+        email="outsider@test.com", password="pass123", role="teacher"
+    )
+    client = APIClient()
+
+    client.force_authenticate(user=student_user)
+    assert client.get(f"/api/v1/courses/{course.id}/gradebook/").status_code == 403
+
+    client.force_authenticate(user=outsider)
+    assert client.get(f"/api/v1/courses/{course.id}/gradebook/").status_code == 403
+    assert client.get("/api/v1/courses/999999/gradebook/").status_code == 404
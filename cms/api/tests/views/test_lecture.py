@@ -1,6 +1,6 @@
 import pytest
 from rest_framework.test import APIClient
-from api.models import Enrollment, Lecture
+from api.models import Course, Enrollment, Lecture
 
 
 @pytest.mark.django_db
@@ -60,7 +60,7 @@ def test_lecture_list_access(teacher_user, student_user, course, lecture):
     client.force_authenticate(user=teacher_user)
     response = client.get(f"/api/v1/lectures/course/{course.id}/")
     assert response.status_code == 200
-    assert len(response.data) >= 1
+    assert len(response.data['results']) >= 1
 
     client.force_authenticate(user=student_user)
     response = client.get(f"/api/v1/lectures/course/{course.id}/")
@@ -111,3 +111,29 @@ def test_lecture_delete_forbidden(student_user, lecture):
 
     response = client.delete(f"/api/v1/lectures/{lecture.id}/delete/")
     assert response.status_code == 403
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("lecture_count", [1, 30])
+def test_lecture_all_list_constant_queries(
+    teacher_user, student_user, course, lecture_count,
+    django_assert_num_queries
+):
+    hidden = Course.objects.create(title="Hidden", description="Desc")
+    Enrollment.objects.create(user=student_user, course=course)
+    Lecture.objects.bulk_create([
+        Lecture(course=c, topic=f"Lecture {i}", file="lectures/file.pdf")
+        for i in range(lecture_count)
+        for c in (course, hidden)
+    ])
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+
+    with django_assert_num_queries(4):
+        response = client.get("/api/v1/lectures/")
+
+    assert response.status_code == 200
+    results = response.data['results']
+    assert len(results) == lecture_count
+    assert all(item["course"] == course.id for item in results)
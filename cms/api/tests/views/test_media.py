@@ -0,0 +1,140 @@
+import pytest
+from django.core.files.base import ContentFile
+from rest_framework.test import APIClient
+from api.models import Enrollment, Lecture, Submission
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.MEDIA_SENDFILE = ''
+
+    return tmp_path
+
+
+@pytest.fixture
+def lecture_with_file(course):
+    lecture = Lecture(course=course, topic="Video")
+    lecture.file.save("video.mp4", ContentFile(b"0123456789" * 100))
+
+    return lecture
+
+
+def content_of(response):
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_lecture_file_download(student_user, course, lecture_with_file):
+    Enrollment.objects.create(user=student_user, course=course)
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.get(f"/api/v1/lectures/{lecture_with_file.id}/file/")
+
+    assert response.status_code == 200
+    assert content_of(response) == b"0123456789" * 100
+    assert response['Accept-Ranges'] == 'bytes'
+    assert response['ETag']
+    assert response['Content-Disposition'] == 'inline; filename="video.mp4"'
+
+
+@pytest.mark.django_db
+def test_lecture_file_range_and_etag(student_user, course, lecture_with_file):
+    Enrollment.objects.create(user=student_user, course=course)
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    url = f"/api/v1/lectures/{lecture_with_file.id}/file/"
+
+    response = client.get(url, HTTP_RANGE="bytes=10-19")
+    assert response.status_code == 206
+    assert response['Content-Range'] == 'bytes 10-19/1000'
+    assert content_of(response) == b"0123456789"
+
+    response = client.get(url, HTTP_RANGE="bytes=-5")
+    assert response.status_code == 206
+    assert content_of(response) == b"56789"
+
+    response = client.get(url, HTTP_RANGE="bytes=5000-")
+    assert response.status_code == 416
+
+    etag = client.get(url)['ETag']
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_lecture_file_forbidden_not_enrolled(student_user, lecture_with_file):
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.get(f"/api/v1/lectures/{lecture_with_file.id}/file/")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_lecture_file_nginx_sendfile(student_user, course, lecture_with_file,
+                                     settings):
+    settings.MEDIA_SENDFILE = 'nginx'
+    Enrollment.objects.create(user=student_user, course=course)
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.get(f"/api/v1/lectures/{lecture_with_file.id}/file/")
+
+    assert response.status_code == 200
+    assert response['X-Accel-Redirect'] == (
+        '/protected-media/' + lecture_with_file.file.name
+    )
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_submission_file_owner_and_teacher(student_user, teacher_user, course,
+                                           assignment, django_user_model):
+    submission = Submission(user=student_user, assignment=assignment)
+    submission.file.save("answer.pdf", ContentFile(b"answer"))
+    Enrollment.objects.create(user=teacher_user, course=course)
+    outsider = django_user_model.objects.create(
+        email="outsider@test.com", role="student"
+    )
+
+    client = APIClient()
+    url = f"/api/v1/submissions/{submission.id}/file/"
+
+    client.force_authenticate(user=student_user)
+    assert content_of(client.get(url)) == b"answer"
+
+    client.force_authenticate(user=teacher_user)
+    assert client.get(url).status_code == 200
+
+    client.force_authenticate(user=outsider)
+    assert client.get(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_serialized_file_links_download(student_user, course, assignment,
+                                        lecture_with_file, settings):
+    Enrollment.objects.create(user=student_user, course=course)
+    submission = Submission(user=student_user, assignment=assignment)
+    submission.file.save("answer.pdf", ContentFile(b"answer"))
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+
+    url = client.get(f"/api/v1/lectures/{lecture_with_file.id}/").data['file']
+    assert url == (
+        f"http://testserver/api/v1/lectures/{lecture_with_file.id}/file/"
+    )
+    assert content_of(client.get(url)) == b"0123456789" * 100
+
+    url = client.get(f"/api/v1/submissions/{submission.id}/").data['file']
+    assert content_of(client.get(url)) == b"answer"
+
+    settings.MEDIA_SENDFILE = 'nginx'
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response['X-Accel-Redirect'] == (
+        '/protected-media/' + submission.file.name
+    )
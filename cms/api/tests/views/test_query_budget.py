@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from api.models import User, Course, Enrollment, Lecture, Assignment, \
+    Submission, Grade, Comment
+from api.tests.budget import SIZES, assert_query_budget, capture
+
+
+def build_course(size, prefix):
+    teacher = User.objects.create_user(
+        email=f'{prefix}-teacher@test.com', password='123', role='teacher'
+    )
+    student = User.objects.create_user(
+        email=f'{prefix}-student@test.com', password='123', role='student'
+    )
+    classmates = User.objects.bulk_create([
+        User(email=f'{prefix}-classmate{i}@test.com', role='student')
+        for i in range(size)
+    ])
+    outsiders = User.objects.bulk_create([
+        User(email=f'{prefix}-outsider{i}@test.com', role='student')
+        for i in range(size)
+    ])
+
+    course = Course.objects.create(
+        title=f'Course {prefix}', description='Desc', owner=teacher
+    )
+    Enrollment.objects.bulk_create([
+        Enrollment(user=user, course=course)
+        for user in (teacher, student, *classmates)
+    ])
+    lectures = Lecture.objects.bulk_create([
+        Lecture(course=course, topic=f'Lecture {i}', file='lectures/file.pdf')
+        for i in range(size)
+    ])
+    assignments = Assignment.objects.bulk_create([
+        Assignment(lecture=lectures[0], course=course, title=f'Assignment {i}')
+        for i in range(size)
+    ])
+    submissions = Submission.objects.bulk_create([
+        Submission(
+            user=student, assignment=assignment, course=course,
+            file='submissions/file.pdf'
+        )
+        for assignment in assignments
+    ])
+    grades = Grade.objects.bulk_create([
+        Grade(submission=submission, course=course, teacher=teacher, score=80)
+        for submission in submissions
+    ])
+    Comment.objects.bulk_create([
+        Comment(
+            submission=submissions[0], course=course, user=student,
+            content=f'Comment {i}'
+        )
+        for i in range(size)
+    ])
+
+    return SimpleNamespace(
+        teacher=teacher, student=student, outsiders=outsiders, course=course,
+        lecture=lectures[0], assignment=assignments[0],
+        submissions=submissions, grade=grades[0]
+    )
+
+
+ENDPOINTS = [
+    ('teacher', 'get', 'course-list', lambda w: {}, None),
+    ('student', 'get', 'course-detail', lambda w: {'pk': w.course.id}, None),
+    ('student', 'get', 'lecture-list-all', lambda w: {}, None),
+    ('student', 'get', 'lecture-list', lambda w: {'course_id': w.course.id}, None),
+    ('student', 'get', 'lecture-detail', lambda w: {'pk': w.lecture.id}, None),
+    ('student', 'get', 'assignment-list', lambda w: {'lecture_id': w.lecture.id}, None),
+    ('student', 'get', 'assignment-detail', lambda w: {'pk': w.assignment.id}, None),
+    ('student', 'get', 'submission-list', lambda w: {}, None),
+    ('teacher', 'get', 'submission-list', lambda w: {}, None),
+    ('student', 'get', 'submission-detail', lambda w: {'pk': w.submissions[0].id}, None),
+    ('student', 'get', 'comment-list', lambda w: {'submission_id': w.submissions[0].id}, None),
+    ('student', 'get', 'grade-retrieve', lambda w: {'pk': w.grade.id}, None),
+    ('teacher', 'get', 'course-gradebook', lambda w: {'pk': w.course.id}, None),
+    ('teacher', 'post', 'grade-batch', lambda w: {}, lambda w: {
+        'assignment': w.assignment.id,
+        'grades': [{'submission': w.submissions[0].id, 'score': 90}],
+    }),
+    ('teacher', 'post', 'course-enroll-bulk', lambda w: {}, lambda w: {
+        'course_id': w.course.id,
+        'user_ids': [user.id for user in w.outsiders],
+    }),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'role, method, name, kwargs, payload', ENDPOINTS,
+    ids=[f'{name}-{role}' for role, _, name, _, _ in ENDPOINTS]
+)
+def test_endpoint_query_budget(role, method, name, kwargs, payload):
+    runs = {}
+    path = None
+
+    for size in SIZES:
+        world = build_course(size, prefix=f'{name}-{role}-{size}')
+        path = reverse(name, kwargs=kwargs(world))
+        client = APIClient()
+        client.force_authenticate(user=getattr(world, role))
+        data = payload(world) if payload else None
+
+        response, runs[size] = capture(
+            lambda: getattr(client, method)(path, data, format='json')
+        )
+        assert response.status_code < 300, response.content
+
+    assert_query_budget(path, runs)
@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 import os
 from rest_framework.test import APIClient
@@ -28,8 +29,7 @@ def test_submission_create(student_user, teacher_user, uploaded_file):
     assert submission.assignment == assignment
 
     file_name = os.path.basename(submission.file.name)
-    assert file_name.startswith("submission")
-    assert file_name.endswith(".pdf")
+    assert file_name == hashlib.sha256(b"Test file content").hexdigest() + ".pdf"
 
 
 @pytest.mark.django_db
@@ -64,7 +64,7 @@ def test_submission_list_student(student_user, teacher_user):
     client.force_authenticate(user=student_user)
     response = client.get("/api/v1/submissions/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()['results']
     assert any(s['id'] == submission.id for s in data)
 
 
@@ -81,7 +81,7 @@ def test_submission_list_teacher(student_user, teacher_user):
     client.force_authenticate(user=teacher_user)
     response = client.get("/api/v1/submissions/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()['results']
     assert any(s['id'] == submission.id for s in data)
 
 
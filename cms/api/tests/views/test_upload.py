@@ -0,0 +1,258 @@
+import hashlib
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from api.models import Enrollment, Lecture, Submission, UploadSession
+from api.services import UploadService
+from api.services.upload import PartFile
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.UPLOAD_SESSION_ROOT = tmp_path / 'uploads'
+
+    return tmp_path
+
+
+def put_chunk(client, session_id, content, start, total):
+    end = start + len(content) - 1
+
+    return client.put(
+        f"/api/v1/uploads/{session_id}/",
+        data=content,
+        content_type="application/octet-stream",
+        HTTP_CONTENT_RANGE=f"bytes {start}-{end}/{total}"
+    )
+
+
+@pytest.mark.django_db
+def test_resumable_lecture_upload(teacher_user, course, media_root):
+    Enrollment.objects.create(user=teacher_user, course=course)
+    content = b"0123456789" * 10
+
+    client = APIClient()
+    client.force_authenticate(user=teacher_user)
+    response = client.post("/api/v1/uploads/", {
+        "kind": "lecture",
+        "filename": "video.mp4",
+        "size": len(content),
+        "checksum": hashlib.sha256(content).hexdigest(),
+        "course": course.id,
+        "topic": "Chunked Lecture"
+    }, format="json")
+    assert response.status_code == 201
+    session_id = response.data['id']
+
+    response = put_chunk(client, session_id, content[:40], 0, len(content))
+    assert response.status_code == 200
+    assert response.data['received'] == 40
+
+    response = put_chunk(client, session_id, content[60:], 60, len(content))
+    assert response.status_code == 409
+    assert response.data['received'] == 40
+
+    response = client.get(f"/api/v1/uploads/{session_id}/")
+    assert response.data['received'] == 40
+
+    response = put_chunk(client, session_id, content[40:], 40, len(content))
+    assert response.data['received'] == len(content)
+
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+    assert response.status_code == 201
+    assert response.data['sha256'] == hashlib.sha256(content).hexdigest()
+
+    lecture = Lecture.objects.get(id=response.data['id'])
+    assert lecture.topic == "Chunked Lecture"
+    assert lecture.file.read() == content
+    assert not UploadSession.objects.exists()
+    assert not list((media_root / 'uploads').iterdir())
+
+
+def upload_in_chunks(client, user, assignment, content, size=4):
+    client.force_authenticate(user=user)
+    session_id = client.post("/api/v1/uploads/", {
+        "kind": "submission",
+        "filename": "answer.pdf",
+        "size": len(content),
+        "checksum": hashlib.sha256(content).hexdigest(),
+        "assignment": assignment.id
+    }, format="json").data['id']
+
+    for start in range(0, len(content), size):
+        chunk = content[start:start + size]
+        put_chunk(client, session_id, chunk, start, len(content))
+
+    return session_id
+
+
+@pytest.mark.django_db
+def test_finalize_uses_running_checksum(student_user, course, assignment,
+                                        monkeypatch):
+    Enrollment.objects.create(user=student_user, course=course)
+    content = b"chunked answer"
+    client = APIClient()
+    session_id = upload_in_chunks(client, student_user, assignment, content)
+
+    monkeypatch.setattr(
+        UploadService, 'hash_part', lambda session: pytest.fail('reread')
+    )
+    monkeypatch.setattr(
+        PartFile, 'chunks', lambda *args: pytest.fail('rehashed')
+    )
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == 201
+    assert response.data['sha256'] == hashlib.sha256(content).hexdigest()
+    assert Submission.objects.get().file.read() == content
+
+
+@pytest.mark.django_db
+def test_finalize_rehashes_chunks_from_other_workers(student_user, course,
+                                                      assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+    content = b"chunked answer"
+    client = APIClient()
+    session_id = upload_in_chunks(client, student_user, assignment, content)
+    UploadService._digests.clear()
+
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == 201
+    assert response.data['sha256'] == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.django_db
+def test_finalize_runs_once(student_user, course, assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+    content = b"chunked answer"
+    client = APIClient()
+    session_id = upload_in_chunks(client, student_user, assignment, content)
+    UploadSession.objects.filter(pk=session_id).update(finalizing=True)
+
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+    assert response.status_code == 409
+    assert "already being finalized" in response.data['detail']
+
+    response = put_chunk(client, session_id, content[:4], 0, len(content))
+    assert response.status_code == 409
+    assert not Submission.objects.exists()
+
+    UploadSession.objects.filter(pk=session_id).update(finalizing=False)
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+    assert response.status_code == 201
+
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+    assert response.status_code == 404
+    assert Submission.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_running_digests_are_bounded(student_user, course, assignment,
+                                     monkeypatch):
+    Enrollment.objects.create(user=student_user, course=course)
+    monkeypatch.setattr(UploadService, 'MAX_DIGESTS', 2)
+    UploadService._digests.clear()
+    UploadService._digests[uuid.uuid4()] = (
+        timezone.now() - timedelta(days=30), 4, hashlib.sha256()
+    )
+    client = APIClient()
+
+    def upload():
+        return uuid.UUID(
+            upload_in_chunks(client, student_user, assignment, b"data")
+        )
+
+    first = upload()
+    assert list(UploadService._digests) == [first]
+
+    sessions = [first, upload(), upload()]
+    assert list(UploadService._digests) == sessions[1:]
+
+
+@pytest.mark.django_db
+def test_resumable_submission_upload_checksum_mismatch(
+    student_user, course, assignment
+):
+    Enrollment.objects.create(user=student_user, course=course)
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.post("/api/v1/uploads/", {
+        "kind": "submission",
+        "filename": "answer.pdf",
+        "size": 4,
+        "checksum": "0" * 64,
+        "assignment": assignment.id
+    }, format="json")
+    session_id = response.data['id']
+
+    put_chunk(client, session_id, b"data", 0, 4)
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == 409
+    assert not Submission.objects.exists()
+    assert not UploadSession.objects.get().finalizing
+
+
+@pytest.mark.django_db
+def test_upload_finalize_incomplete(student_user, course, assignment):
+    Enrollment.objects.create(user=student_user, course=course)
+
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.post("/api/v1/uploads/", {
+        "kind": "submission",
+        "filename": "answer.pdf",
+        "size": 8,
+        "assignment": assignment.id
+    }, format="json")
+    session_id = response.data['id']
+
+    put_chunk(client, session_id, b"data", 0, 8)
+    response = client.post(f"/api/v1/uploads/{session_id}/finalize/")
+
+    assert response.status_code == 409
+    assert "incomplete" in response.data['detail']
+
+
+@pytest.mark.django_db
+def test_upload_forbidden_not_enrolled(student_user, assignment):
+    client = APIClient()
+    client.force_authenticate(user=student_user)
+    response = client.post("/api/v1/uploads/", {
+        "kind": "submission",
+        "filename": "answer.pdf",
+        "size": 4,
+        "assignment": assignment.id
+    }, format="json")
+
+    assert response.status_code == 403
+    assert not UploadSession.objects.exists()
+
+
+@pytest.mark.django_db
+def test_cleanup_uploads_removes_abandoned_sessions(student_user, assignment):
+    stale = UploadSession.objects.create(
+        user=student_user, kind="submission", filename="a.pdf", size=4,
+        assignment=assignment
+    )
+    fresh = UploadSession.objects.create(
+        user=student_user, kind="submission", filename="b.pdf", size=4,
+        assignment=assignment
+    )
+    path = UploadService.part_path(stale)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"part")
+    UploadSession.objects.filter(pk=stale.pk).update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+
+    call_command("cleanup_uploads")
+
+    assert list(UploadSession.objects.all()) == [fresh]
+    assert not path.exists()
@@ -1,24 +1,44 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, \
     TokenRefreshView
-from django.conf import settings
-from django.conf.urls.static import static
 
+from api.views.asynchronous import AsyncAssignmentListView, \
+    AsyncCourseDetailView, AsyncCourseListView, AsyncLectureAllListView, \
+    AsyncLectureDetailView, AsyncLectureListView
 from api.views.assignment import AssignmentCreateView, AssignmentDetailView, \
     AssignmentUpdateView, AssignmentDeleteView, AssignmentListView
 from api.views.comment import CommentListView, CommentCreateView, \
     CommentUpdateView, CommentDeleteView
 from api.views.course import CourseListView, CourseCreateView, \
     CourseDetailView, CourseUpdateView, CourseDeleteView
-from api.views.enrollment import EnrollInCourseView, UnenrollFromCourseView
+from api.views.enrollment import EnrollInCourseView, UnenrollFromCourseView, \
+    BulkEnrollInCourseView
 from api.views.grade import GradeDeleteView, GradeUpdateView, \
-    GradeRetrieveView, GradeCreateView
+    GradeRetrieveView, GradeCreateView, GradeBatchView, CourseGradebookView
 from api.views.lecture import LectureListView, LectureCreateView, \
-    LectureDetailView, LectureUpdateView, LectureDeleteView, LectureAllListView
+    LectureDetailView, LectureUpdateView, LectureDeleteView, LectureAllListView, \
+    LectureFileView
 from api.views.submission import SubmissionCreateView, SubmissionRetrieveView, \
-    SubmissionListView
+    SubmissionListView, SubmissionFileView
+from api.views.upload import UploadSessionCreateView, \
+    UploadSessionDetailView, UploadSessionFinalizeView
 from api.views.user import UserRegistrationView
 
+
+def read_view(view_class, async_view_class):
+    view = view_class.as_view()
+
+    if not settings.ASYNC_READ_VIEWS:
+        return view
+
+    async_view = async_view_class.as_view()
+    async_view.cls = view.cls
+    async_view.initkwargs = view.initkwargs
+
+    return async_view
+
+
 urlpatterns = [
     # Auth
     path('auth/register/', UserRegistrationView.as_view(),name='user-register'),
@@ -26,21 +46,23 @@ urlpatterns = [
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
 
     # Courses
-    path('courses/', CourseListView.as_view(), name='course-list'),
+    path('courses/', read_view(CourseListView, AsyncCourseListView), name='course-list'),
     path('courses/create/', CourseCreateView.as_view(), name='course-create'),
-    path('courses/<int:pk>/', CourseDetailView.as_view(), name='course-detail'),
+    path('courses/<int:pk>/', read_view(CourseDetailView, AsyncCourseDetailView), name='course-detail'),
     path('courses/<int:pk>/update/', CourseUpdateView.as_view(), name='course-update'),
     path('courses/<int:pk>/delete/', CourseDeleteView.as_view(), name='course-delete'),
 
     # Enrollment
     path('courses/enroll/', EnrollInCourseView.as_view(), name='course-enroll'),
+    path('courses/enroll/bulk/', BulkEnrollInCourseView.as_view(), name='course-enroll-bulk'),
     path('courses/unenroll/', UnenrollFromCourseView.as_view(), name='course-unenroll'),
 
     # Lectures
-    path('lectures/', LectureAllListView.as_view(), name='lecture-list-all'),
+    path('lectures/', read_view(LectureAllListView, AsyncLectureAllListView), name='lecture-list-all'),
     path('lectures/create/', LectureCreateView.as_view(), name='lecture-create'),
-    path('lectures/<int:pk>/', LectureDetailView.as_view(), name='lecture-detail'),
-    path('lectures/course/<int:course_id>/', LectureListView.as_view(), name='lecture-list'),
+    path('lectures/<int:pk>/', read_view(LectureDetailView, AsyncLectureDetailView), name='lecture-detail'),
+    path('lectures/<int:pk>/file/', LectureFileView.as_view(), name='lecture-file'),
+    path('lectures/course/<int:course_id>/', read_view(LectureListView, AsyncLectureListView), name='lecture-list'),
     path('lectures/<int:pk>/update/', LectureUpdateView.as_view(), name='lecture-update'),
     path('lectures/<int:pk>/delete/', LectureDeleteView.as_view(), name='lecture-delete'),
 
@@ -49,22 +71,30 @@ urlpatterns = [
     path('assignments/<int:pk>/', AssignmentDetailView.as_view(), name='assignment-detail'),
     path('assignments/<int:pk>/update/', AssignmentUpdateView.as_view(), name='assignment-update'),
     path('assignments/<int:pk>/delete/', AssignmentDeleteView.as_view(), name='assignment-delete'),
-    path('assignments/lecture/<int:lecture_id>/', AssignmentListView.as_view(), name='assignment-list'),
+    path('assignments/lecture/<int:lecture_id>/', read_view(AssignmentListView, AsyncAssignmentListView), name='assignment-list'),
 
     # Submissions
     path('submissions/create/', SubmissionCreateView.as_view(), name='submission-create'),
     path('submissions/<int:pk>/', SubmissionRetrieveView.as_view(), name='submission-detail'),
+    path('submissions/<int:pk>/file/', SubmissionFileView.as_view(), name='submission-file'),
     path('submissions/', SubmissionListView.as_view(), name='submission-list'),
 
+    # Resumable uploads
+    path('uploads/', UploadSessionCreateView.as_view(), name='upload-create'),
+    path('uploads/<uuid:pk>/', UploadSessionDetailView.as_view(), name='upload-detail'),
+    path('uploads/<uuid:pk>/finalize/', UploadSessionFinalizeView.as_view(), name='upload-finalize'),
+
     # Grades
     path('grades/create/', GradeCreateView.as_view(), name='grade-create'),
+    path('grades/batch/', GradeBatchView.as_view(), name='grade-batch'),
     path('grades/<int:pk>/', GradeRetrieveView.as_view(), name='grade-retrieve'),
     path('grades/<int:pk>/update/', GradeUpdateView.as_view(), name='grade-update'),
     path('grades/<int:pk>/delete/', GradeDeleteView.as_view(), name='grade-delete'),
+    path('courses/<int:pk>/gradebook/', CourseGradebookView.as_view(), name='course-gradebook'),
 
     # Comments
     path('submissions/<int:submission_id>/comments/', CommentListView.as_view(), name='comment-list'),
     path('comments/create/', CommentCreateView.as_view(), name='comment-create'),
     path('comments/<int:pk>/update/', CommentUpdateView.as_view(), name='comment-update'),
     path('comments/<int:pk>/delete/', CommentDeleteView.as_view(), name='comment-delete'),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
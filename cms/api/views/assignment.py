@@ -2,9 +2,9 @@ from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from api.docs import swagger_schema
 from api.models import Lecture, Assignment
 from api.permissions import IsTeacher, IsEnrolled
 from api.serializers import AssignmentSerializer
@@ -14,7 +14,7 @@ class AssignmentCreateView(generics.CreateAPIView):
     serializer_class = AssignmentSerializer
     permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Create a new assignment for a lecture",
         operation_description="""
 ## Endpoint Description
@@ -46,7 +46,7 @@ Allows a teacher enrolled in a course to create a new assignment for a specific
             404: "Not Found"
         },
         tags=["assignments"]
-    )
+    ))
     def post(self, request, *args, **kwargs):
         lecture_id = request.data.get('lecture')
         title = request.data.get('title')
@@ -60,7 +60,7 @@ Allows a teacher enrolled in a course to create a new assignment for a specific
 
         lecture = get_object_or_404(Lecture, id=lecture_id)
 
-        if not IsEnrolled().user_has_access(request.user, lecture.course):
+        if not IsEnrolled.has_course_access(request, lecture.course_id):
             return Response(
                 {'detail': 'You do not have permission'},
                 status=status.HTTP_403_FORBIDDEN
@@ -80,11 +80,11 @@ Allows a teacher enrolled in a course to create a new assignment for a specific
 
 
 class AssignmentUpdateView(generics.UpdateAPIView):
-    queryset = Assignment.objects.all()
+    queryset = Assignment.objects.select_related('lecture')
     serializer_class = AssignmentSerializer
     permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Update an assignment",
         operation_description="""
 ## Endpoint Description
@@ -115,7 +115,7 @@ Allows a teacher to update an existing assignment.
             404: "Not Found"
         },
         tags=["assignments"]
-    )
+    ))
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
@@ -125,7 +125,7 @@ class AssignmentDeleteView(generics.DestroyAPIView):
     serializer_class = AssignmentSerializer
     permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Delete an assignment",
         operation_description="""
 ## Endpoint Description
@@ -151,21 +151,23 @@ Allows a teacher to delete an assignment from a lecture.
             404: "Not Found"
         },
         tags=["assignments"]
-    )
+    ))
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
 
 
-class AssignmentDetailView(generics.RetrieveAPIView):
+class AssignmentDetailView(ConditionalRetrieveMixin,
+                           generics.RetrieveAPIView):
     queryset = Assignment.objects.all()
     serializer_class = AssignmentSerializer
     permission_classes = [IsAuthenticated, IsEnrolled]
+    query_budget = 3
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Retrieve an assignment",
         operation_description="""
 ## Endpoint Description
-Allows an enrolled user to retrieve the details of a specific assignment.
+Allows an enrolled user to retrieve the details of a specific assignment. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - pk: integer, required (Assignment ID)
@@ -178,33 +180,36 @@ Allows an enrolled user to retrieve the details of a specific assignment.
 
 ## Responses
 - **200 OK**: Returns assignment details
+- **304 Not Modified**: Cached copy is still valid
 - **403 Forbidden**: User is not enrolled in the course
 - **404 Not Found**: Assignment does not exist
         """,
         responses={
             200: AssignmentSerializer,
+            304: "Not Modified",
             403: "Forbidden",
             404: "Not Found"
         },
         tags=["assignments"]
-    )
+    ))
     def get_object(self):
         assignment = super().get_object()
-        self.check_object_permissions(self.request, assignment.lecture)
+        self.check_object_permissions(self.request, assignment)
 
         return assignment
 
 
-class AssignmentListView(generics.ListAPIView):
+class AssignmentListView(ConditionalListMixin, generics.ListAPIView):
     queryset = Assignment.objects.all()
     serializer_class = AssignmentSerializer
     permission_classes = [IsAuthenticated, IsEnrolled]
+    query_budget = 4
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="List assignments for a lecture",
         operation_description="""
 ## Endpoint Description
-Lists all assignments for a specific lecture. Access is granted to any user enrolled in the course.
+Lists all assignments for a specific lecture. Access is granted to any user enrolled in the course. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - lecture_id: integer, required (Lecture ID)
@@ -217,16 +222,18 @@ Lists all assignments for a specific lecture. Access is granted to any user enro
 
 ## Responses
 - **200 OK**: Returns a list of assignments
+- **304 Not Modified**: Cached copy is still valid
 - **403 Forbidden**: User is not enrolled in the course
 - **404 Not Found**: Lecture does not exist
         """,
         responses={
             200: AssignmentSerializer(many=True),
+            304: "Not Modified",
             403: "Forbidden",
             404: "Not Found"
         },
         tags=["assignments"]
-    )
+    ))
     def get_queryset(self):
         lecture_id = self.kwargs.get('lecture_id')
         lecture = get_object_or_404(Lecture, id=lecture_id)
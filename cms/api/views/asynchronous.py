@@ -0,0 +1,200 @@
+from django.db.models import aprefetch_related_objects
+from django.http import HttpResponse, HttpResponseNotModified
+from django.shortcuts import aget_object_or_404
+from django.utils.cache import get_conditional_response
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.views import exception_handler
+
+from api.conditional import NotModified, add_validator_headers, aversions, \
+    make_etag, page_scope
+from api.models import Assignment, Course, Lecture
+from api.pagination import KeysetPagination
+from api.permissions import IsEnrolled
+from api.profiling import profiled
+from api.serializers import AssignmentSerializer, CourseDetailSerializer, \
+    LectureSerializer
+
+json_renderer = JSONRenderer()
+render_json = profiled('render', json_renderer.render)
+
+
+class AsyncReadView(View):
+    http_method_names = ['get']
+    serializer_class = None
+    pagination_class = KeysetPagination
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.authenticators = [
+            auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+        ]
+
+    async def get(self, request, *args, **kwargs):
+        request = Request(request, authenticators=())
+        self.request = request
+        self.etag = None
+
+        try:
+            await self.authenticate(request)
+            data, headers = await self.read(request, **kwargs), {}
+            status_code = status.HTTP_200_OK
+        except NotModified:
+            return add_validator_headers(HttpResponseNotModified(), self.etag)
+        except Exception as exc:
+            data, status_code, headers = self.handle_exception(request, exc)
+
+        response = HttpResponse(
+            render_json(data), status=status_code,
+            content_type='application/json'
+        )
+        for name, value in headers.items():
+            response[name] = value
+
+        if self.etag is not None and status_code == status.HTTP_200_OK:
+            add_validator_headers(response, self.etag)
+
+        return response
+
+    async def authenticate(self, request):
+        for authenticator in self.authenticators:
+            user_auth_tuple = await authenticator.aauthenticate(request)
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        raise exceptions.NotAuthenticated()
+
+    def handle_exception(self, request, exc):
+        headers = {}
+
+        if isinstance(exc, (exceptions.NotAuthenticated,
+                            exceptions.AuthenticationFailed)):
+            exc.status_code = status.HTTP_401_UNAUTHORIZED
+            headers['WWW-Authenticate'] = \
+                self.authenticators[0].authenticate_header(request)
+
+        response = exception_handler(exc, {'view': self, 'request': request})
+
+        if response is None:
+            raise exc
+
+        headers.update(response.headers)
+
+        return response.data, response.status_code, headers
+
+    def serialize(self, instance, many=False):
+        return self.serializer_class(instance, many=many, context={
+            'request': self.request, 'view': self, 'format': None
+        }).data
+
+    async def check_not_modified(self, queryset, page_key=None):
+        querysets = self.serializer_class.version_querysets(queryset)
+        self.etag = make_etag(
+            self.request, (page_key, await aversions(querysets)),
+            json_renderer.media_type
+        )
+
+        if get_conditional_response(self.request, etag=self.etag) is not None:
+            raise NotModified()
+
+    async def paginate(self, queryset):
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
+        await self.check_not_modified(*page_scope(queryset, page, paginator))
+        await aprefetch_related_objects(
+            page, *self.serializer_class.eager_lookups()
+        )
+
+        return paginator.get_paginated_response(
+            self.serialize(page, many=True)
+        ).data
+
+    @staticmethod
+    async def check_course_access(request, course_id):
+        if not await IsEnrolled.ahas_course_access(request, course_id):
+            raise exceptions.PermissionDenied()
+
+
+class AsyncCourseListView(AsyncReadView):
+    serializer_class = CourseDetailSerializer
+
+    async def read(self, request, **kwargs):
+        courses = Course.objects.filter(
+            id__in=await IsEnrolled.acourse_ids(request)
+        ).order_by('id')
+
+        return await self.paginate(courses)
+
+
+class AsyncCourseDetailView(AsyncReadView):
+    serializer_class = CourseDetailSerializer
+
+    async def read(self, request, pk, **kwargs):
+        course = await aget_object_or_404(Course, pk=pk)
+        await self.check_course_access(request, course.pk)
+        await self.check_not_modified(Course.objects.filter(pk=course.pk))
+        await aprefetch_related_objects(
+            [course], *CourseDetailSerializer.eager_lookups()
+        )
+
+        return self.serialize(course)
+
+
+class AsyncLectureListView(AsyncReadView):
+    serializer_class = LectureSerializer
+
+    async def read(self, request, course_id, **kwargs):
+        course = await aget_object_or_404(Course, id=course_id)
+
+        if (
+            course.owner_id != request.user.id and
+            not await IsEnrolled.ahas_course_access(request, course.id)
+        ):
+            raise exceptions.PermissionDenied(
+                'You are not enrolled in this course'
+            )
+
+        return await self.paginate(Lecture.objects.filter(course=course))
+
+
+class AsyncLectureAllListView(AsyncReadView):
+    serializer_class = LectureSerializer
+
+    async def read(self, request, **kwargs):
+        course_ids = await IsEnrolled.acourse_ids(request)
+
+        return await self.paginate(
+            Lecture.objects.filter(course__in=course_ids).order_by('id')
+        )
+
+
+class AsyncLectureDetailView(AsyncReadView):
+    serializer_class = LectureSerializer
+
+    async def read(self, request, pk, **kwargs):
+        lecture = await aget_object_or_404(Lecture, pk=pk)
+        await self.check_course_access(request, lecture.course_id)
+        await self.check_not_modified(Lecture.objects.filter(pk=lecture.pk))
+        await aprefetch_related_objects([lecture], 'assignments')
+
+        return self.serialize(lecture)
+
+
+class AsyncAssignmentListView(AsyncReadView):
+    serializer_class = AssignmentSerializer
+
+    async def read(self, request, lecture_id, **kwargs):
+        lecture = await aget_object_or_404(Lecture, id=lecture_id)
+        await self.check_course_access(request, lecture.course_id)
+
+        return await self.paginate(
+            Assignment.objects.filter(lecture=lecture)
+        )
@@ -1,9 +1,8 @@
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from api.docs import swagger_schema
 from api.models import Submission, Comment
 from api.permissions import IsOwner, IsTeacher, IsEnrolled
 from api.serializers.comment import CommentSerializer
@@ -13,7 +12,7 @@ class CommentCreateView(generics.CreateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsOwner | (IsTeacher & IsEnrolled)]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Create a new comment on a submission",
         operation_description="""
 ## Endpoint Description
@@ -44,7 +43,7 @@ Allows a student (owner of the submission) or a teacher (enrolled in the course)
             404: "Not Found"
         },
         tags=["comments"]
-    )
+    ))
     def perform_create(self, serializer):
         submission_id = self.request.data.get('submission')
         try:
@@ -64,8 +63,9 @@ Allows a student (owner of the submission) or a teacher (enrolled in the course)
 class CommentListView(generics.ListAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsOwner | (IsTeacher & IsEnrolled)]
+    query_budget = 3
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="List comments for a submission",
         operation_description="""
 ## Endpoint Description
@@ -91,7 +91,7 @@ Lists all comments for a specific submission. Access is granted to the owner of
             404: "Not Found"
         },
         tags=["comments"]
-    )
+    ))
     def get_queryset(self):
         submission_id = self.kwargs.get('submission_id')
         try:
@@ -105,7 +105,9 @@ Lists all comments for a specific submission. Access is granted to the owner of
         # The check_object_permissions call handles the IsOwner | (IsTeacher & IsEnrolled) logic
         self.check_object_permissions(self.request, submission)
 
-        return Comment.objects.filter(submission=submission)
+        return Comment.objects.filter(
+            submission=submission
+        ).select_related('user')
 
 
 class CommentUpdateView(generics.UpdateAPIView):
@@ -113,7 +115,7 @@ class CommentUpdateView(generics.UpdateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsOwner]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Update a comment",
         operation_description="""
 ## Endpoint Description
@@ -143,7 +145,7 @@ Allows the owner of a comment to update its content.
             404: "Not Found"
         },
         tags=["comments"]
-    )
+    ))
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
@@ -153,7 +155,7 @@ class CommentDeleteView(generics.DestroyAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated, IsOwner]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Delete a comment",
         operation_description="""
 ## Endpoint Description
@@ -179,6 +181,6 @@ Allows the owner of a comment to delete it.
             404: "Not Found"
         },
         tags=["comments"]
-    )
+    ))
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
@@ -1,9 +1,10 @@
+from django.db.models import prefetch_related_objects
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from api.docs import swagger_schema
 from api.models import Enrollment, Course
 from api.permissions import IsOwner, IsTeacher, IsEnrolled
 from api.serializers import CourseSerializer, CourseDetailSerializer
@@ -14,7 +15,7 @@ class CourseCreateView(generics.CreateAPIView):
     serializer_class = CourseSerializer
     permission_classes = [IsAuthenticated, IsTeacher]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Create a new course",
         operation_description="""
 ## Endpoint Description
@@ -43,7 +44,7 @@ Allows an authenticated user with a 'teacher' role to create a new course. The t
             403: "Forbidden"
         },
         tags=["courses"]
-    )
+    ))
     def perform_create(self, serializer):
         course = serializer.save()
         Enrollment.objects.get_or_create(user=self.request.user, course=course)
@@ -53,7 +54,7 @@ class CourseDeleteView(generics.DestroyAPIView):
     queryset = Course.objects.all()
     permission_classes = [IsAuthenticated, IsTeacher, IsOwner]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Delete a course",
         operation_description="""
 ## Endpoint Description
@@ -79,7 +80,7 @@ Allows the owner of a course to delete it.
             404: "Not Found"
         },
         tags=["courses"]
-    )
+    ))
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
 
@@ -89,7 +90,7 @@ class CourseUpdateView(generics.UpdateAPIView):
     serializer_class = CourseSerializer
     permission_classes = [IsAuthenticated, IsTeacher, IsOwner]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Update a course",
         operation_description="""
 ## Endpoint Description
@@ -120,7 +121,7 @@ Allows the owner of a course to update its details.
             404: "Not Found"
         },
         tags=["courses"]
-    )
+    ))
     def update(self, request, *args, **kwargs):
         course = self.get_object()
         serializer = self.get_serializer(course, data=request.data, partial=True)
@@ -129,16 +130,17 @@ Allows the owner of a course to update its details.
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class CourseDetailView(generics.RetrieveAPIView):
+class CourseDetailView(ConditionalRetrieveMixin, generics.RetrieveAPIView):
     queryset = Course.objects.all()
     serializer_class = CourseDetailSerializer
     permission_classes = [IsAuthenticated, IsEnrolled]
+    query_budget = 6
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Retrieve a course",
         operation_description="""
 ## Endpoint Description
-Allows an enrolled user to retrieve the details of a specific course.
+Allows an enrolled user to retrieve the details of a specific course. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - pk: integer, required (Course ID)
@@ -151,31 +153,39 @@ Allows an enrolled user to retrieve the details of a specific course.
 
 ## Responses
 - **200 OK**: Returns course details
+- **304 Not Modified**: Cached copy is still valid
 - **403 Forbidden**: User is not enrolled in the course
 - **404 Not Found**: Course does not exist
         """,
         responses={
             200: CourseDetailSerializer,
+            304: "Not Modified",
             403: "Forbidden",
             404: "Not Found"
         },
         tags=["courses"]
-    )
+    ))
     def get(self, request, *args, **kwargs):
-        course = self.get_object()
-        serializer = self.get_serializer(course)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.retrieve(request, *args, **kwargs)
+
+    def load_object(self, instance):
+        prefetch_related_objects(
+            [instance], *CourseDetailSerializer.eager_lookups()
+        )
 
+        return instance
 
-class CourseListView(generics.ListAPIView):
+
+class CourseListView(ConditionalListMixin, generics.ListAPIView):
     serializer_class = CourseDetailSerializer
     permission_classes = [IsAuthenticated]
+    query_budget = 6
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="List all accessible courses",
         operation_description="""
 ## Endpoint Description
-Lists all courses that the authenticated user has access to, based on their enrollment status.
+Lists all courses that the authenticated user has access to, based on their enrollment status. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - None
@@ -188,19 +198,13 @@ Lists all courses that the authenticated user has access to, based on their enro
 
 ## Responses
 - **200 OK**: Returns a list of accessible courses
+- **304 Not Modified**: Cached copy is still valid
         """,
         responses={
             200: CourseDetailSerializer(many=True),
+            304: "Not Modified",
         },
         tags=["courses"]
-    )
+    ))
     def get_queryset(self):
-        user = self.request.user
-        all_courses = Course.objects.all()
-        accessible_courses = []
-
-        for course in all_courses:
-            if IsEnrolled.user_has_access(user, course):
-                accessible_courses.append(course)
-
-        return accessible_courses
+        return IsEnrolled.accessible_courses(self.request)
@@ -1,20 +1,24 @@
+import codecs
+import csv
+
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from api.docs import swagger_schema
 from api.permissions import IsTeacher, IsEnrolled
 from api.serializers import EnrollmentSerializer
+from api.services import EnrollmentService
 from api.models import Course, User, Enrollment
 
+CSV_COLUMNS = {'user_id': 'id', 'email': 'email'}
 
-class EnrollInCourseView(generics.CreateAPIView):
-    serializer_class = EnrollmentSerializer
-    permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
 
-    @swagger_auto_schema(
+def enroll_in_course_schema():
+    from drf_yasg import openapi
+
+    return dict(
         operation_summary="Enroll a user in a course",
         operation_description="""
 ## Endpoint Description
@@ -57,6 +61,13 @@ Allows a teacher to enroll a specific user (student or another teacher) into a c
         },
         tags=["courses"]
     )
+
+
+class EnrollInCourseView(generics.CreateAPIView):
+    serializer_class = EnrollmentSerializer
+    permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
+
+    @swagger_schema(enroll_in_course_schema)
     def post(self, request, *args, **kwargs):
         course_id = request.data.get('course_id')
         user_id = request.data.get('user_id')
@@ -95,10 +106,10 @@ Allows a teacher to enroll a specific user (student or another teacher) into a c
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class UnenrollFromCourseView(generics.DestroyAPIView):
-    permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
+def unenroll_from_course_schema():
+    from drf_yasg import openapi
 
-    @swagger_auto_schema(
+    return dict(
         operation_summary="Unenroll a user from a course",
         operation_description="""
 ## Endpoint Description
@@ -141,6 +152,12 @@ Allows a teacher to unenroll a user from a course.
         },
         tags=["courses"]
     )
+
+
+class UnenrollFromCourseView(generics.DestroyAPIView):
+    permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
+
+    @swagger_schema(unenroll_from_course_schema)
     def delete(self, request, *args, **kwargs):
         course_id = request.data.get('course_id')
         user_id = request.data.get('user_id')
@@ -167,7 +184,7 @@ Allows a teacher to unenroll a user from a course.
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if enrollment.user == course.owner:
+        if enrollment.user_id == course.owner_id:
             return Response(
                 {'detail': 'Course owner cannot be unenrolled'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -179,3 +196,158 @@ Allows a teacher to unenroll a user from a course.
             {'detail': 'User unenrolled'},
             status=status.HTTP_200_OK
         )
+
+
+def bulk_enroll_in_course_schema():
+    from drf_yasg import openapi
+
+    return dict(
+        operation_summary="Enroll many users in a course",
+        operation_description="""
+## Endpoint Description
+Allows a teacher with access to a course to enroll many users at once. Users are looked up and inserted in chunks, and users who are already enrolled are skipped.
+
+## Path Parameters
+- None
+
+## Query Parameters
+- None
+
+## Request Body
+- JSON object containing:
+    - course_id: integer, required (ID of the course to enroll in)
+    - user_ids: list of integers, optional (IDs of the users to enroll)
+    - emails: list of strings, optional (emails of the users to enroll)
+- Or a multipart form containing:
+    - course_id: integer, required
+    - file: CSV file, required (header row `user_id` or `email`, one user per row)
+
+## Responses
+- **200 OK**: Returns one result per row with status `enrolled`, `already_enrolled`, `duplicate`, `not_found` or `invalid`
+- **400 Bad Request**: Missing course_id or users
+- **403 Forbidden**: User is not a teacher or has no access to the course
+- **404 Not Found**: Course does not exist
+        """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['course_id'],
+            properties={
+                'course_id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                'user_ids': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_INTEGER)
+                ),
+                'emails': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_STRING)
+                ),
+            },
+            example={
+                'course_id': 1,
+                'user_ids': [5, 6, 7],
+            }
+        ),
+        responses={
+            200: openapi.Response(
+                description="Enrollment results",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "course_id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "enrolled": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT)
+                        ),
+                    },
+                    example={
+                        "course_id": 1,
+                        "enrolled": 1,
+                        "results": [
+                            {"user": 5, "status": "enrolled"},
+                            {"user": 6, "status": "already_enrolled"},
+                            {"user": 7, "status": "not_found"},
+                        ]
+                    }
+                )
+            ),
+            400: "Bad Request",
+            403: "Forbidden",
+            404: "Not Found"
+        },
+        tags=["courses"]
+    )
+
+
+class BulkEnrollInCourseView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated, IsTeacher, IsEnrolled]
+    query_budget = 7
+
+    @swagger_schema(bulk_enroll_in_course_schema)
+    def post(self, request, *args, **kwargs):
+        course_id = request.data.get('course_id')
+
+        if not course_id:
+            return Response(
+                {'detail': 'course_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            course = Course.objects.get(id=course_id)
+        except (ObjectDoesNotExist, ValueError):
+            return Response(
+                {'detail': 'Course not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if course.id not in IsEnrolled.accessible_course_ids(request):
+            return Response(
+                {'detail': 'You do not have permission'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        field, identifiers = self.get_identifiers(request)
+
+        if field is None:
+            return Response(
+                {'detail': 'Provide user_ids, emails or a CSV file with a '
+                           'user_id or email header'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = list(
+            EnrollmentService.bulk_enroll(course, identifiers, field)
+        )
+
+        return Response(
+            {
+                'course_id': course.id,
+                'enrolled': sum(r['status'] == 'enrolled' for r in results),
+                'results': results,
+            },
+            status=status.HTTP_200_OK
+        )
+
+    @staticmethod
+    def get_identifiers(request):
+        upload = request.FILES.get('file')
+
+        if upload is not None:
+            rows = csv.reader(codecs.iterdecode(upload, 'utf-8-sig'))
+            header = [cell.strip().lower() for cell in next(rows, [])]
+            field = CSV_COLUMNS.get(header[0]) if header else None
+
+            return field, (row[0] for row in rows if row and row[0].strip())
+
+        for key, field in (('user_ids', 'id'), ('emails', 'email')):
+            if key not in request.data:
+                continue
+
+            if hasattr(request.data, 'getlist'):
+                return field, request.data.getlist(key)
+
+            values = request.data[key]
+            return (field, values) if isinstance(values, list) else (None, None)
+
+        return None, None
@@ -2,19 +2,20 @@ from rest_framework import generics, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
+from rest_framework.settings import api_settings
 
+from api.docs import swagger_schema
 from api.permissions import IsTeacher, IsEnrolled, IsOwner
-from api.serializers import GradeSerializer
-from api.models import Grade
+from api.renderers import GradebookCSVRenderer
+from api.serializers import GradeSerializer, GradeBatchSerializer
+from api.services import GradeService, GradebookService
+from api.models import Course, Grade
 
 
-class GradeCreateView(generics.CreateAPIView):
-    serializer_class = GradeSerializer
-    permission_classes = [IsAuthenticated, IsTeacher]
+def grade_create_schema():
+    from drf_yasg import openapi
 
-    @swagger_auto_schema(
+    return dict(
         operation_summary="Create a new grade for a submission",
         operation_description="""
 ## Endpoint Description
@@ -64,11 +65,18 @@ Allows a teacher to grade a specific submission.
         },
         tags=["grades"]
     )
+
+
+class GradeCreateView(generics.CreateAPIView):
+    serializer_class = GradeSerializer
+    permission_classes = [IsAuthenticated, IsTeacher]
+
+    @swagger_schema(grade_create_schema)
     def perform_create(self, serializer):
         submission = serializer.validated_data['submission']
-        course = submission.assignment.lecture.course
+        course_id = IsEnrolled.course_id_of(submission)
 
-        if not IsEnrolled.user_has_access(self.request.user, course):
+        if not IsEnrolled.has_course_access(self.request, course_id):
             raise PermissionDenied(
                 'You must be enrolled in the course to grade'
             )
@@ -77,11 +85,12 @@ Allows a teacher to grade a specific submission.
 
 
 class GradeRetrieveView(generics.RetrieveAPIView):
-    queryset = Grade.objects.all()
+    queryset = Grade.objects.select_related('submission')
     serializer_class = GradeSerializer
     permission_classes = [IsAuthenticated, IsOwner | (IsTeacher & IsEnrolled)]
+    query_budget = 1
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Retrieve a grade",
         operation_description="""
 ## Endpoint Description
@@ -107,17 +116,17 @@ Allows a student to view their own grade or a teacher to view a grade for a cour
             404: "Not Found"
         },
         tags=["grades"]
-    )
+    ))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
 
 class GradeUpdateView(generics.UpdateAPIView):
-    queryset = Grade.objects.all()
+    queryset = Grade.objects.select_related('submission')
     serializer_class = GradeSerializer
     permission_classes = [IsAuthenticated, IsTeacher]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Update a grade",
         operation_description="""
 ## Endpoint Description
@@ -148,12 +157,11 @@ Allows a teacher to update an existing grade for a submission within a course th
             404: "Not Found"
         },
         tags=["grades"]
-    )
+    ))
     def perform_update(self, serializer):
-        submission = serializer.instance.submission
-        course = submission.assignment.lecture.course
+        course_id = IsEnrolled.course_id_of(serializer.instance)
 
-        if not IsEnrolled.user_has_access(self.request.user, course):
+        if not IsEnrolled.has_course_access(self.request, course_id):
             raise PermissionDenied(
                 'You must be enrolled in the course to update this grade'
             )
@@ -166,7 +174,7 @@ class GradeDeleteView(generics.DestroyAPIView):
     serializer_class = GradeSerializer
     permission_classes = [IsAuthenticated, IsTeacher]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Delete a grade",
         operation_description="""
 ## Endpoint Description
@@ -192,13 +200,168 @@ Allows a teacher to delete a grade from a submission within a course they are en
             404: "Not Found"
         },
         tags=["grades"]
-    )
+    ))
     def perform_destroy(self, instance):
-        course = instance.submission.assignment.lecture.course
+        course_id = IsEnrolled.course_id_of(instance)
 
-        if not IsEnrolled.user_has_access(self.request.user, course):
+        if not IsEnrolled.has_course_access(self.request, course_id):
             raise PermissionDenied(
                 'You must be enrolled in the course to delete this grade'
             )
 
         instance.delete()
+
+
+class GradeBatchView(generics.GenericAPIView):
+    serializer_class = GradeBatchSerializer
+    permission_classes = [IsAuthenticated, IsTeacher]
+    query_budget = 3
+
+    @swagger_schema(lambda: dict(
+        operation_summary="Grade many submissions of an assignment",
+        operation_description="""
+## Endpoint Description
+Allows a teacher enrolled in the course to create or update grades for many submissions of one assignment in a single request. Existing grades are overwritten.
+
+## Path Parameters
+- None
+
+## Query Parameters
+- None
+
+## Request Body
+- JSON object containing:
+    - assignment: integer, required (assignment ID)
+    - grades: list, required (objects with `submission` ID and `score` between 0 and 100)
+
+## Responses
+- **200 OK**: Returns the saved grades
+- **400 Bad Request**: Validation errors or submissions that do not belong to the assignment
+- **403 Forbidden**: User is not a teacher or not enrolled in the course
+        """,
+        request_body=GradeBatchSerializer,
+        responses={
+            200: GradeSerializer(many=True),
+            400: "Bad Request",
+            403: "Forbidden"
+        },
+        tags=["grades"]
+    ))
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        scores = {
+            item['submission']: item['score']
+            for item in serializer.validated_data['grades']
+        }
+        courses = GradeService.submission_courses(
+            serializer.validated_data['assignment'],
+            scores.keys()
+        )
+
+        missing = sorted(scores.keys() - courses.keys())
+        if missing:
+            return Response(
+                {
+                    'detail': 'Submissions do not belong to this assignment',
+                    'submissions': missing
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not all(
+            IsEnrolled.has_course_access(request, course_id)
+            for course_id in set(courses.values())
+        ):
+            raise PermissionDenied(
+                'You must be enrolled in the course to grade'
+            )
+
+        grades = GradeService.upsert_grades(request.user, scores, courses)
+        GradebookService.invalidate(*set(courses.values()))
+
+        return Response(
+            GradeSerializer(grades, many=True).data,
+            status=status.HTTP_200_OK
+        )
+
+
+def course_gradebook_schema():
+    from drf_yasg import openapi
+
+    return dict(
+        operation_summary="Retrieve the gradebook of a course",
+        operation_description="""
+## Endpoint Description
+Allows a teacher with access to the course to retrieve a students × assignments score matrix. Each cell holds the student's best grade for the assignment, or null when ungraded. The matrix is cached and refreshed whenever grades, submissions, assignments or enrollments change.
+
+## Path Parameters
+- pk: integer, required (course ID)
+
+## Query Parameters
+- format: string, optional (`json` or `csv`, defaults to `json`)
+
+## Request Body
+- None
+
+## Responses
+- **200 OK**: Returns the gradebook in a columnar layout
+- **403 Forbidden**: User is not a teacher or has no access to the course
+- **404 Not Found**: Course does not exist
+        """,
+        responses={
+            200: openapi.Response(
+                description="Gradebook",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "course": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "students": openapi.Schema(type=openapi.TYPE_OBJECT),
+                        "assignments": openapi.Schema(type=openapi.TYPE_OBJECT),
+                        "scores": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_ARRAY,
+                                items=openapi.Schema(type=openapi.TYPE_INTEGER)
+                            )
+                        ),
+                    },
+                    example={
+                        "course": 1,
+                        "students": {"id": [4, 7], "email": ["a@example.com", "b@example.com"]},
+                        "assignments": {"id": [2, 3], "title": ["Essay", "Quiz"]},
+                        "scores": [[90, None], [75, 60]]
+                    }
+                )
+            ),
+            403: "Forbidden",
+            404: "Not Found"
+        },
+        tags=["grades"]
+    )
+
+
+class CourseGradebookView(generics.GenericAPIView):
+    queryset = Course.objects.all()
+    permission_classes = [IsAuthenticated, IsTeacher]
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        GradebookCSVRenderer
+    ]
+    query_budget = 4
+
+    @swagger_schema(course_gradebook_schema)
+    def get(self, request, *args, **kwargs):
+        course_id = self.kwargs['pk']
+
+        if course_id not in IsEnrolled.accessible_course_ids(request):
+            if not Course.objects.filter(pk=course_id).exists():
+                return Response(
+                    {'detail': 'Course not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            raise PermissionDenied('You do not have access to this course')
+
+        return Response(GradebookService.gradebook(course_id))
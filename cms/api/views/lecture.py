@@ -4,19 +4,19 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
-from api.models import Course, Enrollment, Lecture
+from api.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from api.docs import swagger_schema
+from api.media import serve_media
+from api.models import Course, Lecture
 from api.permissions import IsTeacher, IsEnrolled
 from api.serializers import LectureSerializer
 
 
-class LectureCreateView(generics.CreateAPIView):
-    serializer_class = LectureSerializer
-    permission_classes = [IsAuthenticated, IsTeacher]
+def lecture_create_schema():
+    from drf_yasg import openapi
 
-    @swagger_auto_schema(
+    return dict(
         operation_summary="Create a new lecture",
         operation_description="""
 ## Endpoint Description
@@ -66,6 +66,13 @@ Allows a teacher to create a new lecture within a course.
         },
         tags=["lectures"]
     )
+
+
+class LectureCreateView(generics.CreateAPIView):
+    serializer_class = LectureSerializer
+    permission_classes = [IsAuthenticated, IsTeacher]
+
+    @swagger_schema(lecture_create_schema)
     def post(self, request, *args, **kwargs):
         course_id = request.data.get('course')
         topic = request.data.get('topic')
@@ -85,10 +92,7 @@ Allows a teacher to create a new lecture within a course.
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if not Enrollment.objects.filter(
-            user=request.user,
-            course=course
-        ).exists():
+        if not IsEnrolled.has_course_access(request, course.id):
             return Response(
                 {'detail': 'Enroll in this course to create lectures'},
                 status=status.HTTP_403_FORBIDDEN
@@ -104,16 +108,17 @@ Allows a teacher to create a new lecture within a course.
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class LectureDetailView(generics.RetrieveAPIView):
+class LectureDetailView(ConditionalRetrieveMixin, generics.RetrieveAPIView):
     queryset = Lecture.objects.all()
     serializer_class = LectureSerializer
     permission_classes = [IsAuthenticated, IsEnrolled]
+    query_budget = 4
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Retrieve a lecture",
         operation_description="""
 ## Endpoint Description
-Allows an enrolled user to retrieve the details of a specific lecture.
+Allows an enrolled user to retrieve the details of a specific lecture. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - pk: integer, required (lecture ID)
@@ -126,30 +131,33 @@ Allows an enrolled user to retrieve the details of a specific lecture.
 
 ## Responses
 - **200 OK**: Returns lecture details
+- **304 Not Modified**: Cached copy is still valid
 - **403 Forbidden**: User not enrolled in the course
 - **404 Not Found**: Lecture does not exist
         """,
         responses={
             200: LectureSerializer,
+            304: "Not Modified",
             403: "User not enrolled in the course",
             404: "Not Found"
         },
         tags=["lectures"]
-    )
+    ))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
 
-class LectureListView(generics.ListAPIView):
+class LectureListView(ConditionalListMixin, generics.ListAPIView):
     queryset = Lecture.objects.all()
     serializer_class = LectureSerializer
     permission_classes = [IsAuthenticated, IsEnrolled]
+    query_budget = 5
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="List lectures for a course",
         operation_description="""
 ## Endpoint Description
-Lists all lectures for a specific course.
+Lists all lectures for a specific course. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - course_id: integer, required (course ID)
@@ -162,39 +170,42 @@ Lists all lectures for a specific course.
 
 ## Responses
 - **200 OK**: Returns a list of lectures
+- **304 Not Modified**: Cached copy is still valid
 - **403 Forbidden**: User not enrolled in the course
 - **404 Not Found**: Course does not exist
         """,
         responses={
             200: LectureSerializer(many=True),
+            304: "Not Modified",
             403: "User not enrolled in the course",
             404: "Course not found"
         },
         tags=["lectures"]
-    )
+    ))
     def get_queryset(self):
         course_id = self.kwargs['course_id']
         course = get_object_or_404(Course, id=course_id)
 
-        if course.owner != self.request.user and not Enrollment.objects.filter(
-            user=self.request.user,
-            course=course
-        ).exists():
+        if (
+            course.owner_id != self.request.user.id and
+            not IsEnrolled.has_course_access(self.request, course.id)
+        ):
             raise PermissionDenied('You are not enrolled in this course')
 
         return Lecture.objects.filter(course=course)
 
 
-class LectureAllListView(generics.ListAPIView):
+class LectureAllListView(ConditionalListMixin, generics.ListAPIView):
     queryset = Lecture.objects.all()
     serializer_class = LectureSerializer
     permission_classes = [IsAuthenticated]
+    query_budget = 4
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="List all lectures",
         operation_description="""
 ## Endpoint Description
-Lists all lectures across all courses that the authenticated user has access to.
+Lists all lectures across all courses that the authenticated user has access to. Supports `If-None-Match` for cached copies.
 
 ## Path Parameters
 - None
@@ -207,22 +218,18 @@ Lists all lectures across all courses that the authenticated user has access to.
 
 ## Responses
 - **200 OK**: Returns a list of lectures
+- **304 Not Modified**: Cached copy is still valid
         """,
         responses={
             200: LectureSerializer(many=True),
+            304: "Not Modified",
         },
         tags=["lectures"]
-    )
+    ))
     def get_queryset(self):
-        user = self.request.user
-        all_lectures = Lecture.objects.all()
-        accessible_lectures = []
-
-        for lecture in all_lectures:
-            if IsEnrolled().user_has_access(user, lecture.course):
-                accessible_lectures.append(lecture)
+        course_ids = IsEnrolled.course_ids(self.request)
 
-        return accessible_lectures
+        return Lecture.objects.filter(course__in=course_ids).order_by('id')
 
 
 class LectureUpdateView(generics.UpdateAPIView):
@@ -230,7 +237,7 @@ class LectureUpdateView(generics.UpdateAPIView):
     serializer_class = LectureSerializer
     permission_classes = [IsAuthenticated, IsTeacher]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Update a lecture",
         operation_description="""
 ## Endpoint Description
@@ -259,7 +266,7 @@ Allows the teacher who owns the course to update a specific lecture.
             404: "Not Found"
         },
         tags=["lectures"]
-    )
+    ))
     def get_object(self):
         lecture = super().get_object()
 
@@ -270,7 +277,7 @@ class LectureDeleteView(generics.DestroyAPIView):
     queryset = Lecture.objects.all()
     permission_classes = [IsAuthenticated, IsTeacher]
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Delete a lecture",
         operation_description="""
 ## Endpoint Description
@@ -296,8 +303,47 @@ Allows a teacher to delete a lecture from a course they are associated with.
             404: "Not Found"
         },
         tags=["lectures"]
-    )
+    ))
     def get_object(self):
         lecture = super().get_object()
 
         return lecture
+
+
+class LectureFileView(generics.RetrieveAPIView):
+    queryset = Lecture.objects.only('id', 'course', 'file')
+    permission_classes = [IsAuthenticated, IsEnrolled]
+
+    @swagger_schema(lambda: dict(
+        operation_summary="Download a lecture file",
+        operation_description="""
+## Endpoint Description
+Streams the lecture file to an enrolled user. Supports `Range` requests for seeking, and `If-None-Match`/`If-Modified-Since` for cached copies.
+
+## Path Parameters
+- pk: integer, required (lecture ID)
+
+## Query Parameters
+- None
+
+## Request Body
+- None
+
+## Responses
+- **200 OK**: Returns the file
+- **206 Partial Content**: Returns the requested byte range
+- **304 Not Modified**: Cached copy is still valid
+- **403 Forbidden**: User not enrolled in the course
+- **404 Not Found**: Lecture or file does not exist
+        """,
+        responses={
+            200: "File contents",
+            206: "Partial file contents",
+            304: "Not Modified",
+            403: "User not enrolled in the course",
+            404: "Not Found"
+        },
+        tags=["lectures"]
+    ))
+    def get(self, request, *args, **kwargs):
+        return serve_media(request, self.get_object().file)
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from api.metrics import registry
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+LOOPBACK_IPS = {'127.0.0.1', '::1'}
+FORWARDING_HEADERS = ('Forwarded', 'X-Forwarded-For', 'X-Real-IP')
+
+
+def metrics_allowed(request):
+    token = settings.METRICS_TOKEN
+    header = request.headers.get('Authorization', '')
+
+    if token and constant_time_compare(header, f'Bearer {token}'):
+        return True
+
+    if any(name in request.headers for name in FORWARDING_HEADERS):
+        return False
+
+    allowed_ips = set(settings.METRICS_ALLOWED_IPS) - LOOPBACK_IPS
+
+    return request.META.get('REMOTE_ADDR') in allowed_ips
+
+
+def metrics_view(request):
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+
+    return HttpResponse(registry.render(), content_type=CONTENT_TYPE)
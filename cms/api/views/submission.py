@@ -2,19 +2,18 @@ from rest_framework import generics, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from api.docs import swagger_schema
+from api.media import serve_media
 from api.permissions import IsStudent, IsEnrolled, IsOwner, IsTeacher
 from api.serializers import SubmissionSerializer
-from api.models import Submission, Enrollment
+from api.models import Submission
 
 
-class SubmissionCreateView(generics.CreateAPIView):
-    serializer_class = SubmissionSerializer
-    permission_classes = [IsAuthenticated, IsStudent, IsEnrolled]
+def submission_create_schema():
+    from drf_yasg import openapi
 
-    @swagger_auto_schema(
+    return dict(
         operation_summary="Create a submission",
         operation_description="""
 ## Endpoint Description
@@ -61,14 +60,21 @@ Allows a student to submit work for an assignment.
         },
         tags=["submissions"]
     )
+
+
+class SubmissionCreateView(generics.CreateAPIView):
+    serializer_class = SubmissionSerializer
+    permission_classes = [IsAuthenticated, IsStudent, IsEnrolled]
+
+    @swagger_schema(submission_create_schema)
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         assignment = serializer.validated_data['assignment']
-        course = assignment.lecture.course
+        course_id = IsEnrolled.course_id_of(assignment)
 
-        if not IsEnrolled.user_has_access(request.user, course):
+        if not IsEnrolled.has_course_access(request, course_id):
             raise PermissionDenied(
                 'You are not enrolled in the course of this assignment'
             )
@@ -81,8 +87,9 @@ class SubmissionRetrieveView(generics.RetrieveAPIView):
     queryset = Submission.objects.all()
     serializer_class = SubmissionSerializer
     permission_classes = [IsAuthenticated, IsOwner | (IsTeacher & IsEnrolled)]
+    query_budget = 1
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="Retrieve a submission",
         operation_description="""
 ## Endpoint Description
@@ -108,7 +115,7 @@ Retrieve a specific submission by its ID.
             404: "Not Found"
         },
         tags=["submissions"]
-    )
+    ))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
@@ -116,8 +123,9 @@ Retrieve a specific submission by its ID.
 class SubmissionListView(generics.ListAPIView):
     serializer_class = SubmissionSerializer
     permission_classes = [IsAuthenticated, IsOwner | (IsTeacher & IsEnrolled)]
+    query_budget = 2
 
-    @swagger_auto_schema(
+    @swagger_schema(lambda: dict(
         operation_summary="List submissions",
         operation_description="""
 ## Endpoint Description
@@ -128,7 +136,7 @@ Lists submissions visible to the current user.
         """,
         responses={200: SubmissionSerializer(many=True)},
         tags=["submissions"]
-    )
+    ))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
@@ -138,11 +146,49 @@ Lists submissions visible to the current user.
         if user.role == 'student':
             return Submission.objects.filter(user=user)
         elif user.role == 'teacher':
-            courses = Enrollment.objects.filter(user=user).values_list(
-                'course', flat=True
-            )
             return Submission.objects.filter(
-                assignment__lecture__course__in=courses
+                course__in=IsEnrolled.course_ids(
+                    self.request
+                )
             )
 
         return Submission.objects.all()
+
+
+class SubmissionFileView(generics.RetrieveAPIView):
+    queryset = Submission.objects.all()
+    permission_classes = [IsAuthenticated, IsOwner | (IsTeacher & IsEnrolled)]
+
+    @swagger_schema(lambda: dict(
+        operation_summary="Download a submission file",
+        operation_description="""
+## Endpoint Description
+Streams the submission file to its owner or to a teacher enrolled in the course. Supports `Range` requests and `If-None-Match`/`If-Modified-Since` for cached copies.
+
+## Path Parameters
+- pk: integer, required (submission ID)
+
+## Query Parameters
+- None
+
+## Request Body
+- None
+
+## Responses
+- **200 OK**: Returns the file
+- **206 Partial Content**: Returns the requested byte range
+- **304 Not Modified**: Cached copy is still valid
+- **403 Forbidden**: Access denied
+- **404 Not Found**: Submission or file does not exist
+        """,
+        responses={
+            200: "File contents",
+            206: "Partial file contents",
+            304: "Not Modified",
+            403: "Forbidden",
+            404: "Not Found"
+        },
+        tags=["submissions"]
+    ))
+    def get(self, request, *args, **kwargs):
+        return serve_media(request, self.get_object().file)
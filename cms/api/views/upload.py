@@ -0,0 +1,268 @@
+import re
+
+from django.conf import settings
+from rest_framework import generics, status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from api.docs import swagger_schema
+from api.models import UploadSession
+from api.permissions import IsEnrolled, IsOwner
+from api.serializers import LectureSerializer, SubmissionSerializer, \
+    UploadSessionSerializer
+from api.services.upload import UploadError, UploadService
+
+CONTENT_RANGE = re.compile(r'bytes (\d+)-(\d+)/(\d+)')
+
+
+def check_upload_access(request, session):
+    if session.kind == UploadSession.LECTURE:
+        role, course_id = 'teacher', session.course_id
+    else:
+        role = 'student'
+        course_id = IsEnrolled.course_id_of(session.assignment)
+
+    if (
+        request.user.role != role or
+        not IsEnrolled.has_course_access(request, course_id)
+    ):
+        raise PermissionDenied('You are not allowed to upload to this course')
+
+
+class UploadSessionCreateView(generics.CreateAPIView):
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+
+    @swagger_schema(lambda: dict(
+        operation_summary="Start a resumable upload",
+        operation_description="""
+## Endpoint Description
+Creates an upload session for a lecture file (teachers) or a submission file (students). The file is then sent in byte ranges with `PUT uploads/<id>/` and turned into a lecture or submission with `POST uploads/<id>/finalize/`.
+
+## Path Parameters
+- None
+
+## Query Parameters
+- None
+
+## Request Body
+- JSON object containing:
+    - kind: string, required (`lecture` or `submission`)
+    - filename: string, required (name of the file being uploaded)
+    - size: integer, required (total size in bytes)
+    - checksum: string, optional (expected SHA-256 hex digest)
+    - course: integer, required for lectures (course ID)
+    - topic: string, required for lectures (lecture topic)
+    - assignment: integer, required for submissions (assignment ID)
+
+## Responses
+- **201 Created**: Upload session created
+- **400 Bad Request**: Validation errors
+- **403 Forbidden**: User may not upload to this course
+        """,
+        request_body=UploadSessionSerializer,
+        responses={
+            201: UploadSessionSerializer,
+            400: "Bad Request",
+            403: "Forbidden"
+        },
+        tags=["uploads"]
+    ))
+    def post(self, request, *args, **kwargs):
+        return super().post(request, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        check_upload_access(self.request, UploadSession(**serializer.validated_data))
+        serializer.save(user=self.request.user)
+
+
+def upload_chunk_schema():
+    from drf_yasg import openapi
+
+    return dict(
+        operation_summary="Upload a byte range",
+        operation_description="""
+## Endpoint Description
+Stores one chunk of the file. The raw bytes are sent as the request body and the `Content-Range` header (`bytes <start>-<end>/<size>`) says where they go. A chunk may not start after the current `received` offset.
+
+## Path Parameters
+- pk: uuid, required (upload session ID)
+
+## Responses
+- **200 OK**: Chunk stored, returns the updated session
+- **400 Bad Request**: Missing or invalid Content-Range
+- **409 Conflict**: Chunk does not continue the upload, or the upload is being finalized
+- **413 Payload Too Large**: Chunk exceeds UPLOAD_CHUNK_MAX_SIZE
+        """,
+        manual_parameters=[
+            openapi.Parameter(
+                'Content-Range',
+                openapi.IN_HEADER,
+                type=openapi.TYPE_STRING,
+                required=True,
+                description='bytes <start>-<end>/<size>'
+            )
+        ],
+        responses={
+            200: UploadSessionSerializer,
+            400: "Bad Request",
+            409: "Conflict",
+            413: "Payload Too Large"
+        },
+        tags=["uploads"]
+    )
+
+
+class UploadSessionDetailView(generics.RetrieveDestroyAPIView):
+    queryset = UploadSession.objects.select_related('assignment')
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated, IsOwner]
+
+    @swagger_schema(lambda: dict(
+        operation_summary="Get upload progress",
+        operation_description="""
+## Endpoint Description
+Returns the upload session, including `received`, the number of bytes stored so far. Clients resume an interrupted upload from that offset.
+
+## Path Parameters
+- pk: uuid, required (upload session ID)
+
+## Responses
+- **200 OK**: Returns the upload session
+- **403 Forbidden**: Session belongs to another user
+- **404 Not Found**: Session does not exist or has expired
+        """,
+        responses={
+            200: UploadSessionSerializer,
+            403: "Forbidden",
+            404: "Not Found"
+        },
+        tags=["uploads"]
+    ))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    @swagger_schema(upload_chunk_schema)
+    def put(self, request, *args, **kwargs):
+        session = self.get_object()
+        match = CONTENT_RANGE.fullmatch(request.headers.get('Content-Range', ''))
+
+        if not match:
+            return Response(
+                {'detail': 'Content-Range header is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        start, end, total = map(int, match.groups())
+
+        if total != session.size or end < start:
+            return Response(
+                {'detail': 'Content-Range does not match this upload'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        length = end - start + 1
+
+        if length > settings.UPLOAD_CHUNK_MAX_SIZE:
+            return Response(
+                {'detail': 'Chunk is too large'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        try:
+            session = UploadService.write_chunk(
+                session.pk, start, length, request.stream
+            )
+        except UploadError as e:
+            return Response(
+                {'detail': str(e), 'received': session.received},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        return Response(self.get_serializer(session).data)
+
+    @swagger_schema(lambda: dict(
+        operation_summary="Abort an upload",
+        operation_description="""
+## Endpoint Description
+Deletes the upload session and the bytes stored for it.
+
+## Path Parameters
+- pk: uuid, required (upload session ID)
+
+## Responses
+- **204 No Content**: Upload aborted
+- **403 Forbidden**: Session belongs to another user
+- **404 Not Found**: Session does not exist
+        """,
+        responses={
+            204: "Upload aborted",
+            403: "Forbidden",
+            404: "Not Found"
+        },
+        tags=["uploads"]
+    ))
+    def delete(self, request, *args, **kwargs):
+        return super().delete(request, *args, **kwargs)
+
+
+def upload_session_finalize_schema():
+    from drf_yasg.utils import no_body
+
+    return dict(
+        operation_summary="Finish a resumable upload",
+        operation_description="""
+## Endpoint Description
+Verifies that every byte has arrived and that the SHA-256 checksum matches, then creates the lecture or submission from the uploaded file. The session is removed afterwards.
+
+## Path Parameters
+- pk: uuid, required (upload session ID)
+
+## Request Body
+- None
+
+## Responses
+- **201 Created**: Returns the created lecture or submission and its `sha256`
+- **403 Forbidden**: User may no longer upload to this course
+- **404 Not Found**: Session does not exist
+- **409 Conflict**: Upload is incomplete, the checksum does not match, or the upload is already being finalized
+        """,
+        request_body=no_body,
+        responses={
+            201: "Lecture or submission created",
+            403: "Forbidden",
+            404: "Not Found",
+            409: "Conflict"
+        },
+        tags=["uploads"]
+    )
+
+
+class UploadSessionFinalizeView(generics.GenericAPIView):
+    queryset = UploadSession.objects.select_related('course', 'assignment')
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated, IsOwner]
+
+    @swagger_schema(upload_session_finalize_schema)
+    def post(self, request, *args, **kwargs):
+        session = self.get_object()
+        check_upload_access(request, session)
+
+        try:
+            instance, checksum = UploadService.finalize(session, request.user)
+        except UploadError as e:
+            return Response(
+                {'detail': str(e)},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        if session.kind == UploadSession.LECTURE:
+            data = LectureSerializer(instance).data
+        else:
+            data = SubmissionSerializer(instance).data
+
+        return Response(
+            {**data, 'sha256': checksum},
+            status=status.HTTP_201_CREATED
+        )
@@ -1,14 +1,15 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from api.docs import swagger_schema
 from api.serializers import UserRegistrationSerializer
 
 
-class UserRegistrationView(APIView):
-    @swagger_auto_schema(
+def user_registration_schema():
+    from drf_yasg import openapi
+
+    return dict(
         operation_summary="Register a new user",
         operation_description="""
 ## Endpoint Description
@@ -54,6 +55,10 @@ Creates a new user in the system.
         },
         tags=["users"]
     )
+
+
+class UserRegistrationView(APIView):
+    @swagger_schema(user_registration_schema)
     def post(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
 
@@ -11,7 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,27 +44,126 @@ INSTALLED_APPS = [
     'drf_yasg',
 ]
 
+# Opt-in: access tokens carry the user's role, email, name and access
+# version, so requests are authenticated without loading the User row.
+# Requires a cache shared by all workers (see CACHE_BACKEND below). The
+# access versions expire after JWT_ACCESS_VERSION_TIMEOUT seconds, which
+# must outlive the access tokens; a lost version only forces a refresh.
+JWT_ACCESS_CLAIMS = config('JWT_ACCESS_CLAIMS', default=False, cast=bool)
+JWT_ACCESS_VERSION_TIMEOUT = config(
+    'JWT_ACCESS_VERSION_TIMEOUT', default=7 * 24 * 3600, cast=int
+)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.ClaimsJWTAuthentication'
+        if JWT_ACCESS_CLAIMS else
+        'api.authentication.AsyncJWTAuthentication',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetPagination',
+    'PAGE_SIZE': config('API_PAGE_SIZE', default=50, cast=int),
+}
+
+API_MAX_PAGE_SIZE = config('API_MAX_PAGE_SIZE', default=500, cast=int)
+
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': (
+        'api.authentication.ClaimsTokenObtainPairSerializer'
+        if JWT_ACCESS_CLAIMS else
+        'rest_framework_simplejwt.serializers.TokenObtainPairSerializer'
+    ),
+    'TOKEN_REFRESH_SERIALIZER': (
+        'api.authentication.ClaimsTokenRefreshSerializer'
+        if JWT_ACCESS_CLAIMS else
+        'rest_framework_simplejwt.serializers.TokenRefreshSerializer'
     ),
 }
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Protected downloads hand the bytes to the web server when set to 'nginx'
+# (X-Accel-Redirect to MEDIA_SENDFILE_PREFIX) or 'apache' (X-Sendfile);
+# otherwise Django streams them with FileResponse.
+MEDIA_SENDFILE = config('MEDIA_SENDFILE', default='')
+MEDIA_SENDFILE_PREFIX = config(
+    'MEDIA_SENDFILE_PREFIX', default='/protected-media/'
+)
+
+# Resumable uploads: partial files live here until they are finalized or
+# expire after UPLOAD_SESSION_TTL seconds without a new chunk.
+UPLOAD_SESSION_ROOT = config(
+    'UPLOAD_SESSION_ROOT', default=str(MEDIA_ROOT / 'uploads')
+)
+UPLOAD_SESSION_TTL = config('UPLOAD_SESSION_TTL', default=86400, cast=int)
+UPLOAD_MAX_SIZE = config('UPLOAD_MAX_SIZE', default=5 * 1024 ** 3, cast=int)
+UPLOAD_CHUNK_MAX_SIZE = config(
+    'UPLOAD_CHUNK_MAX_SIZE', default=16 * 1024 ** 2, cast=int
+)
+
 MIDDLEWARE = [
+    'api.middleware.MetricsMiddleware',
+    'api.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.middleware.ReplicaMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Share of requests (0 to 1) that are profiled. Profiled responses carry a
+# Server-Timing header (db, perm, serialize, render, total) and an
+# X-Query-Count header, and are logged as JSON on the api.profiling logger.
+PROFILING_SAMPLE_RATE = config(
+    'PROFILING_SAMPLE_RATE', default=0.0, cast=float
+)
+
+# Prometheus metrics served to any client sending "Authorization: Bearer
+# <METRICS_TOKEN>", or to METRICS_ALLOWED_IPS. Behind a local proxy every
+# client looks like loopback, so loopback addresses and requests carrying
+# forwarding headers never pass the IP check. With several worker
+# processes, set METRICS_DIR to a directory shared by them: each worker
+# writes its counters there every METRICS_FLUSH_INTERVAL seconds and
+# /metrics adds them up.
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_DIR = config('METRICS_DIR', default='')
+METRICS_FLUSH_INTERVAL = config(
+    'METRICS_FLUSH_INTERVAL', default=5.0, cast=float
+)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+METRICS_ALLOWED_IPS = config(
+    'METRICS_ALLOWED_IPS', default='', cast=Csv()
+)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'api.profiling': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 ROOT_URLCONF = 'cms.urls'
 
+# Load the URL resolver and serializer fields when a worker starts (see
+# cms/wsgi.py), so the first request does not pay for it.
+WORKER_WARM_UP = config('WORKER_WARM_UP', default=True, cast=bool)
+
+# Route the hot read endpoints (course, lecture and assignment lists and
+# details) to async views that use the async ORM. Only worth enabling when
+# serving cms.asgi from an ASGI server such as uvicorn.
+ASYNC_READ_VIEWS = config('ASYNC_READ_VIEWS', default=False, cast=bool)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -86,6 +185,12 @@ WSGI_APPLICATION = 'cms.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# Connections are kept open for DB_CONN_MAX_AGE seconds and checked before
+# they are reused. DB_POOL=True (needs the project's `pool` extra) gives
+# each worker a pool of DB_POOL_MIN_SIZE to DB_POOL_MAX_SIZE connections
+# instead; a request waits up to DB_POOL_TIMEOUT seconds for a free one.
+
+DB_POOL = config('DB_POOL', default=False, cast=bool)
 
 DATABASES = {
     'default': {
@@ -94,9 +199,82 @@ DATABASES = {
         'USER': config('DB_USER'),
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST'),
+        'CONN_MAX_AGE': 0 if DB_POOL else config(
+            'DB_CONN_MAX_AGE', default=60, cast=int
+        ),
+        'CONN_HEALTH_CHECKS': config(
+            'DB_CONN_HEALTH_CHECKS', default=True, cast=bool
+        ),
+        'OPTIONS': {
+            'pool': {
+                'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+                'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+                'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+            },
+        } if DB_POOL else {},
+    }
+}
+
+# Read replicas
+# GET, HEAD and OPTIONS requests read from DB_REPLICAS (comma separated
+# `host` or `name@host` entries), taking turns between them. After a
+# successful request that wrote to the database, the user's reads stay on the
+# primary for DB_REPLICA_PIN_SECONDS, so they see their writes. Writes always
+# go to the primary. The pins live in the cache, which must be shared between
+# processes (check api.W002).
+
+DATABASE_REPLICAS = []
+
+for index, replica in enumerate(config('DB_REPLICAS', default='', cast=Csv())):
+    name, _, host = replica.rpartition('@')
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'NAME': name or DATABASES['default']['NAME'],
+        'HOST': host,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['api.routers.ReplicaRouter'] if DATABASE_REPLICAS else []
+
+DB_REPLICA_PIN_SECONDS = config(
+    'DB_REPLICA_PIN_SECONDS', default=5, cast=float
+)
+
+
+# OpenAPI schema
+# Generated once per code version (see `manage.py generate_schema`) and
+# stored under OPENAPI_SCHEMA_ROOT. CODE_VERSION, e.g. the deployed git
+# commit, names the version; by default it is a digest of the api and cms
+# package sources.
+
+OPENAPI_SCHEMA_ROOT = config(
+    'OPENAPI_SCHEMA_ROOT', default=str(BASE_DIR / 'openapi')
+)
+CODE_VERSION = config('CODE_VERSION', default='')
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': config(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': config('CACHE_LOCATION', default=''),
     }
 }
 
+ENROLLMENT_CACHE_TIMEOUT = config(
+    'ENROLLMENT_CACHE_TIMEOUT', default=300, cast=int
+)
+GRADEBOOK_CACHE_TIMEOUT = config(
+    'GRADEBOOK_CACHE_TIMEOUT', default=300, cast=int
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -134,6 +312,23 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Lecture and submission files go through the 'uploads' storage, which
+# stores each unique file once under blobs/ keyed by its sha256 digest.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    'uploads': {
+        'BACKEND': config(
+            'UPLOAD_STORAGE_BACKEND',
+            default='api.storage.ContentAddressedStorage'
+        ),
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -16,28 +16,17 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include, re_path
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from django.http import JsonResponse
 
+from api.docs import schema_view
+from api.views.metrics import metrics_view
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="CMS API",
-        default_version='v1',
-        description="API documentation for CMS project",
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/', include('api.urls')),
+    path('metrics', metrics_view, name='metrics'),
 
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('api/v1/swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('api/v1/redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view(), name='schema-json'),
+    path('api/v1/swagger/', schema_view('swagger'), name='schema-swagger-ui'),
+    path('api/v1/redoc/', schema_view('redoc'), name='schema-redoc'),
 ]
-